@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
@@ -13,6 +14,26 @@ class Config:
     ALLOWED_EXTENSIONS = {'csv', 'json'}
     MAX_CONTENT_LENGTH = 1024 * 1024 * 100  # 100MB
     LLM_API_KEY = os.getenv('LLM_API_KEY')  # For column inference
+    NORMALIZED_VALUE_CACHE_SIZE = int(os.getenv('NORMALIZED_VALUE_CACHE_SIZE', 500_000))  # Distinct values
+    COLUMN_CACHE_MAX_BYTES = int(os.getenv('COLUMN_CACHE_MAX_BYTES', 512 * 1024 * 1024))  # 512MB
+    MATCHER_MAX_WORKERS = int(os.getenv('MATCHER_MAX_WORKERS', 4))  # Shared matcher pool threads
+    MATCHER_QUEUE_SIZE = int(os.getenv('MATCHER_QUEUE_SIZE', 64))  # Pending column pairs across requests
+    # Entity grouping of matched columns: "cluster" splits oversized or sparse groups,
+    # "components" keeps every connected group of matches whole
+    ENTITY_GROUPING = os.getenv('ENTITY_GROUPING', 'cluster')
+    LLM_REVIEW_CACHE_TTL_DAYS = int(os.getenv('LLM_REVIEW_CACHE_TTL_DAYS', 30))
+    LLM_REVIEW_CACHE_MAX_ENTRIES = int(os.getenv('LLM_REVIEW_CACHE_MAX_ENTRIES', 2_000))
+    LLM_REVIEW_CACHE_MAX_BYTES = int(os.getenv('LLM_REVIEW_CACHE_MAX_BYTES', 64 * 1024 * 1024))  # 64MB
+    # Databases /load-data may write to, as {"target id": "postgresql://..."}; clients pick one by id
+    LOAD_TARGETS = json.loads(os.getenv('LOAD_TARGETS', '{}'))
+    LOAD_MAX_WORKERS = int(os.getenv('LOAD_MAX_WORKERS', 8))  # Upper bound on parallel connections per load
+    LOAD_MAX_CHUNK_ROWS = int(os.getenv('LOAD_MAX_CHUNK_ROWS', 500_000))  # Upper bound on rows held per chunk
+    LLM_BASE_URL = os.getenv('LLM_BASE_URL')  # OpenAI-compatible endpoint, e.g. the bundled mock server; unset for OpenAI
+    LLM_TIMEOUT_SECONDS = float(os.getenv('LLM_TIMEOUT_SECONDS', 120))  # Per attempt
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 4))  # In-flight completions across all requests
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', 4))  # On 429, 5xx, timeouts and dropped connections
+    LLM_BACKOFF_SECONDS = float(os.getenv('LLM_BACKOFF_SECONDS', 1.0))  # First retry delay, doubled per attempt
+    LLM_BACKOFF_MAX_SECONDS = float(os.getenv('LLM_BACKOFF_MAX_SECONDS', 30.0))
 
 class RelationshipConfig:
     def __init__(self):
@@ -5,6 +5,8 @@ from backend.routes import auth
 from backend.db import Base, engine, get_db
 from backend.models.user import User
 from backend.utils.auth import hash_password
+from backend.services.worker_pool import get_matcher_pool, shutdown_matcher_pool
+from backend.services.llm_client import close_llm_clients
 from sqlalchemy.orm import Session
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
@@ -27,8 +29,14 @@ async def lifespan(app: FastAPI):
         db.add(user)
         db.commit()
 
+    # 🧵 Shared pool for fuzzy column matching, sized by MATCHER_MAX_WORKERS
+    get_matcher_pool()
+
     yield  # App runs here
 
+    shutdown_matcher_pool()
+    await close_llm_clients()
+
 app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
@@ -34,6 +34,21 @@ class UserUpload(Base):
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     file_type = Column(String, nullable=True)  # 'csv', 'json', etc.
 
+
+class LLMReviewCache(Base):
+    __tablename__ = "llm_review_cache"
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False, index=True, unique=True)  # sha256 of SQL, dialect, model, prompt
+    dialect = Column(String(32), nullable=False)
+    model = Column(String(64), nullable=False)
+    prompt_version = Column(String(16), nullable=False)
+    response = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_hit_at = Column(DateTime, nullable=True)
+    hit_count = Column(Integer, default=0)
+
 class SchemaSavePayload(BaseModel):
     session_id: str
     parent_session_id: Optional[str] = None
@@ -76,6 +91,11 @@ class RelationshipCandidate(BaseModel):
     match_type: str  # "exact", "fuzzy", "inferred"
     reason: str  # Explanation of match
 
+class LoadRequest(BaseModel):
+    target_id: str  # Key of Config.LOAD_TARGETS to load into
+    max_workers: int = 4
+    chunk_rows: int = 100_000
+
 class SchemaUpdateRequest(BaseModel):
     name: Optional[str] = None
     tags: Optional[List[str]] = None
\ No newline at end of file
@@ -8,6 +8,9 @@ from .export import router as export_router
 from .delete_account import router as delete_all_schemas
 from .file_upload import router as file_upload_router
 from .account_summary import router as acc_summary
+from .materialize import router as materialize_router
+from .load import router as load_router
+from .ddl_utils import router as ddl_utils_router
 
 router = APIRouter()
 router.include_router(login)
@@ -17,4 +20,7 @@ router.include_router(ai_router)
 router.include_router(delete_all_schemas)
 router.include_router(file_upload_router)
 router.include_router(ai_schemas)
-router.include_router(acc_summary)
\ No newline at end of file
+router.include_router(acc_summary)
+router.include_router(materialize_router)
+router.include_router(load_router)
+router.include_router(ddl_utils_router)
\ No newline at end of file
@@ -1,12 +1,21 @@
-import re
+import json
+import logging
 from fastapi import APIRouter, Request, HTTPException, Depends
-from backend.db import get_db
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from backend.db import SessionLocal, get_db
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.orm import Session
-from backend.services.llm_schema_reviewer import review_schema_with_llm
+from backend.services.llm_cache import cache_metadata
+from backend.services.llm_schema_reviewer import (
+    ReviewSectionParser, build_review_prompt, lookup_review, parse_review_sections,
+    review_schema_cached, save_review, stream_review
+)
 from backend.dependencies.auth import get_current_user
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter() # register router
 
 class SQLInput(BaseModel):
@@ -27,17 +36,15 @@ async def fix_with_ai(
         raise HTTPException(status_code=400, detail="Missing SQL input")     
     
     try:
-        llm_response = review_schema_with_llm(raw_sql, sql_dialect, db=db, user=user)
-
-        cleaned_sql_match = re.search(r"--BEGIN CLEANED SQL--(.*?)--END CLEANED SQL--", llm_response, re.DOTALL)
-        mermaid_text_match = re.search(r"--BEGIN MERMAID--(.*?)--END MERMAID--", llm_response, re.DOTALL)
-
-        cleaned_sql_text = cleaned_sql_match.group(1).strip() if cleaned_sql_match else raw_sql
-        mermaid_text_str = mermaid_text_match.group(1).strip() if mermaid_text_match else ""
+        # Cached by canonical SQL, dialect, model and prompt version. The OpenAI
+        # client is synchronous, so it runs off the event loop
+        llm_response, cache = await run_in_threadpool(review_schema_cached, raw_sql, sql_dialect, db)
+        cleaned_sql_text, mermaid_text_str = parse_review_sections(llm_response, raw_sql)
 
         return {
             "sql": cleaned_sql_text,
-            "mermaid": mermaid_text_str
+            "mermaid": mermaid_text_str,
+            "cache": cache
             }
 
     except Exception as e:
@@ -46,3 +53,72 @@ async def fix_with_ai(
             "error": "GenAI cleanup failed",
             "sql": raw_sql
         }
+
+
+def _sse(event: str, data) -> str:
+    # JSON-encoded so multi-line SQL stays inside one data field
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/fix-with-ai/stream") # Streamed AI cleaning, as Server-Sent Events
+async def fix_with_ai_stream(
+    payload: SQLInput,
+    request: Request,
+    user=Depends(get_current_user)
+):
+    """
+    Same review as /fix-with-ai, sent while it is generated: "sql" and
+    "mermaid" events carry text appended to each section, then one "done"
+    event carries the final {sql, mermaid, cache}. Failures send "error"
+    followed by "done" with the original SQL.
+    """
+    raw_sql = payload.sql
+    sql_dialect = payload.dialect
+
+    if not raw_sql:
+        raise HTTPException(status_code=400, detail="Missing SQL input")
+
+    async def events():
+        # The body is sent after yield-dependency teardown, so a get_db session
+        # would already be closed here; the stream owns its own
+        db = SessionLocal()
+        try:
+            async for event in review_events(db):
+                yield event
+        finally:
+            db.close()
+
+    async def review_events(db: Session):
+        key, entry = await run_in_threadpool(lookup_review, raw_sql, sql_dialect, db)
+        parser = ReviewSectionParser()
+
+        if entry is not None:
+            llm_response, cache = entry.response, cache_metadata(entry, key, hit=True)
+            for section, text in parser.feed(llm_response) + parser.close():
+                yield _sse(section, text)
+        else:
+            chunks = []
+            try:
+                async for delta in stream_review(build_review_prompt(raw_sql, sql_dialect)):
+                    chunks.append(delta)
+                    for section, text in parser.feed(delta):
+                        yield _sse(section, text)
+                for section, text in parser.close():
+                    yield _sse(section, text)
+            except Exception as e:
+                logger.warning("Streamed schema review failed: %s", e)
+                yield _sse("error", "GenAI cleanup failed")
+                yield _sse("done", {"sql": raw_sql, "mermaid": "", "cache": cache_metadata(None, key, hit=False)})
+                return
+            llm_response = "".join(chunks).strip()
+            cache = await run_in_threadpool(save_review, db, key, sql_dialect, llm_response)
+
+        cleaned_sql_text, mermaid_text_str = parse_review_sections(llm_response, raw_sql)
+        yield _sse("done", {"sql": cleaned_sql_text, "mermaid": mermaid_text_str, "cache": cache})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Tell nginx to pass events through instead of buffering the response
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,46 +1,95 @@
-from fastapi import APIRouter, Request
-from backend.utils.schema_loader import load_schema
-from backend.services.sql_generator import SQLGenerator, generate_mermaid
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from typing import Optional
+from sqlalchemy.orm import Session
+from backend.db import get_db
+from backend.dependencies.auth import get_current_user
+from backend.models.schema_models import SchemaHistory
+from backend.services.ddl_emitters import render_ddl, render_stored_ddl, resolve_dialect
+from backend.services.schema_diff import diff_schemas, render_migration
+from backend.services.sql_generator import stored_schema_ir
 
 router = APIRouter()
 
+
+class RegenerateRequest(BaseModel):
+    session_id: str
+    dialect: Optional[str] = "postgres"
+
+
+def _owned_schema(db: Session, session_id: str, username: str) -> SchemaHistory:
+    schema = db.query(SchemaHistory).filter(
+        SchemaHistory.session_id == session_id,
+        SchemaHistory.username == username
+    ).first()
+    if not schema:
+        raise HTTPException(status_code=404, detail="Schema not found")
+    return schema
+
+
 @router.post("/regenerate-sql")
-async def regenerate_sql(req: Request):
+def regenerate_sql(
+    payload: RegenerateRequest,
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Re-render a saved schema for another SQL dialect from its stored IR.
+    Deterministic and memoized, so no LLM call is involved.
+    """
     try:
-        data = await req.json()
-        session_id = data["session_id"]
-        dialect = data.get("dialect", "postgres")
-
-        loaded_schema = load_schema(session_id)
-
-        normalized_schema = {
-            table: {
-                col: {
-                    "type": col_meta.detected_type,
-                    "nullable": col_meta.null_percent > 0.0,
-                    "canonical_name": getattr(col_meta, "canonical_name", None)
-                }
-                for col, col_meta in profile.columns.items()
-            }
-            for table, profile in loaded_schema.items()
-        }
-
-        keys = {
-            "primary_keys": {
-                table: [{"column": col.name, "selected": True}]
-                for table, col in loaded_schema.items()
-                if col.columns
-            },
-            "foreign_keys": []  # 💡 You can add FK support later if needed
-        }
-
-        sql = SQLGenerator().generate_ddl(normalized_schema, keys, dialect)
-        mermaid = generate_mermaid(normalized_schema, keys)
-
-        return {
-            "sql": sql,
-            "mermaid": mermaid
-        }
-
-    except Exception as e:
-        return {"error": str(e)}
+        dialect = resolve_dialect(payload.dialect)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    schema = _owned_schema(db, payload.session_id, user.username)
+
+    ir_data = (schema.source_schema or {}).get("ir")
+    if ir_data:
+        sql = render_stored_ddl(ir_data, dialect)
+    elif schema.sql_output:
+        sql = render_ddl(stored_schema_ir(schema), dialect)
+    else:
+        raise HTTPException(status_code=404, detail="Schema has no SQL to regenerate")
+
+    return {
+        "sql": sql,
+        "mermaid": schema.mermaid_output,
+        "dialect": dialect
+    }
+
+
+@router.get("/schema-diff/{session_id}")
+def schema_diff(
+    session_id: str,
+    base: Optional[str] = None,
+    dialect: Optional[str] = "postgres",
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Migration from one saved version to another: only the statements needed
+    to turn `base` (default: the version's parent) into this version.
+    """
+    try:
+        dialect = resolve_dialect(dialect)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    target = _owned_schema(db, session_id, user.username)
+    base_id = base or target.parent_session_id
+    if not base_id:
+        raise HTTPException(status_code=400, detail="No base version given and this version has no parent")
+    source = _owned_schema(db, base_id, user.username)
+
+    old_ir, new_ir = stored_schema_ir(source), stored_schema_ir(target)
+    diff = diff_schemas(old_ir, new_ir)
+    return {
+        "base": base_id,
+        "target": session_id,
+        "dialect": dialect,
+        "changes": diff.summary(),
+        "sql": render_migration(diff, dialect),
+        "base_digest": old_ir.digest,
+        "target_digest": new_ir.digest,
+    }
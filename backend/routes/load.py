@@ -0,0 +1,95 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from backend.db import get_db
+from backend.dependencies.auth import get_current_user
+from backend.models.schema_models import LoadRequest, SchemaHistory
+from backend.config import Config
+from backend.services.bulk_loader import BulkLoader, load_target_url
+from backend.services.ddl_emitters import render_ddl
+from backend.services.materializer import surrogate_key_columns
+from backend.services.schema_runner import sanitize_table_name
+from backend.services.sql_generator import stored_schema_ir
+from backend.utils.username_sanitizer import sanitize_username
+
+router = APIRouter()
+
+
+def _source_files(schema: SchemaHistory, username: str) -> dict:
+    """Map each table of a session to the file holding its rows"""
+    user_dir = os.path.join("uploads", sanitize_username(username))
+
+    if (schema.source_schema or {}).get("decomposition"):
+        # Decomposed flat files load from their materialized entity tables
+        materialized = os.path.join(user_dir, "materialized", schema.session_id)
+        sources = {}
+        if os.path.isdir(materialized):
+            for filename in os.listdir(materialized):
+                table, ext = os.path.splitext(filename)
+                if ext in (".parquet", ".csv"):
+                    sources[table] = os.path.join(materialized, filename)
+        if not sources:
+            raise HTTPException(status_code=400, detail="Materialize this schema before loading it.")
+        return sources
+
+    return {
+        sanitize_table_name(filename): os.path.join(user_dir, filename)
+        for filename in (schema.uploaded_files or [])
+        if os.path.exists(os.path.join(user_dir, filename))
+    }
+
+
+@router.get("/load-targets")
+def load_targets(user=Depends(get_current_user)):
+    """Ids of the databases /load-data can write to; their URLs stay on the server"""
+    return {"targets": sorted(Config.LOAD_TARGETS)}
+
+
+@router.post("/load-data/{session_id}")
+def load_data(
+    session_id: str,
+    payload: LoadRequest,
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Creates the session's tables in the configured target database and
+    bulk-loads the uploaded data, returning per-table row counts and throughput.
+    """
+    schema = db.query(SchemaHistory).filter(
+        SchemaHistory.session_id == session_id,
+        SchemaHistory.username == user.username
+    ).first()
+    if not schema or not schema.sql_output:
+        raise HTTPException(status_code=404, detail="Schema not found")
+
+    try:
+        target_url = load_target_url(payload.target_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    sources = _source_files(schema, user.username)
+    schema_ir = stored_schema_ir(schema)
+    layout = (schema.source_schema or {}).get("decomposition")
+    if layout and any(
+        schema_ir.table(entity) is None or schema_ir.table(entity).column(key_column) is None
+        for entity, key_column in surrogate_key_columns(layout).items()
+    ):
+        # Older decomposed sessions lack the surrogate keys linking entities to the base table
+        raise HTTPException(status_code=409, detail="Re-run inference on this file before loading it.")
+    # The stored script is generic DDL; targets are PostgreSQL, so render for it
+    ddl = render_ddl(schema_ir, "postgres")
+    # Client-supplied, so bounded by the server's limits
+    loader = BulkLoader(
+        target_url,
+        max_workers=min(max(payload.max_workers, 1), Config.LOAD_MAX_WORKERS),
+        chunk_rows=min(max(payload.chunk_rows, 1), Config.LOAD_MAX_CHUNK_ROWS),
+    )
+    try:
+        return loader.load(ddl, sources)
+    except RuntimeError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    finally:
+        loader.close()
@@ -0,0 +1,46 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from backend.db import get_db
+from backend.dependencies.auth import get_current_user
+from backend.models.schema_models import SchemaHistory
+from backend.services.materializer import materialize_decomposition
+from backend.utils.username_sanitizer import sanitize_username
+
+router = APIRouter()
+
+
+@router.post("/materialize/{session_id}")
+def materialize_schema(
+    session_id: str,
+    format: str = "parquet",
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Writes the normalized entity and base tables of a decomposed flat file
+    and returns the row count of each table.
+    """
+    schema = db.query(SchemaHistory).filter(
+        SchemaHistory.session_id == session_id,
+        SchemaHistory.username == user.username
+    ).first()
+    if not schema:
+        raise HTTPException(status_code=404, detail="Schema not found")
+
+    layout = (schema.source_schema or {}).get("decomposition")
+    if not layout:
+        raise HTTPException(status_code=400, detail="This schema was not decomposed from a flat file.")
+    if format not in ("parquet", "csv"):
+        raise HTTPException(status_code=400, detail="Format must be 'parquet' or 'csv'.")
+    if not os.path.exists(layout["file_path"]):
+        raise HTTPException(status_code=410, detail="The source upload is no longer available.")
+
+    output_dir = os.path.join("uploads", sanitize_username(user.username), "materialized", session_id)
+    tables = materialize_decomposition(layout, output_dir, fmt=format)
+
+    return {
+        "session_id": session_id,
+        "format": format,
+        "tables": tables
+    }
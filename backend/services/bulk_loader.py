@@ -0,0 +1,333 @@
+# backend/services/bulk_loader.py
+import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+import sqlparse
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from backend.config import Config
+from backend.services.ddl_parser import IDENT, WORD, parse_ddl, tokenize
+from backend.services.materializer import read_source_chunks
+
+logger = logging.getLogger(__name__)
+
+def load_target_url(target_id: str) -> str:
+    """
+    URL of a configured load target. Targets come only from LOAD_TARGETS and
+    must be PostgreSQL, so clients cannot point the server at arbitrary
+    hosts or at files on its disk.
+    """
+    url = Config.LOAD_TARGETS.get(target_id)
+    if url is None:
+        raise KeyError(f"Unknown load target: {target_id}")
+    if make_url(url).get_backend_name() != "postgresql":
+        raise ValueError(f"Load target {target_id} is not a PostgreSQL database")
+    return url
+
+
+@dataclass
+class TableLoad:
+    """Progress of one table; rows and bytes grow while the load runs"""
+    table: str
+    source: str
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "table": self.table,
+            "source": self.source,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "error": self.error,
+        }
+
+
+@dataclass
+class DDLPlan:
+    """CREATE TABLE statements, their column lists, and FK statements with their dependencies"""
+    creates: Dict[str, str] = field(default_factory=dict)
+    columns: Dict[str, List[str]] = field(default_factory=dict)
+    foreign_keys: List[Tuple[str, str, str]] = field(default_factory=list)  # (table, referenced table, statement)
+    # Table and column names as the database stores them: unquoted names fold to lower case
+    sql_names: Dict[str, Tuple[str, List[str]]] = field(default_factory=dict)
+
+
+def plan_ddl(ddl: str) -> DDLPlan:
+    """
+    Split a DDL script rendered by ddl_emitters into tables and FK
+    constraints. Statements run as written, comments included; only the
+    tokenizer reads them, so "--" inside a literal is left alone.
+    """
+    plan = DDLPlan()
+    for statement in sqlparse.split(ddl):
+        statements = tokenize(statement)
+        if not statements:
+            continue  # comments only
+        words = [t.upper for t in statements[0][:2] if t.kind == WORD]
+        text = statement.strip()
+        text = text[:-1].rstrip() if text.endswith(";") else text
+        schema, keys = parse_ddl(statement)
+
+        if words == ["CREATE", "TABLE"] and schema:
+            table, columns = next(iter(schema.items()))
+            quoted = {t.text for t in statements[0] if t.kind == IDENT}
+            plan.creates[table] = text
+            plan.columns[table] = list(columns)
+            plan.sql_names[table] = (
+                table if table in quoted else table.lower(),
+                [c if c in quoted else c.lower() for c in columns],
+            )
+        elif words == ["ALTER", "TABLE"]:
+            for fk in keys["foreign_keys"][:1]:
+                plan.foreign_keys.append((fk["source_table"], fk["target_table"], text))
+    return plan
+
+
+def load_order(plan: DDLPlan) -> Tuple[List[List[str]], List[str]]:
+    """
+    Topological levels of tables: every table loads after the tables it
+    references, and tables within a level are independent of each other.
+    Returns (levels, FK statements to apply after loading). FKs inside a
+    reference cycle cannot be satisfied row by row, so they are deferred.
+    """
+    depends = {table: set() for table in plan.creates}
+    for table, target, _ in plan.foreign_keys:
+        if table in depends and target in depends and target != table:
+            depends[table].add(target)
+
+    levels, done = [], set()
+    remaining = dict(depends)
+    while remaining:
+        ready = sorted(t for t, deps in remaining.items() if deps <= done)
+        if not ready:
+            break
+        levels.append(ready)
+        done.update(ready)
+        for table in ready:
+            del remaining[table]
+
+    deferred = [
+        statement for table, target, statement in plan.foreign_keys
+        if table in remaining or table == target
+    ]
+    if remaining:
+        levels.append(sorted(remaining))
+    return levels, deferred
+
+
+class _CSVStream(io.RawIOBase):
+    """File-like view over a generator of CSV text chunks, for COPY FROM STDIN"""
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            data = self._buffer[self._offset:] + b"".join(self._chunks)
+            self._buffer, self._offset = b"", 0
+            return data
+        # Serve from the current chunk by offset; re-slicing the buffer on every
+        # 8 KB read would copy each chunk quadratically
+        while self._offset >= len(self._buffer):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._buffer, self._offset = chunk, 0
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += len(data)
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+
+class BulkLoader:
+    """
+    Creates the tables of a generated DDL script in a target database and
+    streams source files into them.
+
+    On PostgreSQL each table is sent as one CSV `COPY ... FROM STDIN`; other
+    databases (e.g. a file-backed SQLite stand-in for tests) get batched
+    executemany inserts through the same code path. Tables are loaded level by level in
+    FK order, with the tables of a level running on parallel connections.
+    """
+    def __init__(self,
+                 target_url: str,
+                 max_workers: int = 4,
+                 chunk_rows: int = 100_000,
+                 on_progress: Optional[Callable[[TableLoad], None]] = None):
+        self.engine = create_engine(target_url)
+        self.is_postgres = self.engine.dialect.name == "postgresql"
+        # SQLite serializes writers, so parallel connections would only contend for the lock
+        self.max_workers = max_workers if self.is_postgres else 1
+        self.chunk_rows = chunk_rows
+        self.on_progress = on_progress
+        self._progress_lock = threading.Lock()
+
+    def load(self, ddl: str, sources: Dict[str, str]) -> Dict:
+        """
+        Args:
+            ddl: Script rendered by ddl_emitters for the target's dialect
+            sources: {table name: path to CSV, JSON or Parquet file with its rows}
+
+        Returns:
+            Per-table rows, bytes and throughput, plus the load order used.
+        """
+        plan = plan_ddl(ddl)
+        levels, deferred = load_order(plan)
+        deferred_set = set(deferred)
+        started = time.perf_counter()
+
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            for statement in plan.creates.values():
+                cursor.execute(statement)
+            connection.commit()
+        finally:
+            connection.close()
+        skipped = self._apply_foreign_keys(
+            [statement for _, _, statement in plan.foreign_keys if statement not in deferred_set]
+        )
+
+        loads = {
+            table: TableLoad(table=table, source=sources[table])
+            for level in levels for table in level if table in sources
+        }
+        for table in plan.creates:
+            if table not in sources:
+                logger.warning("No source file for table %s; it was created empty", table)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="loader") as executor:
+            for level in levels:
+                batch = [loads[table] for table in level if table in loads]
+                failures = [
+                    load for load in executor.map(
+                        lambda l: self._load_table(l, plan.columns[l.table], plan.sql_names[l.table]), batch
+                    )
+                    if load.error
+                ]
+                if failures:
+                    # Dependent tables would only fail their FK checks
+                    raise RuntimeError("; ".join(f"{f.table}: {f.error}" for f in failures))
+
+        skipped += self._apply_foreign_keys(deferred)
+
+        elapsed = time.perf_counter() - started
+        total_rows = sum(load.rows for load in loads.values())
+        logger.info("Loaded %d rows into %d tables in %.2fs (%.0f rows/s)",
+                    total_rows, len(loads), elapsed, total_rows / elapsed if elapsed else 0.0)
+        return {
+            "levels": levels,
+            "deferred_foreign_keys": deferred,
+            "skipped_foreign_keys": skipped,
+            "tables": [loads[t].as_dict() for level in levels for t in level if t in loads],
+            "rows": total_rows,
+            "seconds": round(elapsed, 3),
+        }
+
+    def close(self) -> None:
+        self.engine.dispose()
+
+    def _apply_foreign_keys(self, statements: List[str]) -> List[Dict]:
+        """
+        Apply FK statements one transaction each, so a constraint the data or
+        the target cannot satisfy is reported instead of aborting the load.
+        """
+        if not self.is_postgres:
+            # SQLite cannot add constraints to an existing table
+            return [{"statement": s, "error": "not supported by target"} for s in statements]
+
+        skipped = []
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                    connection.commit()
+                except Exception as e:
+                    connection.rollback()
+                    logger.warning("Skipped constraint %r: %s", statement, e)
+                    skipped.append({"statement": statement, "error": str(e)})
+        finally:
+            connection.close()
+        return skipped
+
+    def _chunks(self, load: TableLoad, columns: List[str]) -> Iterator[pd.DataFrame]:
+        started = time.perf_counter()
+        for chunk in read_source_chunks(load.source, columns, self.chunk_rows):
+            yield chunk
+            with self._progress_lock:
+                load.rows += len(chunk)
+                load.seconds = time.perf_counter() - started
+            if self.on_progress:
+                self.on_progress(load)
+            logger.info("%s: %d rows (%.0f rows/s)", load.table, load.rows, load.rows_per_second)
+
+    def _target(self, sql_names: Tuple[str, List[str]]) -> Tuple[str, str]:
+        """Quoted table name and column list; names come from CSV headers, so never interpolate them raw"""
+        quote = self.engine.dialect.identifier_preparer.quote
+        table, columns = sql_names
+        return quote(table), ", ".join(quote(c) for c in columns)
+
+    def _load_table(self, load: TableLoad, columns: List[str], sql_names: Tuple[str, List[str]]) -> TableLoad:
+        started = time.perf_counter()
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            if self.is_postgres:
+                self._copy(cursor, load, columns, sql_names)
+            else:
+                self._insert(cursor, load, columns, sql_names)
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            load.error = str(e)
+            logger.error("Loading %s failed: %s", load.table, e)
+        finally:
+            connection.close()
+            load.seconds = time.perf_counter() - started
+        return load
+
+    def _copy(self, cursor, load: TableLoad, columns: List[str], sql_names: Tuple[str, List[str]]) -> None:
+        def encoded():
+            for chunk in self._chunks(load, columns):
+                data = chunk.to_csv(index=False, header=False, na_rep="").encode("utf-8")
+                load.bytes += len(data)
+                yield data
+
+        table, column_list = self._target(sql_names)
+        cursor.copy_expert(
+            f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '')",
+            _CSVStream(encoded())
+        )
+
+    def _insert(self, cursor, load: TableLoad, columns: List[str], sql_names: Tuple[str, List[str]]) -> None:
+        marker = "?" if self.engine.dialect.dbapi.paramstyle == "qmark" else "%s"
+        table, column_list = self._target(sql_names)
+        statement = (
+            f"INSERT INTO {table} ({column_list}) "
+            f"VALUES ({', '.join([marker] * len(columns))})"
+        )
+        for chunk in self._chunks(load, columns):
+            rows = chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+            cursor.executemany(statement, rows)
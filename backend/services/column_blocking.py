@@ -0,0 +1,177 @@
+# backend/services/column_blocking.py
+from dataclasses import dataclass
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+# Value length buckets used by the length histogram: [0-2], [3-5], [6-10], [11-20], [21-40], [41+]
+LENGTH_BINS = np.array([3, 6, 11, 21, 41])
+
+TEXT_TYPES = {'VARCHAR', 'TEXT', 'CHAR'}
+INTEGER_TYPES = {'SMALLINT', 'INT', 'INTEGER', 'BIGINT'}
+DECIMAL_TYPES = {'NUMERIC', 'DECIMAL', 'FLOAT', 'REAL', 'DOUBLE'}
+
+
+@dataclass
+class ColumnSignature:
+    """Cheap, fixed-size summary of a column used for candidate-pair blocking"""
+    table: str
+    column: str
+    type_family: str
+    minhash: np.ndarray      # uint64[num_perm], MinHash of value q-gram shingles
+    length_hist: np.ndarray  # normalized histogram over LENGTH_BINS
+    char_hist: np.ndarray    # normalized share of alpha / digit / other characters
+
+
+def type_family(detected_type: str) -> str:
+    """Collapse detected SQL types into the families that can be compared"""
+    base = detected_type.split('(')[0].upper()
+    if base in TEXT_TYPES:
+        return 'text'
+    # Integer widths and exact / approximate decimals come from the same data
+    if base in INTEGER_TYPES:
+        return 'int'
+    if base in DECIMAL_TYPES:
+        return 'float'
+    return base.lower()
+
+
+class ColumnBlocker:
+    """
+    MinHash + LSH blocking over column signatures.
+
+    Only column pairs that collide in at least one LSH band and have compatible
+    type, length and character-class profiles are emitted as candidates for
+    value-level fuzzy matching.
+    """
+    def __init__(self,
+                 num_perm: int = 64,
+                 bands: int = 32,
+                 shingle_size: int = 3,
+                 max_values: int = 2000,
+                 min_profile_similarity: float = 0.3,
+                 seed: int = 42):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_values = max_values
+        self.min_profile_similarity = min_profile_similarity
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        # Odd multipliers give a bijective multiply-add hash family over uint64
+        self._hash_a = rng.integers(1, 2**63 - 1, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._hash_b = rng.integers(0, 2**63 - 1, size=num_perm, dtype=np.uint64)
+
+    @property
+    def params(self) -> Tuple[int, int, int, int]:
+        """Settings that change the profile of a column, for use in cache keys"""
+        return (self.num_perm, self.shingle_size, self.max_values, self.seed)
+
+    def profile(self, normalized: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Content-dependent part of a signature: (minhash, length_hist, char_hist)"""
+        values = pd.unique(normalized.dropna().to_numpy())[:self.max_values]
+        values = [v for v in values if v]
+        return (
+            self._minhash(values),
+            self._length_histogram(values),
+            self._char_histogram(values),
+        )
+
+    def signature(self,
+                  table: str,
+                  column: str,
+                  detected_type: str,
+                  normalized: pd.Series) -> ColumnSignature:
+        """Build the signature of an already normalized column"""
+        return ColumnSignature(table, column, type_family(detected_type), *self.profile(normalized))
+
+    def candidate_pairs(self, signatures: Sequence[ColumnSignature]) -> List[Tuple[int, int]]:
+        """
+        Return index pairs (i, j), i < j, of signatures from different tables that
+        should be compared at value level, in table-pair then column order.
+        """
+        buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        for idx, sig in enumerate(signatures):
+            for band in range(self.bands):
+                start = band * self.rows_per_band
+                key = (band, sig.minhash[start:start + self.rows_per_band].tobytes())
+                buckets[key].append(idx)
+
+        colliding = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if signatures[i].table != signatures[j].table:
+                        colliding.add((i, j) if i < j else (j, i))
+
+        table_order = {}
+        for sig in signatures:
+            table_order.setdefault(sig.table, len(table_order))
+
+        pairs = [
+            (i, j) for i, j in colliding
+            if self._profiles_compatible(signatures[i], signatures[j])
+        ]
+        pairs.sort(key=lambda p: (
+            table_order[signatures[p[0]].table],
+            table_order[signatures[p[1]].table],
+            p
+        ))
+        return pairs
+
+    def _profiles_compatible(self, a: ColumnSignature, b: ColumnSignature) -> bool:
+        if a.type_family != b.type_family:
+            return False
+        length_overlap = float(np.minimum(a.length_hist, b.length_hist).sum())
+        char_overlap = float(np.minimum(a.char_hist, b.char_hist).sum())
+        return min(length_overlap, char_overlap) >= self.min_profile_similarity
+
+    def _shingles(self, values: List[str]) -> np.ndarray:
+        q = self.shingle_size
+        shingles = set()
+        for value in values:
+            if len(value) <= q:
+                shingles.add(value)
+            else:
+                shingles.update(value[i:i + q] for i in range(len(value) - q + 1))
+        return np.array(list(shingles), dtype=object)
+
+    def _minhash(self, values: List[str]) -> np.ndarray:
+        shingles = self._shingles(values)
+        if not len(shingles):
+            # Empty columns get a signature that never collides with a real one
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+
+        hashed = pd.util.hash_array(shingles)
+        with np.errstate(over='ignore'):
+            permuted = self._hash_a[:, None] * hashed[None, :] + self._hash_b[:, None]
+        return permuted.min(axis=1)
+
+    def _length_histogram(self, values: List[str]) -> np.ndarray:
+        if not values:
+            return np.zeros(len(LENGTH_BINS) + 1)
+        lengths = np.fromiter((len(v) for v in values), dtype=np.int64, count=len(values))
+        counts = np.bincount(np.searchsorted(LENGTH_BINS, lengths, side='right'), minlength=len(LENGTH_BINS) + 1)
+        return counts / counts.sum()
+
+    def _char_histogram(self, values: List[str]) -> np.ndarray:
+        alpha = digit = other = 0
+        for value in values:
+            for ch in value:
+                if ch.isalpha():
+                    alpha += 1
+                elif ch.isdigit():
+                    digit += 1
+                else:
+                    other += 1
+        total = alpha + digit + other
+        if not total:
+            return np.zeros(3)
+        return np.array([alpha, digit, other]) / total
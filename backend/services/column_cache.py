@@ -0,0 +1,147 @@
+# backend/services/column_cache.py
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+import numpy as np
+import pandas as pd
+from backend.config import Config
+
+
+def content_hash(data: pd.Series) -> str:
+    """Stable digest of a column's values and index, used as its cache identity"""
+    hashed = pd.util.hash_pandas_object(data, index=True).to_numpy()
+    return hashlib.blake2b(hashed.tobytes(), digest_size=16).hexdigest()
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Approximate resident size of a cached artifact"""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=True, deep=True)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class FrequencySketch:
+    """Count-min sketch with periodic halving, used as the TinyLFU admission filter"""
+    def __init__(self, width: int = 4096, depth: int = 4, sample_size: int = 40960):
+        self.width = width
+        self.depth = depth
+        self.sample_size = sample_size
+        self._table = np.zeros((depth, width), dtype=np.uint32)
+        self._seeds = [0x9E3779B1 * (i + 1) for i in range(depth)]
+        self._additions = 0
+
+    def _slots(self, key: Hashable):
+        h = hash(key)
+        return [((h ^ seed) * 0x85EBCA6B) % self.width for seed in self._seeds]
+
+    def increment(self, key: Hashable) -> None:
+        for row, slot in enumerate(self._slots(key)):
+            self._table[row, slot] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            # Age all counters so stale popularity fades out
+            self._table >>= 1
+            self._additions //= 2
+
+    def estimate(self, key: Hashable) -> int:
+        return int(min(self._table[row, slot] for row, slot in enumerate(self._slots(key))))
+
+
+class ColumnCache:
+    """
+    Process-wide, thread-safe cache of per-column artifacts (normalized values,
+    signatures, indexes) keyed by column content hash and bounded by bytes.
+
+    Entries are kept in LRU order; once the byte budget is reached a new entry is
+    only admitted if the TinyLFU sketch says it is requested more often than the
+    entries it would evict.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._sketch = FrequencySketch()
+        self._lock = threading.Lock()
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            self._sketch.increment(key)
+            try:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> bool:
+        """Insert value; returns False when the admission policy rejects it"""
+        size = estimate_nbytes(value) if nbytes is None else nbytes
+        with self._lock:
+            if size > self.max_bytes:
+                self.rejections += 1
+                return False
+
+            if key in self._entries:
+                self.resident_bytes -= self._sizes.pop(key)
+                del self._entries[key]
+
+            # Pick LRU victims until the new entry fits, then decide admission
+            victims = []
+            freed = 0
+            candidate_freq = self._sketch.estimate(key)
+            for victim in self._entries:
+                if self.resident_bytes - freed + size <= self.max_bytes:
+                    break
+                if self._sketch.estimate(victim) > candidate_freq:
+                    self.rejections += 1
+                    return False
+                victims.append(victim)
+                freed += self._sizes[victim]
+
+            for victim in victims:
+                del self._entries[victim]
+                self.resident_bytes -= self._sizes.pop(victim)
+                self.evictions += 1
+
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.resident_bytes += size
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.resident_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'resident_bytes': self.resident_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'rejections': self.rejections,
+            }
+
+
+# Shared by every FuzzyEntityMatcher in the process
+COLUMN_CACHE = ColumnCache(max_bytes=Config.COLUMN_CACHE_MAX_BYTES)
@@ -0,0 +1,137 @@
+# backend/services/column_name_index.py
+import re
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from backend.models.schema_models import TableProfile
+
+
+def _clean_name(name: str) -> str:
+    """Lowercase and turn separators into spaces, padded so n-grams see word boundaries"""
+    return f" {re.sub(r'[^a-z0-9]+', ' ', name.lower()).strip()} "
+
+
+class ColumnNameIndex:
+    """
+    Sparse TF-IDF matrix of character n-grams over every column name in an upload.
+
+    Top-k neighbours come from chunked sparse matrix products, so name-based
+    candidate pairs stay near-linear in the number of columns.
+    """
+    def __init__(self, columns: Sequence[Tuple[str, str]], ngram_range: Tuple[int, int] = (2, 4)):
+        self.columns = list(columns)
+        self.ngram_range = ngram_range
+        self._vector_cache: Dict[str, sparse.csr_matrix] = {}
+
+        rows, grams = [], []
+        for row, (_, column) in enumerate(self.columns):
+            for gram in self._ngrams(column):
+                rows.append(row)
+                grams.append(gram)
+
+        codes, vocabulary = pd.factorize(pd.Series(grams, dtype=object))
+        self.vocabulary = {gram: code for code, gram in enumerate(vocabulary)}
+        counts = sparse.csr_matrix(
+            (np.ones(len(codes)), (np.asarray(rows, dtype=np.int64), codes)),
+            shape=(len(self.columns), len(vocabulary))
+        )
+        counts.sum_duplicates()
+
+        document_freq = np.bincount(counts.indices, minlength=len(vocabulary))
+        self.idf = np.log((1 + len(self.columns)) / (1 + document_freq)) + 1.0
+        self.matrix = self._weigh(counts)
+
+    @classmethod
+    def from_schema(cls, schema: Dict[str, TableProfile], **kwargs) -> "ColumnNameIndex":
+        return cls(
+            [(table, column) for table, profile in schema.items() for column in profile.columns],
+            **kwargs
+        )
+
+    def _ngrams(self, name: str) -> List[str]:
+        text = _clean_name(name)
+        low, high = self.ngram_range
+        return [
+            text[i:i + n]
+            for n in range(low, high + 1)
+            for i in range(len(text) - n + 1)
+        ]
+
+    def _weigh(self, counts: sparse.csr_matrix) -> sparse.csr_matrix:
+        """Sublinear tf * idf, L2-normalized per row"""
+        weighted = counts.astype(np.float64)
+        weighted.data = 1.0 + np.log(weighted.data)
+        weighted = weighted.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms) @ weighted
+
+    def candidate_pairs(self,
+                        k: int = 5,
+                        min_similarity: float = 0.5,
+                        cross_table_only: bool = True,
+                        chunk_size: int = 2048) -> List[Tuple[str, str, str, str, float]]:
+        """
+        Top-k most similar column names per column, deduplicated into
+        (table_a, column_a, table_b, column_b, similarity) tuples.
+        """
+        tables = np.array([table for table, _ in self.columns], dtype=object)
+        best: Dict[Tuple[int, int], float] = {}
+        transposed = self.matrix.T.tocsr()
+
+        for start in range(0, len(self.columns), chunk_size):
+            block = (self.matrix[start:start + chunk_size] @ transposed).tocsr()
+            for offset in range(block.shape[0]):
+                row = start + offset
+                lo, hi = block.indptr[offset], block.indptr[offset + 1]
+                neighbours = block.indices[lo:hi]
+                scores = block.data[lo:hi]
+
+                keep = (neighbours != row) & (scores >= min_similarity)
+                if cross_table_only:
+                    keep &= tables[neighbours] != tables[row]
+                neighbours, scores = neighbours[keep], scores[keep]
+                if len(neighbours) > k:
+                    top = np.argpartition(-scores, k - 1)[:k]
+                    neighbours, scores = neighbours[top], scores[top]
+
+                for other, score in zip(neighbours.tolist(), scores.tolist()):
+                    pair = (row, other) if row < other else (other, row)
+                    best[pair] = max(best.get(pair, 0.0), score)
+
+        return [
+            (*self.columns[i], *self.columns[j], round(min(score, 1.0), 4))
+            for (i, j), score in sorted(best.items())
+        ]
+
+    def _vectors(self, names: Sequence[str]) -> sparse.csr_matrix:
+        """One weighted row per name, over the upload's vocabulary"""
+        rows, codes = [], []
+        for row, name in enumerate(names):
+            for gram in self._ngrams(name):
+                code = self.vocabulary.get(gram)
+                if code is not None:
+                    rows.append(row)
+                    codes.append(code)
+        counts = sparse.csr_matrix(
+            (np.ones(len(codes)), (np.asarray(rows, dtype=np.int64), np.asarray(codes, dtype=np.int64))),
+            shape=(len(names), len(self.vocabulary))
+        )
+        counts.sum_duplicates()
+        return self._weigh(counts)
+
+    def _vector(self, name: str) -> sparse.csr_matrix:
+        vector = self._vector_cache.get(name)
+        if vector is None:
+            vector = self._vectors([name])
+            self._vector_cache[name] = vector
+        return vector
+
+    def similarity_matrix(self, names_a: Sequence[str], names_b: Sequence[str]) -> np.ndarray:
+        """Cosine similarity of every name in names_a to every name in names_b, as one sparse product"""
+        return (self._vectors(names_a) @ self._vectors(names_b).T).toarray()
+
+    def similarity(self, name_a: str, name_b: str) -> float:
+        """Cosine similarity of two arbitrary names under the upload's n-gram weights"""
+        return float(self._vector(name_a).multiply(self._vector(name_b)).sum())
@@ -0,0 +1,141 @@
+# backend/services/column_similarity.py
+from array import array
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+
+# Kind of evidence behind a similarity record, stored as a small int code
+EVIDENCE_KINDS = ('value', 'distribution')
+# Share of the gap to 1.0 that a perfect name match closes. Names only
+# strengthen pairs that share values: on their own they say nothing about
+# shared entities (created_at / updated_at)
+NAME_EVIDENCE_WEIGHT = 0.5
+
+
+class ColumnSimilarityTable:
+    """
+    Array-backed store holding one similarity record per column pair.
+
+    Columns are interned as integer ids over (table, column) pairs, and every
+    metric lives in its own typed array, so millions of matched values collapse
+    into a few numbers per pair instead of per-value dicts.
+    """
+    def __init__(self):
+        self.columns: List[Tuple[str, str]] = []
+        self._column_ids: Dict[Tuple[str, str], int] = {}
+        self._rows: Dict[Tuple[int, int], int] = {}  # (lower id, higher id) -> record
+        self.source = array('q')
+        self.target = array('q')
+        self.match_rate = array('d')     # share of scored source values with a match
+        self.mean_score = array('d')     # mean score (0-1) over matched values
+        self.exact_ratio = array('d')    # share of matched values that matched exactly
+        self.values_scored = array('q')  # source values scored before the verdict
+        self.name_score = array('d')     # column-name similarity (0-1), 0 if not compared
+        self.kind = array('b')
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    @property
+    def column_names(self) -> List[str]:
+        """"table.column" per column id, the form entity groups are reported in"""
+        return [f"{table}.{column}" for table, column in self.columns]
+
+    def column_id(self, table: str, column: str) -> int:
+        key = (table, column)
+        col_id = self._column_ids.get(key)
+        if col_id is None:
+            col_id = len(self.columns)
+            self._column_ids[key] = col_id
+            self.columns.append(key)
+        return col_id
+
+    def add(self,
+            source_table: str,
+            source_column: str,
+            target_table: str,
+            target_column: str,
+            match_rate: float,
+            mean_score: float,
+            exact_ratio: float,
+            values_scored: int,
+            kind: str = 'value') -> None:
+        source = self.column_id(source_table, source_column)
+        target = self.column_id(target_table, target_column)
+        self._rows[(min(source, target), max(source, target))] = len(self.source)
+        self.source.append(source)
+        self.target.append(target)
+        self.match_rate.append(match_rate)
+        self.mean_score.append(mean_score)
+        self.exact_ratio.append(exact_ratio)
+        self.values_scored.append(values_scored)
+        self.name_score.append(0.0)
+        self.kind.append(EVIDENCE_KINDS.index(kind))
+
+    def add_name_score(self,
+                       source_table: str,
+                       source_column: str,
+                       target_table: str,
+                       target_column: str,
+                       score: float) -> bool:
+        """Attach name similarity to the pair's record; False if the pair has no value evidence"""
+        source = self._column_ids.get((source_table, source_column))
+        target = self._column_ids.get((target_table, target_column))
+        if source is None or target is None:
+            return False
+        row = self._rows.get((min(source, target), max(source, target)))
+        if row is None:
+            return False
+        self.name_score[row] = score
+        return True
+
+    @property
+    def similarity(self) -> np.ndarray:
+        """
+        Column-pair similarity used for grouping: the match rate, raised by
+        name similarity toward 1.0. A new array: a view over the backing array
+        would make every later add() raise BufferError while the caller still holds it.
+        """
+        if not len(self):
+            return np.zeros(0)
+        match_rate = np.frombuffer(self.match_rate, dtype=np.float64)
+        name_score = np.frombuffer(self.name_score, dtype=np.float64)
+        return match_rate + (1.0 - match_rate) * NAME_EVIDENCE_WEIGHT * name_score
+
+    def edge_arrays(self, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(source_ids, target_ids, similarities) for every record at or above threshold"""
+        if not len(self):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+        similarity = self.similarity
+        rows = np.flatnonzero(similarity >= threshold)
+        # Fancy indexing copies, so no view over the arrays outlives this call
+        return (np.frombuffer(self.source, dtype=np.int64)[rows],
+                np.frombuffer(self.target, dtype=np.int64)[rows],
+                similarity[rows])
+
+    def edges(self, threshold: float) -> Iterator[Tuple[int, int, float]]:
+        """(source_id, target_id, similarity) for every record at or above threshold"""
+        if not len(self):
+            return
+        source, target, similarity = self.edge_arrays(threshold)
+        for src, tgt, sim in zip(source.tolist(), target.tolist(), similarity.tolist()):
+            yield src, tgt, sim
+
+    def records(self) -> Iterator[Dict]:
+        """Materialize records as dicts, e.g. for logging or JSON responses"""
+        similarity = self.similarity
+        for row in range(len(self)):
+            source_table, source_column = self.columns[self.source[row]]
+            target_table, target_column = self.columns[self.target[row]]
+            yield {
+                'source_table': source_table,
+                'source_column': source_column,
+                'target_table': target_table,
+                'target_column': target_column,
+                'similarity': float(similarity[row]),
+                'match_rate': self.match_rate[row],
+                'mean_score': self.mean_score[row],
+                'exact_ratio': self.exact_ratio[row],
+                'values_scored': self.values_scored[row],
+                'name_score': self.name_score[row],
+                'kind': EVIDENCE_KINDS[self.kind[row]],
+            }
@@ -0,0 +1,394 @@
+# backend/services/ddl_emitters.py
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from backend.services.schema_ir import ColumnIR, ForeignKeyIR, IndexIR, SchemaIR, TableIR, render_type
+
+SIMPLE_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class DDLEmitter:
+    """
+    Renders a SchemaIR as DDL. The base class reproduces the generic output of
+    SQLGenerator.generate_ddl (inferred types as-is, FKs as ALTER TABLE);
+    dialect subclasses override type mapping, quoting and constraint placement.
+    """
+    dialect = "generic"
+    reserved: frozenset = frozenset()  # Set below the dialect subclasses
+    quote_chars: Tuple[str, str] = ('"', '"')
+    inline_foreign_keys = False  # SQLite cannot ALTER TABLE ... ADD FOREIGN KEY
+    supports_index_methods = False
+    supports_partial_indexes = False
+
+    def quote(self, name: str) -> str:
+        if SIMPLE_IDENTIFIER.match(name) and name.lower() not in self.reserved:
+            return name
+        left, right = self.quote_chars
+        return f"{left}{name.replace(right, right * 2)}{right}"
+
+    def column_type(self, column: ColumnIR) -> str:
+        return render_type(column)
+
+    def column_definition(self, column: ColumnIR) -> str:
+        null = "NULL" if column.nullable else "NOT NULL"
+        return f"{self.quote(column.name)} {self.column_type(column)} {null}"
+
+    def create_table(self, table: TableIR, foreign_keys: List[ForeignKeyIR]) -> str:
+        lines = [self.column_definition(c) for c in table.columns]
+        comments = [
+            f" -- suggested: {c.canonical_name}" if c.canonical_name and c.canonical_name != c.name else ""
+            for c in table.columns
+        ]
+        if table.primary_key:
+            lines.append(f"PRIMARY KEY ({self._column_list(table.primary_key)})")
+            comments.append("")
+        if self.inline_foreign_keys:
+            for fk in foreign_keys:
+                lines.append(self._references(fk))
+                comments.append("")
+
+        # The separator goes before the comment so the comment cannot swallow it
+        body = "\n  ".join(
+            line + ("," if i < len(lines) - 1 else "") + comment
+            for i, (line, comment) in enumerate(zip(lines, comments))
+        )
+        return f"CREATE TABLE {self.quote(table.name)} (\n  {body}\n){self.table_options()};"
+
+    def table_options(self) -> str:
+        return ""
+
+    def _column_list(self, columns: Tuple[str, ...]) -> str:
+        return ", ".join(self.quote(c) for c in columns)
+
+    def _references(self, fk: ForeignKeyIR) -> str:
+        return (
+            f"FOREIGN KEY ({self._column_list(fk.columns)}) "
+            f"REFERENCES {self.quote(fk.ref_table)} ({self._column_list(fk.ref_columns)})"
+        )
+
+    def add_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"ALTER TABLE {self.quote(fk.table)} ADD {self._references(fk)};"
+
+    def create_index(self, index: IndexIR) -> Optional[str]:
+        unique = "UNIQUE " if index.unique else ""
+        method = f" USING {index.method.upper()}" if index.method and self.supports_index_methods else ""
+        predicate = self.index_predicate(index)
+        where = f" WHERE {predicate}" if predicate and self.supports_partial_indexes else ""
+        comment = f" -- {index.comment}" if index.comment else ""
+        return (
+            f"CREATE {unique}INDEX {self.quote(index.name)} ON {self.quote(index.table)}"
+            f"{method} ({self._column_list(index.columns)}){where};{comment}"
+        )
+
+    def index_predicate(self, index: IndexIR) -> Optional[str]:
+        if index.where_not_null:
+            return f"{self.quote(index.where_not_null)} IS NOT NULL"
+        return index.where
+
+    # Migration statements. Constraints are created unnamed, so they are
+    # dropped by the names Postgres gives them by default.
+
+    def primary_key_name(self, table: str) -> str:
+        return f"{table}_pkey"
+
+    def foreign_key_name(self, fk: ForeignKeyIR) -> str:
+        return f"{fk.table}_{'_'.join(fk.columns)}_fkey"
+
+    def add_column(self, table: str, column: ColumnIR) -> str:
+        return f"ALTER TABLE {self.quote(table)} ADD COLUMN {self.column_definition(column)};"
+
+    def drop_column(self, table: str, column: str) -> str:
+        return f"ALTER TABLE {self.quote(table)} DROP COLUMN {self.quote(column)};"
+
+    def alter_column(self, table: str, old: ColumnIR, new: ColumnIR) -> List[str]:
+        prefix = f"ALTER TABLE {self.quote(table)} ALTER COLUMN {self.quote(new.name)}"
+        statements = []
+        if self.column_type(old) != self.column_type(new):
+            statements.append(f"{prefix} TYPE {self.column_type(new)};")
+        if old.nullable != new.nullable:
+            statements.append(f"{prefix} {'DROP' if new.nullable else 'SET'} NOT NULL;")
+        return statements
+
+    def drop_table(self, table: str) -> str:
+        return f"DROP TABLE {self.quote(table)};"
+
+    def add_primary_key(self, table: str, columns: Tuple[str, ...]) -> str:
+        return f"ALTER TABLE {self.quote(table)} ADD PRIMARY KEY ({self._column_list(columns)});"
+
+    def drop_primary_key(self, table: str) -> str:
+        return f"ALTER TABLE {self.quote(table)} DROP CONSTRAINT {self.quote(self.primary_key_name(table))};"
+
+    def drop_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"ALTER TABLE {self.quote(fk.table)} DROP CONSTRAINT {self.quote(self.foreign_key_name(fk))};"
+
+    def drop_index(self, index: IndexIR) -> str:
+        return f"DROP INDEX {self.quote(index.name)};"
+
+    def render(self, schema: SchemaIR) -> str:
+        fks_by_table: Dict[str, List[ForeignKeyIR]] = {}
+        for fk in schema.foreign_keys:
+            fks_by_table.setdefault(fk.table, []).append(fk)
+
+        statements = [self.create_table(t, fks_by_table.get(t.name, [])) for t in schema.tables]
+        if not self.inline_foreign_keys:
+            statements.extend(self.add_foreign_key(fk) for fk in schema.foreign_keys)
+        statements.extend(filter(None, (self.create_index(ix) for ix in schema.indexes)))
+        return "\n".join(statements)
+
+
+class PostgresEmitter(DDLEmitter):
+    dialect = "postgres"
+    reserved = frozenset({
+        "all", "analyse", "analyze", "and", "any", "array", "as", "asc", "both", "case", "cast",
+        "check", "column", "constraint", "create", "current_date", "current_time", "current_user",
+        "default", "desc", "distinct", "do", "else", "end", "except", "false", "for", "foreign",
+        "from", "grant", "group", "having", "in", "into", "leading", "limit", "not", "null",
+        "offset", "on", "only", "or", "order", "primary", "references", "select", "table", "then",
+        "to", "trailing", "true", "union", "unique", "user", "using", "when", "where", "with",
+    })
+    supports_index_methods = True
+    supports_partial_indexes = True
+    types = {
+        "INT": "INTEGER", "FLOAT": "DOUBLE PRECISION", "DOUBLE": "DOUBLE PRECISION",
+        "DATETIME": "TIMESTAMP", "TINYINT": "SMALLINT",
+    }
+
+    def column_type(self, column: ColumnIR) -> str:
+        if column.type in self.types:
+            return self.types[column.type]
+        return render_type(column)
+
+
+class MySQLEmitter(DDLEmitter):
+    dialect = "mysql"
+    quote_chars = ("`", "`")
+    reserved = PostgresEmitter.reserved | frozenset({
+        "key", "keys", "index", "interval", "range", "rank", "read", "row", "rows", "usage",
+    })
+    types = {"FLOAT": "DOUBLE", "UUID": "CHAR(36)", "TIMESTAMP": "DATETIME"}
+
+    def column_type(self, column: ColumnIR) -> str:
+        if column.type in self.types:
+            return self.types[column.type]
+        if column.type == "VARCHAR" and column.params and column.params[0] > 16383:
+            return "TEXT"
+        if column.type in ("NUMERIC", "DECIMAL"):
+            # DECIMAL tops out at 65 digits
+            if column.params and column.params[0] > 65:
+                return "DOUBLE"
+            return render_type(ColumnIR(column.name, "DECIMAL", column.params))
+        return render_type(column)
+
+    def table_options(self) -> str:
+        return " ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+
+    def alter_column(self, table: str, old: ColumnIR, new: ColumnIR) -> List[str]:
+        return [f"ALTER TABLE {self.quote(table)} MODIFY COLUMN {self.column_definition(new)};"]
+
+    def drop_primary_key(self, table: str) -> str:
+        return f"ALTER TABLE {self.quote(table)} DROP PRIMARY KEY;"
+
+    def drop_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"ALTER TABLE {self.quote(fk.table)} DROP FOREIGN KEY {self.quote(self.foreign_key_name(fk))};"
+
+    def drop_index(self, index: IndexIR) -> str:
+        return f"DROP INDEX {self.quote(index.name)} ON {self.quote(index.table)};"
+
+
+class SQLiteEmitter(DDLEmitter):
+    dialect = "sqlite"
+    reserved = PostgresEmitter.reserved | frozenset({"index", "key", "abort", "action"})
+    inline_foreign_keys = True
+    supports_partial_indexes = True
+
+    def column_type(self, column: ColumnIR) -> str:
+        # Map onto SQLite's storage classes
+        if column.type in ("INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT", "BOOLEAN"):
+            return "INTEGER"
+        if column.type in ("FLOAT", "REAL", "DOUBLE", "DOUBLE PRECISION"):
+            return "REAL"
+        if column.type in ("NUMERIC", "DECIMAL"):
+            return "NUMERIC"
+        return "TEXT"
+
+    def alter_column(self, table: str, old: ColumnIR, new: ColumnIR) -> List[str]:
+        if self.column_type(old) == self.column_type(new) and old.nullable == new.nullable:
+            return []
+        return [f"-- {table}.{new.name} -> {self.column_definition(new)}: SQLite needs the table rebuilt"]
+
+    def add_primary_key(self, table: str, columns: Tuple[str, ...]) -> str:
+        return f"-- {table}: PRIMARY KEY ({self._column_list(columns)}) needs the table rebuilt in SQLite"
+
+    def drop_primary_key(self, table: str) -> str:
+        return f"-- {table}: dropping the primary key needs the table rebuilt in SQLite"
+
+    def add_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"-- {fk.table}: {self._references(fk)} needs the table rebuilt in SQLite"
+
+    def drop_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"-- {fk.table}: dropping {self._references(fk)} needs the table rebuilt in SQLite"
+
+
+class SQLServerEmitter(DDLEmitter):
+    dialect = "sqlserver"
+    quote_chars = ("[", "]")
+    reserved = PostgresEmitter.reserved | frozenset({"key", "index", "file", "identity", "percent", "plan", "rule"})
+    supports_partial_indexes = True
+
+    def column_type(self, column: ColumnIR) -> str:
+        if column.type == "BOOLEAN":
+            return "BIT"
+        if column.type in ("FLOAT", "DOUBLE", "DOUBLE PRECISION"):
+            return "FLOAT"
+        if column.type in ("TIMESTAMP", "DATETIME"):
+            return "DATETIME2"
+        if column.type == "UUID":
+            return "UNIQUEIDENTIFIER"
+        if column.type in ("NUMERIC", "DECIMAL") and column.params and column.params[0] > 38:
+            return "FLOAT"
+        if column.type == "TEXT":
+            return "NVARCHAR(MAX)"
+        if column.type in ("VARCHAR", "CHAR"):
+            length = column.params[0] if column.params else None
+            if length is None or length > 4000:
+                return "NVARCHAR(MAX)"
+            return f"N{column.type}({length})"
+        return render_type(column)
+
+    def add_column(self, table: str, column: ColumnIR) -> str:
+        return f"ALTER TABLE {self.quote(table)} ADD {self.column_definition(column)};"
+
+    def alter_column(self, table: str, old: ColumnIR, new: ColumnIR) -> List[str]:
+        return [f"ALTER TABLE {self.quote(table)} ALTER COLUMN {self.column_definition(new)};"]
+
+    def drop_index(self, index: IndexIR) -> str:
+        return f"DROP INDEX {self.quote(index.name)} ON {self.quote(index.table)};"
+
+    # Unnamed constraints get generated names here, so they have to be looked up
+    def drop_primary_key(self, table: str) -> str:
+        return f"-- {table}: drop the PRIMARY KEY constraint (name is server-generated, see sys.key_constraints)"
+
+    def drop_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"-- {fk.table}: drop {self._references(fk)} (name is server-generated, see sys.foreign_keys)"
+
+
+class OracleEmitter(DDLEmitter):
+    dialect = "oracle"
+    reserved = PostgresEmitter.reserved | frozenset({
+        "access", "comment", "date", "file", "level", "mode", "number", "raw", "resource", "row",
+        "rows", "session", "size", "uid", "validate", "value", "values",
+    })
+
+    def column_type(self, column: ColumnIR) -> str:
+        if column.type in ("INT", "INTEGER"):
+            return "NUMBER(10)"
+        if column.type == "BIGINT":
+            return "NUMBER(19)"
+        if column.type == "SMALLINT":
+            return "NUMBER(5)"
+        if column.type == "BOOLEAN":
+            return "NUMBER(1)"
+        if column.type in ("FLOAT", "DOUBLE", "DOUBLE PRECISION"):
+            return "BINARY_DOUBLE"
+        if column.type in ("NUMERIC", "DECIMAL"):
+            if not column.params or column.params[0] > 38:
+                return "NUMBER"
+            return f"NUMBER({', '.join(str(p) for p in column.params)})"
+        if column.type in ("TIMESTAMP", "DATETIME"):
+            return "TIMESTAMP"
+        if column.type == "UUID":
+            return "RAW(16)"
+        if column.type == "TEXT":
+            return "CLOB"
+        if column.type == "VARCHAR":
+            length = column.params[0] if column.params else 4000
+            return "CLOB" if length > 4000 else f"VARCHAR2({length})"
+        return render_type(column)
+
+    def column_definition(self, column: ColumnIR) -> str:
+        # Nullable is Oracle's default; only NOT NULL is spelled out
+        definition = f"{self.quote(column.name)} {self.column_type(column)}"
+        return definition if column.nullable else f"{definition} NOT NULL"
+
+    def add_column(self, table: str, column: ColumnIR) -> str:
+        return f"ALTER TABLE {self.quote(table)} ADD ({self.column_definition(column)});"
+
+    def alter_column(self, table: str, old: ColumnIR, new: ColumnIR) -> List[str]:
+        definition = f"{self.quote(new.name)} {self.column_type(new)}"
+        if old.nullable != new.nullable:
+            definition += " NULL" if new.nullable else " NOT NULL"
+        return [f"ALTER TABLE {self.quote(table)} MODIFY ({definition});"]
+
+    def drop_primary_key(self, table: str) -> str:
+        return f"ALTER TABLE {self.quote(table)} DROP PRIMARY KEY;"
+
+    def drop_foreign_key(self, fk: ForeignKeyIR) -> str:
+        return f"-- {fk.table}: drop {self._references(fk)} (name is system-generated, see USER_CONSTRAINTS)"
+
+
+# Generic DDL is stored and executed against whichever database the user has,
+# so it quotes every word any supported dialect reserves
+DDLEmitter.reserved = frozenset().union(*(cls.reserved for cls in DDLEmitter.__subclasses__()))
+
+EMITTERS: Dict[str, DDLEmitter] = {
+    emitter.dialect: emitter
+    for emitter in (DDLEmitter(), PostgresEmitter(), MySQLEmitter(), SQLiteEmitter(),
+                    SQLServerEmitter(), OracleEmitter())
+}
+DIALECT_ALIASES = {"postgresql": "postgres", "pg": "postgres", "mssql": "sqlserver", "tsql": "sqlserver"}
+
+
+def resolve_dialect(dialect: Optional[str]) -> str:
+    name = (dialect or "generic").strip().lower().replace(" ", "")
+    name = DIALECT_ALIASES.get(name, name)
+    if name not in EMITTERS:
+        raise ValueError(f"Unsupported SQL dialect: {dialect}")
+    return name
+
+
+class _RenderCache:
+    """Small thread-safe LRU of rendered DDL keyed by (IR digest, dialect)"""
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[str, str], value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+RENDER_CACHE = _RenderCache()
+
+
+def render_ddl(schema: SchemaIR, dialect: Optional[str] = None) -> str:
+    """Deterministic DDL for one dialect, memoized by schema digest"""
+    name = resolve_dialect(dialect)
+    key = (schema.digest, name)
+    ddl = RENDER_CACHE.get(key)
+    if ddl is None:
+        ddl = EMITTERS[name].render(schema)
+        RENDER_CACHE.put(key, ddl)
+    return ddl
+
+
+def render_stored_ddl(ir_data: Dict, dialect: Optional[str] = None) -> str:
+    """render_ddl for an IR stored with a session; cache hits skip rebuilding the IR"""
+    name = resolve_dialect(dialect)
+    digest = ir_data.get("digest")
+    if digest:
+        ddl = RENDER_CACHE.get((digest, name))
+        if ddl is not None:
+            return ddl
+    return render_ddl(SchemaIR.from_dict(ir_data), name)
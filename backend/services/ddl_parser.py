@@ -0,0 +1,345 @@
+# backend/services/ddl_parser.py
+import re
+from typing import Dict, List, Optional, Tuple
+
+# One alternation per token kind, with whitespace and comments consumed as a
+# prefix of the next token; finditer walks the script once in C. A trailing
+# comment is consumed by the empty end match rather than re-read as tokens
+TOKEN_PATTERN = re.compile(r"""
+    (?:\s+|--[^\n]*|/\*.*?(?:\*/|$))*
+    (?:
+        (?P<word>[A-Za-z_][A-Za-z0-9_$#]*)
+      | (?P<punct>[(),;.])
+      | (?P<number>\d+(?:\.\d+)?)
+      | (?P<string>'(?:[^']|'')*')
+      | (?P<quoted>"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])
+      | (?P<other>\S)
+      | (?P<end>$)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+WORD, IDENT, NUMBER, STRING, PUNCT, OTHER = "word", "ident", "number", "string", "punct", "other"
+
+# Words that end a column's type and start its constraints
+COLUMN_CONSTRAINTS = {
+    "NOT", "NULL", "DEFAULT", "PRIMARY", "REFERENCES", "UNIQUE", "CHECK", "CONSTRAINT",
+    "GENERATED", "AUTO_INCREMENT", "AUTOINCREMENT", "IDENTITY", "COLLATE", "COMMENT",
+    "ON", "ENCODE", "SPARSE", "ENABLE", "DISABLE", "AS", "STORED", "VIRTUAL", "KEY",
+}
+# Words that may follow a type's parameters, e.g. TIMESTAMP(3) WITH TIME ZONE, INT(11) UNSIGNED
+TYPE_SUFFIXES = {"UNSIGNED", "SIGNED", "ZEROFILL", "WITH", "WITHOUT", "LOCAL", "TIME", "ZONE", "VARYING"}
+CREATE_MODIFIERS = {"GLOBAL", "LOCAL", "TEMPORARY", "TEMP", "UNLOGGED", "UNIQUE", "CLUSTERED",
+                    "NONCLUSTERED", "BITMAP", "FULLTEXT", "SPATIAL"}
+# Table elements that are not column definitions
+TABLE_CONSTRAINTS = {"PRIMARY", "FOREIGN", "UNIQUE", "CHECK", "CONSTRAINT", "KEY", "INDEX",
+                     "EXCLUDE", "FULLTEXT", "SPATIAL", "PERIOD", "LIKE"}
+
+
+class Token:
+    __slots__ = ("kind", "text", "upper")
+
+    def __init__(self, kind: str, text: str):
+        self.kind = kind
+        self.text = text
+        self.upper = text.upper() if kind == WORD else text
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.text!r})"
+
+
+def tokenize(sql: str) -> List[List[Token]]:
+    """Single pass over the script: tokens grouped into statements, comments dropped"""
+    statements, current = [], []
+    for match in TOKEN_PATTERN.finditer(sql):
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "end":
+            continue
+        if kind == "quoted":
+            closing = "]" if text[0] == "[" else text[0]
+            current.append(Token(IDENT, text[1:-1].replace(closing * 2, closing)))
+        elif kind == "punct" and text == ";":
+            if current:
+                statements.append(current)
+                current = []
+        else:
+            current.append(Token(kind, text))
+    if current:
+        statements.append(current)
+    return statements
+
+
+class _Cursor:
+    """Position within one statement's tokens"""
+    __slots__ = ("tokens", "pos")
+
+    def __init__(self, tokens: List[Token], pos: int = 0):
+        self.tokens = tokens
+        self.pos = pos
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def next(self) -> Optional[Token]:
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def at(self, *words: str) -> bool:
+        """True if the next tokens are these keywords"""
+        for offset, word in enumerate(words):
+            token = self.peek(offset)
+            if token is None or token.kind != WORD or token.upper != word:
+                return False
+        return True
+
+    def accept(self, *words: str) -> bool:
+        if self.at(*words):
+            self.pos += len(words)
+            return True
+        return False
+
+    def skip_group(self) -> List[Token]:
+        """Consume a parenthesized group and return the tokens inside it"""
+        if self.peek() is None or self.peek().text != "(":
+            return []
+        depth, start = 0, self.pos + 1
+        while self.pos < len(self.tokens):
+            text = self.tokens[self.pos].text
+            kind = self.tokens[self.pos].kind
+            self.pos += 1
+            if kind == PUNCT and text == "(":
+                depth += 1
+            elif kind == PUNCT and text == ")":
+                depth -= 1
+                if depth == 0:
+                    return self.tokens[start:self.pos - 1]
+        return self.tokens[start:]
+
+    def name(self) -> Optional[str]:
+        """Possibly qualified identifier; returns its last part (the object name)"""
+        token = self.next()
+        if token is None or token.kind not in (WORD, IDENT):
+            return None
+        name = token.text
+        while self.peek() is not None and self.peek().text == "." and self.peek().kind == PUNCT:
+            self.pos += 1
+            part = self.next()
+            if part is None:
+                break
+            name = part.text
+        return name
+
+
+def _split_commas(tokens: List[Token]) -> List[List[Token]]:
+    """Split tokens on top-level commas"""
+    parts, current, depth = [], [], 0
+    for token in tokens:
+        if token.kind == PUNCT:
+            if token.text == "(":
+                depth += 1
+            elif token.text == ")":
+                depth -= 1
+            elif token.text == "," and depth == 0:
+                parts.append(current)
+                current = []
+                continue
+        current.append(token)
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _names(tokens: List[Token]) -> List[str]:
+    """Column names of a "(a, b DESC, c(10))" list"""
+    names = []
+    for part in _split_commas(tokens):
+        if part and part[0].kind in (WORD, IDENT):
+            names.append(part[0].text)
+    return names
+
+
+class DDLParser:
+    """
+    Purpose-built parser for the DDL this app generates and the vendor DDL the
+    LLM returns: CREATE TABLE (column and table constraints, composite keys),
+    ALTER TABLE ... ADD (columns, PRIMARY KEY, FOREIGN KEY) and CREATE INDEX.
+    Statements it does not recognize are skipped.
+    """
+    def __init__(self):
+        self.schema: Dict[str, Dict[str, Dict]] = {}
+        self.primary_keys: Dict[str, List[str]] = {}
+        self.foreign_keys: List[Dict] = []
+        self.indexes: List[Dict] = []
+
+    def parse(self, sql: str) -> Tuple[Dict, Dict]:
+        for tokens in tokenize(sql):
+            cursor = _Cursor(tokens)
+            if cursor.accept("CREATE"):
+                self._create(cursor)
+            elif cursor.accept("ALTER", "TABLE"):
+                self._alter_table(cursor)
+
+        keys = {
+            "primary_keys": {
+                table: [{"column": col, "selected": True} for col in columns]
+                for table, columns in self.primary_keys.items()
+            },
+            "foreign_keys": self.foreign_keys,
+            "indexes": self.indexes,
+        }
+        return self.schema, keys
+
+    def _create(self, cursor: _Cursor) -> None:
+        cursor.accept("OR", "REPLACE")
+        unique = False
+        while cursor.peek() is not None and cursor.peek().upper in CREATE_MODIFIERS:
+            unique = unique or cursor.peek().upper == "UNIQUE"
+            cursor.pos += 1
+        if cursor.accept("TABLE"):
+            self._create_table(cursor)
+        elif cursor.accept("INDEX"):
+            self._create_index(cursor, unique=unique)
+
+    def _create_table(self, cursor: _Cursor) -> None:
+        cursor.accept("IF", "NOT", "EXISTS")
+        table = cursor.name()
+        if table is None:
+            return
+        body = cursor.skip_group()
+        if not body:
+            return  # CREATE TABLE ... AS SELECT and the like
+        columns = self.schema.setdefault(table, {})
+        for element in _split_commas(body):
+            self._table_element(table, columns, _Cursor(element))
+
+    def _table_element(self, table: str, columns: Dict, cursor: _Cursor) -> None:
+        first = cursor.peek()
+        if first is None:
+            return
+        if first.kind == WORD and first.upper in TABLE_CONSTRAINTS:
+            self._table_constraint(table, cursor)
+            return
+        name = cursor.next().text
+        columns[name] = self._column(table, name, cursor)
+
+    def _table_constraint(self, table: str, cursor: _Cursor) -> None:
+        if cursor.accept("CONSTRAINT"):
+            cursor.name()
+        if cursor.accept("PRIMARY", "KEY"):
+            cursor.accept("CLUSTERED") or cursor.accept("NONCLUSTERED")
+            self.primary_keys[table] = _names(cursor.skip_group())
+        elif cursor.accept("FOREIGN", "KEY"):
+            source = _names(cursor.skip_group())
+            if cursor.accept("REFERENCES"):
+                self._references(table, source, cursor)
+
+    def _references(self, table: str, source: List[str], cursor: _Cursor) -> None:
+        target_table = cursor.name()
+        target = _names(cursor.skip_group()) if cursor.peek() is not None and cursor.peek().text == "(" else []
+        if target_table is None:
+            return
+        if not target:
+            # REFERENCES t without columns means t's primary key
+            target = self.primary_keys.get(target_table, [])
+        for src, tgt in zip(source, target):
+            self.foreign_keys.append({
+                "source_table": table,
+                "source_column": src,
+                "target_table": target_table,
+                "target_column": tgt,
+            })
+
+    def _column(self, table: str, name: str, cursor: _Cursor) -> Dict:
+        parts, has_params = [], False
+        while cursor.peek() is not None:
+            token = cursor.peek()
+            if token.kind == PUNCT and token.text == "(" and parts and not has_params:
+                parts[-1] += "(" + ", ".join(
+                    "".join(t.text for t in part) for part in _split_commas(cursor.skip_group())
+                ) + ")"
+                has_params = True
+                continue
+            if token.kind != WORD or (parts and token.upper in COLUMN_CONSTRAINTS):
+                break
+            if has_params and token.upper not in TYPE_SUFFIXES:
+                break
+            parts.append(token.upper)
+            cursor.pos += 1
+        col_type = " ".join(parts) if parts else "TEXT"
+
+        nullable = True
+        while cursor.peek() is not None:
+            if cursor.accept("NOT", "NULL"):
+                nullable = False
+            elif cursor.accept("PRIMARY", "KEY"):
+                self.primary_keys[table] = [name]
+                nullable = False
+            elif cursor.accept("REFERENCES"):
+                self._references(table, [name], cursor)
+            elif cursor.peek().text == "(":
+                cursor.skip_group()
+            else:
+                cursor.pos += 1
+
+        return {"type": col_type, "nullable": nullable, "canonical_name": None}
+
+    def _alter_table(self, cursor: _Cursor) -> None:
+        cursor.accept("ONLY")
+        cursor.accept("IF", "EXISTS")
+        table = cursor.name()
+        if table is None:
+            return
+        for action in _split_commas(cursor.tokens[cursor.pos:]):
+            sub = _Cursor(action)
+            if not sub.accept("ADD"):
+                continue
+            first = sub.peek()
+            if first is not None and first.kind == WORD and first.upper in ("CONSTRAINT", "PRIMARY", "FOREIGN", "UNIQUE", "CHECK"):
+                self._table_constraint(table, sub)
+            else:
+                sub.accept("COLUMN")
+                sub.accept("IF", "NOT", "EXISTS")
+                name = sub.name()
+                if name is not None:
+                    self.schema.setdefault(table, {})[name] = self._column(table, name, sub)
+
+    def _create_index(self, cursor: _Cursor, unique: bool) -> None:
+        cursor.accept("CONCURRENTLY")
+        cursor.accept("IF", "NOT", "EXISTS")
+        name = None if cursor.at("ON") else cursor.name()
+        if not cursor.accept("ON"):
+            return
+        cursor.accept("ONLY")
+        table = cursor.name()
+        method = None
+        if cursor.accept("USING"):
+            method = cursor.next().text.lower()
+        columns = _names(cursor.skip_group())
+        where = where_not_null = None
+        if cursor.accept("WHERE"):
+            predicate = cursor.tokens[cursor.pos:]
+            if (len(predicate) == 4 and predicate[0].kind in (WORD, IDENT)
+                    and [t.upper for t in predicate[1:]] == ["IS", "NOT", "NULL"]):
+                where_not_null = predicate[0].text
+            else:
+                where = " ".join(
+                    '"' + t.text.replace('"', '""') + '"' if t.kind == IDENT else t.text
+                    for t in predicate
+                )
+        if table and columns:
+            self.indexes.append({
+                "name": name or f"{table}_{'_'.join(columns)}_idx",
+                "table": table,
+                "columns": columns,
+                "unique": unique,
+                "method": method,
+                "where": where,
+                "where_not_null": where_not_null,
+            })
+
+
+def parse_ddl(sql: str) -> Tuple[Dict, Dict]:
+    """(schema, keys) from a DDL script, in the structure generate_mermaid / generate_dbml expect"""
+    return DDLParser().parse(sql)
@@ -0,0 +1,119 @@
+# backend/services/distribution_matching.py
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+
+NUMERIC_TYPES = {'INT', 'INTEGER', 'SMALLINT', 'BIGINT', 'FLOAT', 'REAL', 'DOUBLE', 'NUMERIC', 'DECIMAL'}
+DATE_TYPES = {'DATE', 'DATETIME', 'TIMESTAMP'}
+
+
+def distribution_family(detected_type: str) -> Optional[str]:
+    """'numeric' or 'date' for columns the distribution matcher handles, else None"""
+    base = detected_type.split('(')[0].strip().upper()
+    if base in NUMERIC_TYPES:
+        return 'numeric'
+    if base in DATE_TYPES:
+        return 'date'
+    return None
+
+
+@dataclass
+class DistributionSummary:
+    """Compact sketch of a numeric or date column"""
+    family: str
+    minimum: float
+    maximum: float
+    quantiles: np.ndarray     # values at evenly spaced quantile points
+    sample: np.ndarray        # sorted distinct values selected by hash threshold
+    sample_hashes: np.ndarray  # hashes aligned with sample
+    hash_threshold: int       # largest hash admitted to the sample
+    distinct_count: int
+
+    @property
+    def nbytes(self) -> int:
+        return self.quantiles.nbytes + self.sample.nbytes + self.sample_hashes.nbytes + 96
+
+
+def summarize_column(data: pd.Series,
+                     family: str,
+                     num_quantiles: int = 33,
+                     sample_size: int = 4096) -> Optional[DistributionSummary]:
+    """Build a DistributionSummary in one pass over the distinct values of a column"""
+    codes, uniques = pd.factorize(data)
+    if not len(uniques):
+        return None
+
+    if family == 'date':
+        converted = pd.to_datetime(pd.Series(uniques, dtype=object), errors='coerce')
+        distinct = converted.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+        distinct[converted.isna().to_numpy()] = np.nan
+    else:
+        distinct = pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+
+    values = distinct[codes[codes >= 0]]
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return None
+
+    distinct = np.unique(values)
+    # Keep the values with the smallest hashes: every column samples the same
+    # region of the value space, so sampled overlaps estimate true overlaps
+    hashes = pd.util.hash_array(distinct)
+    if len(distinct) > sample_size:
+        keep = np.argpartition(hashes, sample_size - 1)[:sample_size]
+        keep.sort()
+        sample, sample_hashes = distinct[keep], hashes[keep]
+        hash_threshold = int(sample_hashes.max())
+    else:
+        sample, sample_hashes = distinct, hashes
+        hash_threshold = int(np.iinfo(np.uint64).max)
+
+    return DistributionSummary(
+        family=family,
+        minimum=float(values.min()),
+        maximum=float(values.max()),
+        quantiles=np.quantile(values, np.linspace(0, 1, num_quantiles)),
+        sample=sample,
+        sample_hashes=sample_hashes,
+        hash_threshold=hash_threshold,
+        distinct_count=len(distinct),
+    )
+
+
+def _merge_overlap(a: np.ndarray, b: np.ndarray) -> int:
+    """Count values present in both sorted arrays"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not len(a):
+        return 0
+    pos = np.searchsorted(b, a)
+    pos[pos == len(b)] = len(b) - 1
+    return int(np.count_nonzero(b[pos] == a))
+
+
+def score_distributions(a: DistributionSummary, b: DistributionSummary) -> Tuple[float, float, float, float]:
+    """
+    Compare two summaries of the same family.
+    Returns (similarity, containment, range_overlap, quantile_similarity), all in 0-1.
+    """
+    low, high = max(a.minimum, b.minimum), min(a.maximum, b.maximum)
+    span = max(a.maximum, b.maximum) - min(a.minimum, b.minimum)
+    if high < low:
+        return 0.0, 0.0, 0.0, 0.0
+    range_overlap = (high - low) / span if span else 1.0
+
+    quantile_distance = float(np.mean(np.abs(a.quantiles - b.quantiles))) / span if span else 0.0
+    quantile_similarity = max(0.0, 1.0 - quantile_distance)
+
+    # Restrict both samples to the common hash range before the merge count
+    threshold = min(a.hash_threshold, b.hash_threshold)
+    sample_a = a.sample[a.sample_hashes <= np.uint64(threshold)]
+    sample_b = b.sample[b.sample_hashes <= np.uint64(threshold)]
+    smaller = min(len(sample_a), len(sample_b))
+    containment = _merge_overlap(sample_a, sample_b) / smaller if smaller else 0.0
+
+    # Containment alone cannot tell nested surrogate-key ranges (1..100 vs 1..300)
+    # apart from a real reference, so the distributions must also line up
+    similarity = containment * (range_overlap + quantile_similarity) / 2
+    return similarity, containment, range_overlap, quantile_similarity
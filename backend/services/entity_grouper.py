@@ -1,10 +1,92 @@
-from collections import defaultdict, deque
-from typing import List, Set, Dict, Optional
+from typing import Iterable, List, Set, Dict, Optional, Tuple, Union
 import re
 from collections import Counter
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+from backend.services.column_similarity import ColumnSimilarityTable
+
+
+class DisjointSet:
+    """
+    Union-find over integer ids 0..n-1 with path compression and union by rank.
+    Grows on demand, so ids can be interned while edges stream in.
+    """
+    def __init__(self, size: int = 0):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def _grow(self, size: int) -> None:
+        if size > len(self.parent):
+            self.parent.extend(range(len(self.parent), size))
+            self.rank.extend([0] * (size - len(self.rank)))
+
+    def find(self, node: int) -> int:
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        if a >= len(self.parent) or b >= len(self.parent):
+            self._grow(max(a, b) + 1)
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return root_a
+
+    def components(self) -> List[List[int]]:
+        """
+        Ids grouped by root, in id order. Ids never joined to another id are
+        left out: a non-root has been merged, and union by rank leaves every
+        root it merged into with rank >= 1.
+        """
+        groups: Dict[int, List[int]] = {}
+        parent, rank = self.parent, self.rank
+        for node in range(len(parent)):
+            if parent[node] != node or rank[node]:
+                groups.setdefault(self.find(node), []).append(node)
+        return list(groups.values())
+
+
+def _match_edges(matches: Union[ColumnSimilarityTable, Iterable[Dict]],
+                 threshold: float,
+                 names: List[str]) -> Iterable[Tuple[int, int]]:
+    """
+    Stream (source_id, target_id) for matches at or above threshold.
+    Dict matches are interned into `names` as they arrive.
+    """
+    if isinstance(matches, ColumnSimilarityTable):
+        names.extend(matches.column_names)
+        source, target, _ = matches.edge_arrays(threshold)
+        yield from zip(source.tolist(), target.tolist())
+        return
+
+    ids: Dict[str, int] = {}
+    for match in matches:
+        if match["similarity"] < threshold:
+            continue
+        pair = []
+        for name in (f"{match['source_table']}.{match['source_column']}",
+                     f"{match['target_table']}.{match['target_column']}"):
+            col_id = ids.get(name)
+            if col_id is None:
+                col_id = ids[name] = len(names)
+                names.append(name)
+            pair.append(col_id)
+        yield pair[0], pair[1]
+
 
 def group_columns_by_fuzzy_match(
-    matches: List[Dict],
+    matches: Union[ColumnSimilarityTable, Iterable[Dict]],
     threshold: float = 0.85,
     merge_overlap: bool = True,
     min_group_size: int = 2
@@ -14,80 +96,189 @@ def group_columns_by_fuzzy_match(
     returning sets of columns like {"tableA.col1", "tableB.colX"}.
 
     This version:
-      - Uses adjacency to connect columns with similarity >= threshold
-      - Optionally merges overlapping groups
+      - Streams edges with similarity >= threshold into a union-find over integer column ids
+      - Returns the connected components, which never overlap
       - Allows ignoring groups below min_group_size
 
     Args:
-        matches: List of match dicts from FuzzyEntityMatcher, e.g.:
+        matches: ColumnSimilarityTable from FuzzyEntityMatcher (consumed directly,
+                 one record per column pair), or an iterable of match dicts, e.g.:
                  [{"source_table": "A", "source_column": "col1",
                    "target_table": "B", "target_column": "colX",
                    "similarity": 0.9}, ...]
         threshold: Minimum similarity score (0.0 - 1.0) for adjacency
-        merge_overlap: If True, merges groups that share any node
+        merge_overlap: Kept for compatibility; components are already disjoint
         min_group_size: Groups smaller than this are excluded from the final result
 
     Returns:
         A list of sets, each containing column identifiers like 'table.column'.
     """
+    names: List[str] = []
+    forest = DisjointSet()
+    for src_id, tgt_id in _match_edges(matches, threshold, names):
+        forest.union(src_id, tgt_id)
 
-    # 1) Build adjacency (undirected graph) of columns
-    adjacency = defaultdict(set)
-    for match in matches:
-        if match["similarity"] >= threshold:
-            src = f"{match['source_table']}.{match['source_column']}"
-            tgt = f"{match['target_table']}.{match['target_column']}"
-            adjacency[src].add(tgt)
-            adjacency[tgt].add(src)
-
-    # 2) Find connected components (DFS or BFS)
-    visited = set()
-    raw_groups = []
-
-    def bfs(start):
-        queue = deque([start])
-        group = set()
-        visited.add(start)
-        while queue:
-            node = queue.popleft()
-            group.add(node)
-            for neighbor in adjacency[node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-        return group
-
-    for node in adjacency:
-        if node not in visited:
-            component = bfs(node)
-            raw_groups.append(component)
-
-    # 3) Optionally merge overlapping groups
-    #    Because BFS already merges connected nodes, raw_groups
-    #    might not overlap. But if there are partially connected
-    #    subgraphs, you can unify them. Usually BFS is enough.
-    if merge_overlap:
-        merged = True
-        while merged:
-            merged = False
-            new_groups = []
-            while raw_groups:
-                g1 = raw_groups.pop()
-                overlap_found = False
-                for i, g2 in enumerate(new_groups):
-                    if g1 & g2:  # Overlap
-                        new_groups[i] = g1 | g2
-                        overlap_found = True
-                        merged = True
-                        break
-                if not overlap_found:
-                    new_groups.append(g1)
-            raw_groups = new_groups
-
-    # 4) Filter out small groups if desired
-    final_groups = [g for g in raw_groups if len(g) >= min_group_size]
-
-    return final_groups
+    return [
+        {names[col_id] for col_id in component}
+        for component in forest.components()
+        if len(component) >= min_group_size
+    ]
+
+
+def _similarity_matrix(matches: Union[ColumnSimilarityTable, Iterable[Dict]],
+                       threshold: float) -> Tuple[sparse.csr_matrix, List[str]]:
+    """Symmetric CSR matrix of edge weights >= threshold, keeping the strongest weight per pair"""
+    if isinstance(matches, ColumnSimilarityTable):
+        names = list(matches.column_names)
+        source, target, weight = matches.edge_arrays(threshold)
+    else:
+        names = []
+        rows, cols, weights = [], [], []
+        ids: Dict[str, int] = {}
+        for match in matches:
+            if match["similarity"] < threshold:
+                continue
+            for name, bucket in ((f"{match['source_table']}.{match['source_column']}", rows),
+                                 (f"{match['target_table']}.{match['target_column']}", cols)):
+                col_id = ids.get(name)
+                if col_id is None:
+                    col_id = ids[name] = len(names)
+                    names.append(name)
+                bucket.append(col_id)
+            weights.append(match["similarity"])
+        source = np.asarray(rows, dtype=np.int64)
+        target = np.asarray(cols, dtype=np.int64)
+        weight = np.asarray(weights, dtype=np.float64)
+
+    keep = source != target
+    source, target, weight = source[keep], target[keep], weight[keep]
+    # Both directions, then the maximum per (row, col): sort by weight so the
+    # last duplicate wins when the COO entries are collapsed below
+    row = np.concatenate([source, target])
+    col = np.concatenate([target, source])
+    weight = np.concatenate([weight, weight])
+    order = np.lexsort((weight, col, row))
+    row, col, weight = row[order], col[order], weight[order]
+    last = np.ones(len(row), dtype=bool)
+    last[:-1] = (row[1:] != row[:-1]) | (col[1:] != col[:-1])
+    n = len(names)
+    matrix = sparse.csr_matrix((weight[last], (row[last], col[last])), shape=(n, n))
+    return matrix, names
+
+
+def _mutual_knn(matrix: sparse.csr_matrix, k: int) -> sparse.csr_matrix:
+    """Keep edge (i, j) only if each endpoint is among the other's k strongest neighbours"""
+    counts = np.diff(matrix.indptr)
+    row = np.repeat(np.arange(matrix.shape[0]), counts)
+    order = np.lexsort((-matrix.data, row))
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order)) - matrix.indptr[row[order]]
+
+    top = matrix.copy()
+    top.data = np.where(rank < k, top.data, 0.0)
+    top.eliminate_zeros()
+    mask = top.copy()
+    mask.data[:] = 1.0
+    return top.multiply(mask.T).tocsr()
+
+
+def _qualifies(size: int, edges: int, max_group_size: int, min_density: float) -> bool:
+    possible = size * (size - 1) / 2
+    return size <= max_group_size and (not possible or edges / possible >= min_density)
+
+
+def _split_component(matrix: sparse.csr_matrix,
+                     nodes: np.ndarray,
+                     threshold: float,
+                     max_group_size: int,
+                     min_density: float,
+                     threshold_step: float) -> List[np.ndarray]:
+    """
+    Raise the edge threshold inside an oversized or sparse component until
+    every piece is small and dense enough, or has no edges left.
+    `matrix` is the component's own submatrix, indexed like `nodes`.
+    """
+    if _qualifies(len(nodes), matrix.nnz // 2, max_group_size, min_density):
+        return [nodes]
+
+    result = []
+    pending = [(matrix, nodes, threshold)]
+    while pending:
+        sub, nodes, threshold = pending.pop()
+        # Always drop at least the weakest edges, even if they sit above threshold + step
+        threshold = max(threshold + threshold_step, float(np.nextafter(sub.data.min(), np.inf)))
+        sub = sub.copy()
+        sub.data = np.where(sub.data >= threshold, sub.data, 0.0)
+        sub.eliminate_zeros()
+        if not sub.nnz:
+            continue
+
+        count, labels = connected_components(sub, directed=False)
+        sizes = np.bincount(labels, minlength=count)
+        # Each undirected edge is stored twice and never crosses components
+        edges = np.bincount(labels[sub.indices], minlength=count) // 2
+        order = np.argsort(labels, kind='stable')
+        bounds = np.concatenate([[0], np.cumsum(sizes)])
+        for label in np.flatnonzero(sizes > 1).tolist():
+            local = order[bounds[label]:bounds[label + 1]]
+            if _qualifies(int(sizes[label]), int(edges[label]), max_group_size, min_density):
+                result.append(nodes[local])
+            else:
+                pending.append((sub[local][:, local].tocsr(), nodes[local], threshold))
+    return result
+
+
+def cluster_columns_by_similarity(
+    matches: Union[ColumnSimilarityTable, Iterable[Dict]],
+    threshold: float = 0.85,
+    mutual_knn: Optional[int] = 10,
+    max_group_size: int = 50,
+    min_density: float = 0.1,
+    threshold_step: float = 0.05,
+    min_group_size: int = 2
+) -> List[Set[str]]:
+    """
+    Weighted alternative to group_columns_by_fuzzy_match for large uploads,
+    where a single weak edge would otherwise chain unrelated columns together.
+
+    This version:
+      - Builds a sparse symmetric similarity matrix from edges >= threshold
+      - Optionally keeps only mutual k-nearest-neighbour edges
+      - Splits components larger than max_group_size, or with edge density
+        below min_density, by raising their edge threshold in threshold_step
+        increments until each piece qualifies
+
+    Args:
+        matches: ColumnSimilarityTable or iterable of match dicts (see group_columns_by_fuzzy_match)
+        threshold: Minimum similarity score (0.0 - 1.0) for an edge
+        mutual_knn: Neighbours per column for the mutual-kNN filter, or None to skip it
+        max_group_size: Components above this size are split
+        min_density: Share of possible edges a component must have to be kept whole
+        threshold_step: Threshold increment used while splitting
+        min_group_size: Groups smaller than this are excluded from the final result
+
+    Returns:
+        A list of sets, each containing column identifiers like 'table.column'.
+    """
+    matrix, names = _similarity_matrix(matches, threshold)
+    if not matrix.nnz:
+        return []
+    if mutual_knn:
+        matrix = _mutual_knn(matrix, mutual_knn)
+
+    count, labels = connected_components(matrix, directed=False)
+    sizes = np.bincount(labels, minlength=count)
+    order = np.argsort(labels, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+
+    groups = []
+    for label in np.flatnonzero(sizes >= max(min_group_size, 2)).tolist():
+        nodes = order[bounds[label]:bounds[label + 1]]
+        sub = matrix[nodes][:, nodes].tocsr()
+        for piece in _split_component(sub, nodes, threshold, max_group_size, min_density, threshold_step):
+            if len(piece) >= min_group_size:
+                groups.append({names[col_id] for col_id in piece.tolist()})
+    return groups
 
 
 def suggest_canonical_names(
@@ -1,38 +1,75 @@
 # backend/services/fuzzy_matching.py
+import math
 import string
+import threading
+import weakref
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, Hashable, List, Tuple, Optional
+import numpy as np
 import pandas as pd
 from rapidfuzz import process, fuzz, utils as fuzz_utils
 from unidecode import unidecode
 import logging
+from backend.config import Config
 from backend.models.schema_models import TableProfile
+from backend.services.column_blocking import ColumnBlocker, ColumnSignature, type_family
+from backend.services.column_cache import COLUMN_CACHE, content_hash
+from backend.services.column_similarity import ColumnSimilarityTable
+from backend.services.distribution_matching import (
+    DistributionSummary, distribution_family, score_distributions, summarize_column
+)
+from backend.services.qgram_index import QGramIndex
+from backend.services.worker_pool import get_matcher_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Threads per process.cdist call; column pairs already run in parallel on the shared pool
+CDIST_WORKERS = 1
+
 # Translation table for removing punctuation
 TRANSLATION_TABLE = str.maketrans('', '', string.punctuation + ' ')
 
 class LRUCache:
-    """Least Recently Used cache for storing processed column data"""
+    """Thread-safe Least Recently Used cache"""
     def __init__(self, maxsize: int = 10000):
         self.maxsize = maxsize
         self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                # Move to end to mark as recently used
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            except KeyError:
+                return None
 
-    def get(self, key: Tuple[str, str]) -> Optional[pd.Series]:
-        try:
-            # Move to end to mark as recently used
-            value = self._cache.pop(key)
-            self._cache[key] = value
-            return value
-        except KeyError:
-            return None
-
-    def set(self, key: Tuple[str, str], value: pd.Series) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._set(key, value)
+
+    def get_many(self, keys: List[Hashable]) -> List[Any]:
+        """Look up several keys under a single lock acquisition (None for misses)"""
+        found = []
+        with self._lock:
+            for key in keys:
+                try:
+                    self._cache.move_to_end(key)
+                    found.append(self._cache[key])
+                except KeyError:
+                    found.append(None)
+        return found
+
+    def set_many(self, items: List[Tuple[Hashable, Any]]) -> None:
+        with self._lock:
+            for key, value in items:
+                self._set(key, value)
+
+    def _set(self, key: Hashable, value: Any) -> None:
         if key in self._cache:
             # Update existing key
             self._cache.pop(key)
@@ -41,58 +78,226 @@ class LRUCache:
             self._cache.popitem(last=False)
         self._cache[key] = value
 
+# Process-wide cache of raw value -> normalized value, shared by every matcher and request
+NORMALIZED_VALUE_CACHE = LRUCache(maxsize=Config.NORMALIZED_VALUE_CACHE_SIZE)
+
+# Marks values whose normalization is empty, so they can be cached as well
+_EMPTY = ''
+
+
+def normalize_value(value) -> Optional[str]:
+    """Text normalization pipeline"""
+    try:
+        text = str(value)
+
+        # Unicode normalization (ASCII input is already transliterated) and case folding
+        if not text.isascii():
+            text = unidecode(text)
+        text = text.casefold()
+
+        # Remove punctuation and whitespace
+        text = text.translate(TRANSLATION_TABLE)
+
+        # RapidFuzz default processing
+        return fuzz_utils.default_process(text) or None
+    except Exception as e:
+        logger.warning(f"Normalization error for value '{value}':{str(e)}")
+        return None
+
+
+def normalize_distinct(values) -> List[Optional[str]]:
+    """Normalize distinct non-null values through the process-wide cache"""
+    keys = [str(v) for v in values]
+    normalized = NORMALIZED_VALUE_CACHE.get_many(keys)
+
+    misses = []
+    for pos, cached in enumerate(normalized):
+        if cached is None:
+            result = normalize_value(keys[pos])
+            normalized[pos] = result
+            misses.append((keys[pos], result if result is not None else _EMPTY))
+    NORMALIZED_VALUE_CACHE.set_many(misses)
+
+    return [value or None for value in normalized]
+
 class FuzzyEntityMatcher:
     """Production-grade fuzzy entity matching system"""
     def __init__(self, config: Dict = None):
         self.config = {
             'scorer': fuzz.WRatio,  # Weighted Ratio scorer
             'score_cutoff': 90,      # Minimum similarity score (0-100)
-            'chunk_size': 1000,      # Rows per processing chunk
-            'max_workers': 4,        # Thread pool size
-            'cache_size': 10000,     # Max cached columns
+            'max_workers': Config.MATCHER_MAX_WORKERS,  # Column pairs this matcher keeps in flight on the shared pool
+            'batch_mode': True,      # Score all distinct values at once via process.cdist
+            'cdist_workers': CDIST_WORKERS,  # Threads per process.cdist call
+            'blocking': True,        # Prune column pairs with MinHash/LSH signatures
+            'qgram_index_threshold': 1000,  # Distinct targets above which a q-gram index is used
+            'qgram_candidates': 50,  # Targets shortlisted per source value by the index
+            'early_stop': True,      # Stop scoring once the match rate is clearly above/below threshold
+            'early_stop_batch': 50,  # Source values scored between interval checks
+            'early_stop_z': 1.96,    # z-score of the match-rate confidence interval (95%)
+            'match_rate_threshold': 0.75,  # Match rate the interval is tested against
+            'distribution_matching': True,  # Compare numeric/date columns by distribution overlap
+            'distribution_min_distinct': 10,  # Skip low-cardinality numeric/date columns (flags, counts)
             **(config or {})
         }
         
         # Initialize components
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.config['max_workers']
-        )
-        self.cache = LRUCache(maxsize=self.config['cache_size'])
+        # Column artifacts live in the process-wide COLUMN_CACHE, keyed by content
+        # id(Series) -> (weakref to it, content hash); the weakref guards against id reuse
+        self._content_keys: Dict[int, Tuple[weakref.ref, str]] = {}
         self.seen_pairs = set()
+        self.blocker = ColumnBlocker()
+        self.stats = {}
+        self._stats_lock = threading.Lock()
 
     def find_matches_across_tables(self, 
                                 schema: Dict[str, TableProfile],
-                                data_samples: Dict[str, Dict[str, pd.Series]]) -> List[Dict]:
+                                data_samples: Dict[str, Dict[str, pd.Series]]) -> ColumnSimilarityTable:
         """
         Main entry point: Find matches across all tables and columns
         Args:
             schema: Dictionary of {table: {column: metadata}}
             data_samples: Dictionary of {table: {column: pd.Series}}
         Returns:
-            List of match dictionaries with scoring metadata
+            ColumnSimilarityTable with one aggregated record per matched column pair
         """
-        matches = []
-        table_pairs = self._generate_table_pairs(list(schema.keys()))
-        
-        for source_table, target_table in table_pairs:
-            source_profile = schema[source_table]
-            target_profile = schema[target_table]
-
-            source_cols = self._get_match_candidates(source_profile)
-            target_cols = self._get_match_candidates(target_profile)
-            
-            for src_col in source_cols:
-                for tgt_col in target_cols:
-                    if self._should_skip_match(source_table, src_col, target_table, tgt_col):
+        similarities = ColumnSimilarityTable()
+        column_pairs = [
+            (source, target)
+            for source, target in self._candidate_column_pairs(schema, data_samples)
+            if not self._should_skip_match(source[0], source[1], target[0], target[1])
+        ]
+
+        # rapidfuzz scorers release the GIL, so column pairs run in parallel on the
+        # application-wide pool; results come back in pair order
+        def match_pair(pair):
+            (source_table, src_col), (target_table, tgt_col) = pair
+            return self._match_columns(
+                source_table, src_col, data_samples[source_table][src_col],
+                target_table, tgt_col, data_samples[target_table][tgt_col]
+            )
+
+        pool = get_matcher_pool()
+        results = pool.map_ordered(match_pair, column_pairs, window=self.config['max_workers'])
+        for ((source_table, src_col), (target_table, tgt_col)), summary in zip(column_pairs, results):
+            if summary is not None:
+                similarities.add(source_table, src_col, target_table, tgt_col, *summary)
+
+        if self.config.get('distribution_matching', True):
+            self._match_distributions(schema, data_samples, similarities)
+
+        if self.stats.get('values_sampled'):
+            logger.info(
+                f"Early termination scored {self.stats['values_scored']} of "
+                f"{self.stats['values_sampled']} sampled source values"
+            )
+        self.stats['column_cache'] = COLUMN_CACHE.stats()
+        logger.info(
+            f"Column cache: hit ratio {self.stats['column_cache']['hit_ratio']:.2%}, "
+            f"{self.stats['column_cache']['resident_bytes'] / 2**20:.1f} MiB resident"
+        )
+        return similarities
+
+    def _candidate_column_pairs(self,
+                                schema: Dict[str, TableProfile],
+                                data_samples: Dict[str, Dict[str, pd.Series]]) -> List[Tuple[Tuple[str, str], Tuple[str, str]]]:
+        """
+        Emit ((source_table, source_col), (target_table, target_col)) pairs worth
+        matching at value level. With blocking enabled, only pairs whose column
+        signatures collide in the LSH index are kept.
+        """
+        all_pairs = []
+        for source_table, target_table in self._generate_table_pairs(list(schema.keys())):
+            source_cols = self._get_match_candidates(schema[source_table])
+            target_cols = self._get_match_candidates(schema[target_table])
+            all_pairs.extend(
+                ((source_table, src_col), (target_table, tgt_col))
+                for src_col in source_cols
+                for tgt_col in target_cols
+            )
+
+        self.stats['column_pairs_total'] = len(all_pairs)
+        if not self.config.get('blocking', True) or not all_pairs:
+            self.stats['column_pairs_pruned'] = 0
+            return all_pairs
+
+        table_order = {table: i for i, table in enumerate(schema)}
+        columns = sorted(
+            {col for pair in all_pairs for col in pair},
+            key=lambda c: (table_order[c[0]], c[1])
+        )
+        signatures = [
+            self._column_signature(table, col, schema[table].columns[col].detected_type, data_samples[table][col])
+            for table, col in columns
+        ]
+        candidates = [
+            (columns[i], columns[j])
+            for i, j in self.blocker.candidate_pairs(signatures)
+        ]
+
+        self.stats['column_pairs_pruned'] = len(all_pairs) - len(candidates)
+        logger.info(
+            f"Column blocking kept {len(candidates)} of {len(all_pairs)} column pairs "
+            f"({self.stats['column_pairs_pruned']} pruned)"
+        )
+        return candidates
+
+    def _match_distributions(self,
+                             schema: Dict[str, TableProfile],
+                             data_samples: Dict[str, Dict[str, pd.Series]],
+                             similarities: ColumnSimilarityTable) -> None:
+        """
+        Link numeric and date columns across tables by comparing compact
+        distribution summaries (range, quantiles, sorted-sample overlap).
+        """
+        summaries: Dict[str, List[Tuple[str, str, DistributionSummary]]] = {'numeric': [], 'date': []}
+        for table, profile in schema.items():
+            for col_name, col_meta in profile.columns.items():
+                family = distribution_family(col_meta.detected_type)
+                if family is None:
+                    continue
+                summary = self._distribution_summary(data_samples[table][col_name], family)
+                if summary is not None and summary.distinct_count >= self.config.get('distribution_min_distinct', 10):
+                    summaries[family].append((table, col_name, summary))
+
+        threshold = self.config.get('match_rate_threshold', 0.75)
+        compared = linked = 0
+        for columns in summaries.values():
+            # Sweep in order of minimum value so pairs with disjoint ranges are never scored
+            columns.sort(key=lambda c: c[2].minimum)
+            for i, (src_table, src_col, src_summary) in enumerate(columns):
+                for tgt_table, tgt_col, tgt_summary in columns[i + 1:]:
+                    if tgt_summary.minimum > src_summary.maximum:
+                        break
+                    if src_table == tgt_table or self._should_skip_match(src_table, src_col, tgt_table, tgt_col):
                         continue
-                    
-                    column_matches = self._match_columns(
-                        source_table, src_col, data_samples[source_table][src_col],
-                        target_table, tgt_col, data_samples[target_table][tgt_col]
-                    )
-                    matches.extend(column_matches)
-        
-        return self._filter_matches(matches)
+                    compared += 1
+                    similarity, containment, _, quantile_similarity = score_distributions(src_summary, tgt_summary)
+                    if similarity >= threshold:
+                        linked += 1
+                        similarities.add(
+                            src_table, src_col, tgt_table, tgt_col,
+                            similarity, quantile_similarity, containment,
+                            min(len(src_summary.sample), len(tgt_summary.sample)),
+                            kind='distribution'
+                        )
+
+        self.stats['distribution_pairs_compared'] = compared
+        self.stats['distribution_pairs_linked'] = linked
+
+    def _distribution_summary(self, data: pd.Series, family: str) -> Optional[DistributionSummary]:
+        """Distribution summary of a numeric/date column, cached process-wide by content"""
+        cache_key = ('distribution', family, self._content_key(data))
+        summary = COLUMN_CACHE.get(cache_key)
+        if summary is None:
+            try:
+                summary = summarize_column(data, family)
+            except Exception as e:
+                logger.warning(f"Distribution summary failed: {e}")
+                return None
+            if summary is not None:
+                COLUMN_CACHE.put(cache_key, summary)
+        return summary
 
     def _match_columns(self,
                     src_table: str,
@@ -100,89 +305,254 @@ class FuzzyEntityMatcher:
                     src_data: pd.Series,
                     tgt_table: str,
                     tgt_col: str,
-                    tgt_data: pd.Series) -> List[Dict]:
-        """Optimized column matching with sampling and speed improvements"""
+                    tgt_data: pd.Series) -> Optional[Tuple[float, float, float, int]]:
+        """
+        Optimized column matching with sampling and speed improvements.
+        Returns (match_rate, mean_score, exact_ratio, values_scored), or None when
+        no source value matched.
+        """
         try:
-            # Sample large columns for faster processing
-            if len(src_data) > 500:
-                src_data = src_data.sample(n=500, random_state=42)
-            if len(tgt_data) > 1000:
-                return []
+            # Preprocess and normalize values (cached per whole column)
+            src_processed = self._preprocess_column(src_data)
+            tgt_processed = self._preprocess_column(tgt_data)
 
-            # Preprocess and normalize values
-            src_processed = self._preprocess_column(src_data, (src_table, src_col))
-            tgt_processed = self._preprocess_column(tgt_data, (tgt_table, tgt_col))
+            # Sample at most 500 values, always in random order: early termination
+            # assumes a random sample, and files are often sorted or clustered
+            sampled_idx = src_data.sample(n=min(len(src_data), 500), random_state=42).index
+            src_processed = src_processed.reindex(sampled_idx).dropna()
 
             # Build target lookup index
             tgt_index = self._create_lookup_index(tgt_processed)
 
-            matches = []
-            for idx, value in src_processed.items():
-                if not value:
-                    continue
+            # Large targets: shortlist candidates through a q-gram index before scoring
+            if len(tgt_index) > self.config.get('qgram_index_threshold', 1000):
+                index_key = ('qgram_index', self._content_key(tgt_data))
+                index = COLUMN_CACHE.get(index_key)
+                if index is None:
+                    index = QGramIndex(list(tgt_index.keys()))
+                    COLUMN_CACHE.put(index_key, index)
+                resolve = partial(self._resolve_indexed, index=index)
+            elif self.config.get('batch_mode', True):
+                resolve = self._resolve_distinct_values
+            else:
+                resolve = self._resolve_iterative
+
+            return self._score_sequential(src_processed, tgt_index, resolve)
 
-                # Fast exact match
-                if value in tgt_index:
-                    matches.append({
-                        'source_idx': idx,
-                        'target_idx': tgt_index[value],
-                        'score': 1.0,
-                        'type': 'exact'
-                    })
+        except Exception as e:
+            logger.error(f"Fuzzy match failed: {src_table}.{src_col} <-> {tgt_table}.{tgt_col}:{e}")
+            return None
+
+    def _score_sequential(self,
+                          src_processed: pd.Series,
+                          tgt_index: Dict[str, int],
+                          resolve) -> Optional[Tuple[float, float, float, int]]:
+        """
+        Score source values in small batches while tracking a confidence interval on
+        the match rate. Stops as soon as the interval lies entirely above or below
+        match_rate_threshold, since more values cannot change the verdict.
+        """
+        batch_size = self.config.get('early_stop_batch', 50) if self.config.get('early_stop', True) else len(src_processed)
+        resolved: Dict[str, Tuple[int, float, str]] = {}
+        attempted = set()
+        scored = matched = exact = 0
+        score_sum = 0.0
+
+        for start in range(0, len(src_processed), max(batch_size, 1)):
+            batch = src_processed.iloc[start:start + batch_size]
+            new_values = [v for v in pd.unique(batch.to_numpy()) if v and v not in attempted]
+            attempted.update(new_values)
+            resolved.update(resolve(new_values, tgt_index))
+
+            # Aggregate per distinct value instead of materializing per-row matches
+            for value, count in batch.value_counts(sort=False).items():
+                hit = resolved.get(value)
+                if hit is None:
                     continue
+                matched += count
+                score_sum += hit[1] * count
+                if hit[2] == 'exact':
+                    exact += count
+            scored += len(batch)
+            if self._match_rate_decided(matched, scored):
+                break
+
+        with self._stats_lock:
+            self.stats['values_sampled'] = self.stats.get('values_sampled', 0) + len(src_processed)
+            self.stats['values_scored'] = self.stats.get('values_scored', 0) + scored
+        if not matched:
+            return None
+        return matched / scored, score_sum / matched, exact / matched, scored
+
+    def _match_rate_decided(self, matched: int, scored: int) -> bool:
+        """True once the Wilson interval of the match rate excludes the threshold"""
+        if not self.config.get('early_stop', True) or not scored:
+            return False
+        threshold = self.config.get('match_rate_threshold', 0.75)
+        z = self.config.get('early_stop_z', 1.96)
+
+        rate = matched / scored
+        denom = 1 + z * z / scored
+        centre = (rate + z * z / (2 * scored)) / denom
+        half_width = z * math.sqrt(rate * (1 - rate) / scored + z * z / (4 * scored * scored)) / denom
+        return centre - half_width > threshold or centre + half_width < threshold
+
+    def _resolve_iterative(self, values, tgt_index: Dict[str, int]) -> Dict[str, Tuple[int, float, str]]:
+        """Score distinct source values one at a time against the target index"""
+        resolved = {}
+        for value in values:
+            # Fast exact match
+            if value in tgt_index:
+                resolved[value] = (tgt_index[value], 1.0, 'exact')
+                continue
 
-                # Fast fuzzy match (sampled + faster scorer)
-                result = process.extractOne(
-                    query=value,
-                    choices=tgt_index.keys(),
-                    scorer=fuzz.partial_ratio,  # ⏩ faster than WRatio
-                    score_cutoff=self.config.get('score_cutoff', 75)
-                )
+            # Fast fuzzy match (sampled + faster scorer)
+            result = process.extractOne(
+                query=value,
+                choices=tgt_index.keys(),
+                scorer=fuzz.partial_ratio,  # ⏩ faster than WRatio
+                score_cutoff=self.config.get('score_cutoff', 75)
+            )
 
-                if result:
-                    matched_value, score, _ = result
-                    matches.append({
-                        'source_idx': idx,
-                        'target_idx': tgt_index[matched_value],
-                        'score': score / 100,
-                        'type': 'fuzzy'
-                    })
+            if result:
+                matched_value, score, _ = result
+                resolved[value] = (tgt_index[matched_value], score / 100, 'fuzzy')
 
-            return matches
+        return resolved
 
-        except Exception as e:
-            logger.error(f"Fuzzy match failed: {src_table}.{src_col} <-> {tgt_table}.{tgt_col}:{e}")
-            return []
+    def _resolve_indexed(self,
+                         values,
+                         tgt_index: Dict[str, int],
+                         index: QGramIndex) -> Dict[str, Tuple[int, float, str]]:
+        """Score each distinct source value only against its q-gram shortlist"""
+        score_cutoff = self.config.get('score_cutoff', 75)
+        limit = self.config.get('qgram_candidates', 50)
+        resolved = {}
+
+        for value in values:
+            if value in tgt_index:
+                resolved[value] = (tgt_index[value], 1.0, 'exact')
+                continue
+
+            shortlist = [index.values[i] for i in index.candidates(value, limit)]
+            if not shortlist:
+                continue
+            result = process.extractOne(
+                value,
+                shortlist,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=score_cutoff
+            )
+            if result:
+                matched_value, score, _ = result
+                resolved[value] = (tgt_index[matched_value], score / 100, 'fuzzy')
+
+        return resolved
+
+    def _resolve_distinct_values(self, values, tgt_index: Dict[str, int]) -> Dict[str, Tuple[int, float, str]]:
+        """
+        Score distinct source values against every distinct target value in one
+        similarity matrix and pick best matches with a vectorized argmax.
+        Returns the same best targets as _resolve_iterative.
+        """
+        resolved = {}
+        queries = []
+        for value in values:
+            if value in tgt_index:
+                resolved[value] = (tgt_index[value], 1.0, 'exact')
+            else:
+                queries.append(value)
+
+        if not queries or not tgt_index:
+            return resolved
+
+        choices = list(tgt_index.keys())
+        score_cutoff = self.config.get('score_cutoff', 75)
+        scores = process.cdist(
+            queries,
+            choices,
+            scorer=fuzz.partial_ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.uint8,
+            workers=self.config.get('cdist_workers', CDIST_WORKERS)
+        )
+
+        best_cols = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(queries)), best_cols]
+        matched_rows = np.flatnonzero(best_scores)
+        # uint8 rounding can tie choices that differ in the exact score; re-rank those
+        tied_rows = set(np.flatnonzero((scores == best_scores[:, None]).sum(axis=1) > 1).tolist())
+
+        for row in matched_rows.tolist():
+            query = queries[row]
+            if row in tied_rows:
+                tied = np.flatnonzero(scores[row] == best_scores[row])
+                matched_value, score, _ = process.extractOne(
+                    query,
+                    [choices[col] for col in tied],
+                    scorer=fuzz.partial_ratio
+                )
+            else:
+                matched_value = choices[best_cols[row]]
+                score = fuzz.partial_ratio(query, matched_value)
+            resolved[query] = (tgt_index[matched_value], score / 100, 'fuzzy')
 
-    def _preprocess_column(self, 
-                          data: pd.Series,
-                          cache_key: Tuple[str, str]) -> pd.Series:
-        """Normalize and cache column data"""
-        cached = self.cache.get(cache_key)
+        return resolved
+
+    def _content_key(self, data: pd.Series) -> str:
+        """
+        Content hash of a column, computed once per Series object. Memoized by
+        id() for speed, but only trusted while the weakref still points at the
+        same object: CPython reuses the ids of collected Series.
+        """
+        entry = self._content_keys.get(id(data))
+        if entry is not None and entry[0]() is data:
+            return entry[1]
+
+        key = content_hash(data)
+        data_id = id(data)
+        keys = self._content_keys
+
+        def forget(ref, data_id=data_id):
+            current = keys.get(data_id)
+            if current is not None and current[0] is ref:
+                del keys[data_id]
+
+        keys[data_id] = (weakref.ref(data, forget), key)
+        return key
+
+    def _preprocess_column(self, data: pd.Series) -> pd.Series:
+        """Normalize column data, cached process-wide by column content"""
+        cache_key = ('normalized', self._content_key(data))
+        cached = COLUMN_CACHE.get(cache_key)
         if cached is not None:
             return cached
-            
-        processed = data.apply(self._normalize_value).dropna()
-        self.cache.set(cache_key, processed)
+
+        # Normalize each distinct value once and map results back through the codes
+        codes, uniques = pd.factorize(data)
+        lookup = np.array(normalize_distinct(uniques) + [None], dtype=object)
+        processed = pd.Series(lookup[codes], index=data.index, dtype=object).dropna()
+        COLUMN_CACHE.put(cache_key, processed)
         return processed
 
+    def _column_signature(self,
+                          table: str,
+                          column: str,
+                          detected_type: str,
+                          data: pd.Series) -> ColumnSignature:
+        """Blocking signature of a column; the content-dependent part is cached process-wide"""
+        cache_key = ('signature', self.blocker.params, self._content_key(data))
+        profile = COLUMN_CACHE.get(cache_key)
+        if profile is None:
+            profile = self.blocker.profile(self._preprocess_column(data))
+            COLUMN_CACHE.put(cache_key, profile)
+        return ColumnSignature(table, column, type_family(detected_type), *profile)
+
     def _normalize_value(self, value) -> Optional[str]:
         """Text normalization pipeline"""
-        try:
-            if pd.isna(value):
-                return None
-                
-            # Unicode normalization and case folding
-            text = unidecode(str(value)).casefold()
-            
-            # Remove punctuation and whitespace
-            text = text.translate(TRANSLATION_TABLE)
-            
-            # RapidFuzz default processing
-            return fuzz_utils.default_process(text) or None
-        except Exception as e:
-            logger.warning(f"Normalization error for value '{value}':{str(e)}")
+        if pd.isna(value):
             return None
+        return normalize_value(value)
 
     def _create_lookup_index(self, processed_series: pd.Series) -> Dict[str, int]:
         """Create reverse index of normalized values to original indices"""
@@ -192,58 +562,6 @@ class FuzzyEntityMatcher:
             if value is not None
         }
 
-    def _chunk_generator(self, series: pd.Series):
-        """Generate chunks of data for memory efficiency"""
-        for i in range(0, len(series), self.config['chunk_size']):
-            yield series.iloc[i:i + self.config['chunk_size']]
-
-    def _process_chunk(self, chunk: pd.Series, tgt_index: Dict[str, int]):
-        """Process a chunk of data using thread pool"""
-        futures = [
-            self.executor.submit(
-                self._find_match,
-                (idx, value),
-                tgt_index
-            )
-            for idx, value in chunk.items()
-        ]
-        return [f.result() for f in futures if f.result() is not None]
-
-    def _find_match(self, 
-                   source_item: Tuple[int, str],
-                   tgt_index: Dict[str, int]) -> Optional[Dict]:
-        """Find best match for a single value"""
-        idx, value = source_item
-        if not value:
-            return None
-        
-        # First check exact match
-        if value in tgt_index:
-            return {
-                'source_idx': idx,
-                'target_idx': tgt_index[value],
-                'score': 1.0,
-                'type': 'exact'
-            }
-        
-        # Then fuzzy match
-        result = process.extractOne(
-            query=value,
-            choices=tgt_index.keys(),
-            scorer=self.config['scorer'],
-            score_cutoff=self.config['score_cutoff']
-        )
-        
-        if result:
-            matched_value, score, _ = result
-            return {
-                'source_idx': idx,
-                'target_idx': tgt_index[matched_value],
-                'score': score / 100,
-                'type': 'fuzzy'
-            }
-        return None
-
     def _generate_table_pairs(self, tables):
         """Generate all unique table pairs from a list of table names"""
         return [
@@ -277,28 +595,3 @@ class FuzzyEntityMatcher:
             return True
         self.seen_pairs.add(pair_key)
         return False
-
-    def _filter_matches(self, matches: List[Dict]) -> List[Dict]:
-        """Filter and deduplicate matches safely"""
-        required_keys = {'source_value', 'target_value', 'source_table', 'target_table'}
-        seen = set()
-        filtered = []
-
-        for match in sorted(matches, key=lambda x: -x.get('similarity', 0)):
-            if not required_keys.issubset(match):
-                # Optional: log or skip silently
-                continue
-
-            match_key = (
-                match['source_value'],
-                match['target_value'],
-                match['source_table'],
-                match['target_table']
-            )
-
-            if match_key not in seen:
-                seen.add(match_key)
-                filtered.append(match)
-
-        return filtered
-    
@@ -0,0 +1,189 @@
+# backend/services/index_advisor.py
+import hashlib
+import re
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Set, Tuple
+from backend.services.column_stats import ColumnStats
+from backend.services.schema_ir import ColumnIR, IndexIR, SchemaIR, TableIR
+from backend.services.type_inference import INTEGER_TYPES, numeric_type
+
+# Below this many rows an index rarely beats a sequential scan
+MIN_ROWS_FOR_INDEX = 1_000
+# BRIN pays off only on large, physically ordered tables
+MIN_ROWS_FOR_BRIN = 100_000
+# Columns at least this sparse get partial indexes (WHERE col IS NOT NULL)
+SPARSE_NULL_FRACTION = 0.8
+# Non-key columns at least this selective are lookup-index candidates...
+SELECTIVE_DISTINCT_RATIO = 0.9
+# ...if they are narrow and named like identifiers
+MAX_LOOKUP_WIDTH = 64
+IDENTIFIER_NAME = re.compile(r'(^|_)(id|code|key|number|no|num|email|sku|uuid|ref|slug|username)$')
+# Advisory (non-FK) indexes per table
+MAX_ADVISED_INDEXES = 3
+# Postgres truncates identifiers to 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+UNINDEXABLE_TYPES = {"TEXT", "BOOLEAN", "FLOAT", "DOUBLE", "REAL", "JSON", "JSONB"}
+
+
+@dataclass(frozen=True)
+class TypeAdvice:
+    table: str
+    column: str
+    current: str
+    suggested: str
+    reason: str
+
+
+def _index_name(table: str, columns: Tuple[str, ...], suffix: str) -> str:
+    name = f"{table}_{'_'.join(columns)}_{suffix}"
+    if len(name) <= MAX_IDENTIFIER_LENGTH:
+        return name
+    # A bare cut would give long names sharing a prefix the same index name
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return f"{name[:MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+
+
+def _sparse_column(column: str, stats: Optional[ColumnStats]) -> Optional[str]:
+    """The column, if sparse enough to index only its non-null rows"""
+    if stats is not None and stats.null_fraction >= SPARSE_NULL_FRACTION:
+        return column
+    return None
+
+
+def _is_lookup_column(column: ColumnIR, stats: ColumnStats) -> bool:
+    return (
+        column.type not in UNINDEXABLE_TYPES
+        and stats.row_count >= MIN_ROWS_FOR_INDEX
+        and stats.distinct_ratio >= SELECTIVE_DISTINCT_RATIO
+        and stats.avg_width <= MAX_LOOKUP_WIDTH
+        and IDENTIFIER_NAME.search(column.name.lower()) is not None
+    )
+
+
+def _is_brin_column(column: ColumnIR, stats: ColumnStats) -> bool:
+    return (
+        stats.row_count >= MIN_ROWS_FOR_BRIN
+        and stats.monotonic
+        and stats.null_count == 0
+        and (stats.is_date or stats.is_integer)
+    )
+
+
+def _table_indexes(table: TableIR, fk_columns: List[str], stats: Dict[str, ColumnStats],
+                   covered: Set[str]) -> List[IndexIR]:
+    indexes = []
+
+    # FK columns: joins and ON DELETE checks on the parent scan them
+    for col in fk_columns:
+        if col in covered:
+            continue
+        covered.add(col)
+        col_stats = stats.get(col)
+        sparse = _sparse_column(col, col_stats)
+        indexes.append(IndexIR(
+            name=_index_name(table.name, (col,), "idx"),
+            table=table.name,
+            columns=(col,),
+            where_not_null=sparse,
+            comment="foreign key" + (" (sparse)" if sparse else ""),
+        ))
+
+    advised = []
+    for column in table.columns:
+        col_stats = stats.get(column.name)
+        if column.name in covered or col_stats is None:
+            continue
+        if _is_brin_column(column, col_stats):
+            advised.append(IndexIR(
+                name=_index_name(table.name, (column.name,), "brin"),
+                table=table.name,
+                columns=(column.name,),
+                method="brin",
+                comment=f"increasing in load order over {col_stats.row_count} rows",
+            ))
+        elif _is_lookup_column(column, col_stats):
+            sparse = _sparse_column(column.name, col_stats)
+            advised.append(IndexIR(
+                name=_index_name(table.name, (column.name,), "idx"),
+                table=table.name,
+                columns=(column.name,),
+                where_not_null=sparse,
+                comment=f"selective lookup, {col_stats.distinct_ratio:.0%} distinct" + (" (sparse)" if sparse else ""),
+            ))
+    return indexes + advised[:MAX_ADVISED_INDEXES]
+
+
+def recommend_indexes(schema: SchemaIR, column_stats: Dict[str, Dict[str, ColumnStats]]) -> List[IndexIR]:
+    """
+    Rule-based index suggestions from profiled data: every FK column, BRIN for
+    large columns that increase in load order, and narrow, highly selective
+    identifier-like columns. Sparse columns get partial indexes. Columns that
+    already lead the primary key or an existing index are skipped.
+    """
+    fk_columns: Dict[str, List[str]] = {}
+    for fk in schema.foreign_keys:
+        fk_columns.setdefault(fk.table, []).append(fk.columns[0])
+
+    indexes = []
+    for table in schema.tables:
+        covered = {ix.columns[0] for ix in schema.indexes if ix.table == table.name and ix.columns}
+        if table.primary_key:
+            covered.add(table.primary_key[0])
+        indexes.extend(_table_indexes(table, fk_columns.get(table.name, []), column_stats.get(table.name, {}), covered))
+    return indexes
+
+
+def recommend_types(schema: SchemaIR, column_stats: Dict[str, Dict[str, ColumnStats]]) -> List[TypeAdvice]:
+    """
+    Integer columns whose observed range fits a narrower type, or needs a wider
+    one. Key columns are not narrowed below INT, since keys keep growing.
+    """
+    key_columns = {(fk.table, c) for fk in schema.foreign_keys for c in fk.columns}
+    key_columns.update((t.name, c) for t in schema.tables for c in t.primary_key)
+
+    advice = []
+    for table in schema.tables:
+        stats = column_stats.get(table.name, {})
+        for column in table.columns:
+            col_stats = stats.get(column.name)
+            if column.type not in INTEGER_TYPES or col_stats is None:
+                continue
+            if not col_stats.is_integer or col_stats.numeric_min is None:
+                continue
+            low, high = col_stats.numeric_min, col_stats.numeric_max
+            # Same rule as the inferred column types, so advice and DDL agree
+            fitting = numeric_type(col_stats)
+            if (table.name, column.name) in key_columns and fitting == "SMALLINT":
+                fitting = "INT"
+            current = "INT" if column.type == "INTEGER" else column.type
+            if fitting != current:
+                advice.append(TypeAdvice(
+                    table=table.name,
+                    column=column.name,
+                    current=column.type,
+                    suggested=fitting,
+                    reason=f"observed range {int(low)}..{int(high)}",
+                ))
+    return advice
+
+
+def apply_advice(schema: SchemaIR,
+                 column_stats: Dict[str, Dict[str, ColumnStats]]) -> Tuple[SchemaIR, List[TypeAdvice]]:
+    """The schema with recommended indexes added, and storage advice to print alongside it"""
+    indexes = recommend_indexes(schema, column_stats)
+    if indexes:
+        schema = replace(schema, indexes=schema.indexes + tuple(indexes))
+    return schema, recommend_types(schema, column_stats)
+
+
+def advice_comments(type_advice: List[TypeAdvice]) -> str:
+    """Storage advice as SQL comments, appended after the DDL"""
+    if not type_advice:
+        return ""
+    lines = ["", "-- Storage recommendations (from profiled values)"]
+    lines.extend(
+        f"-- {a.table}.{a.column}: {a.current} -> {a.suggested} ({a.reason})"
+        for a in type_advice
+    )
+    return "\n" + "\n".join(lines)
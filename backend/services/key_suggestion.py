@@ -1,17 +1,23 @@
 import logging
+import time
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 import pandas as pd
 from backend.models.schema_models import ColumnProfile, TableProfile, RelationshipCandidate
+from backend.services.column_name_index import ColumnNameIndex
+from backend.services.type_inference import base_type, key_type
 
 logger = logging.getLogger(__name__)
 
 class KeyPrioritizer:
     def __init__(self, 
                  custom_aliases: Dict[str, List[str]] = None,
-                 min_alias_overlap: float = 0.7):
+                 min_alias_overlap: float = 0.7,
+                 min_name_similarity: float = 0.8):
+        # Keyed by base type, so VARCHAR(30) and NUMERIC(12, 0) are found too
         self.type_priority = {
-            'INT': 100, 'BIGINT': 95, 'UUID': 90, 'VARCHAR': 70, 'TEXT': 60, 'CHAR': 65
+            'INT': 100, 'INTEGER': 100, 'SMALLINT': 98, 'BIGINT': 95, 'UUID': 90,
+            'VARCHAR': 70, 'TEXT': 60, 'CHAR': 65
         }
         self.key_patterns = {
             'primary': set(),
@@ -25,8 +31,19 @@ class KeyPrioritizer:
         self.detected_aliases = defaultdict(set)
         self.min_alias_overlap = min_alias_overlap
         self.user_confirmed_aliases = defaultdict(set)
+        self.min_name_similarity = min_name_similarity
+        self.name_index: Optional[ColumnNameIndex] = None
+        self.name_scores: Dict[Tuple[str, str], float] = {}
+        self.primary_key_candidates: Optional[Dict[str, ColumnProfile]] = None
+        self.pair_timings: Dict[Tuple[str, str], float] = {}
+
+    def suggest_relationships(self,
+                              schema: Dict[str, TableProfile],
+                              user_aliases: Dict[str, List[str]] = None,
+                              name_index: Optional[ColumnNameIndex] = None):
+        # Optional column-name similarity evidence for FK discovery
+        self.name_index = name_index
 
-    def suggest_relationships(self, schema: Dict[str, TableProfile], user_aliases: Dict[str, List[str]] = None):
         # First discover patterns from the data
         self._discover_key_patterns(schema)  # This must be called first!
         
@@ -70,12 +87,12 @@ class KeyPrioritizer:
         return (
             col_meta.unique_ratio == 1.0 and
             col_meta.null_percent == 0.0 and
-            col_meta.detected_type in self.type_priority
+            base_type(col_meta.detected_type) in self.type_priority
         )
 
     def _score_primary_key(self, col_meta: ColumnProfile) -> float:
         """Score PK candidates with discovered patterns"""
-        type_score = self.type_priority.get(col_meta.detected_type.split('(')[0], 50)
+        type_score = self.type_priority.get(base_type(col_meta.detected_type), 50)
         
         # Score based on discovered patterns
         name_score = max(
@@ -129,36 +146,98 @@ class KeyPrioritizer:
         return commonprefix(stripped) or None
 
     def _find_all_relationships(self, schema: Dict[str, TableProfile]) -> List[RelationshipCandidate]:
-        """Generate all relationship candidates"""
-        candidates = []
+        """Generate all relationship candidates, one work unit per (source, target) table pair"""
         pk_candidates = self._find_primary_key_candidates(schema)
-        
+        # Shared with callers so PKs are not re-derived after discovery
+        self.primary_key_candidates = pk_candidates
+
+        # FK eligibility only depends on the source column, so resolve it once per table
+        fk_columns = {
+            table_name: [
+                (col_name, col_meta)
+                for col_name, col_meta in profile.columns.items()
+                if self._could_be_foreign_key(col_name, col_meta)
+            ]
+            for table_name, profile in schema.items()
+        }
+
+        pairs = []
         for src_table, src_profile in schema.items():
+            if not fk_columns[src_table]:
+                continue
             for tgt_table, tgt_profile in schema.items():
                 if src_table == tgt_table:
                     continue
-                    
+
                 tgt_pk = pk_candidates.get(tgt_table)
                 if not tgt_pk or tgt_pk.unique_ratio < 1.0 or tgt_pk.null_percent > 0.0:
                     continue
-                
-                candidates.extend(
-                    self._find_foreign_candidates(src_profile, tgt_profile, tgt_pk)
-                )
-        
+
+                pairs.append((src_profile, tgt_profile, tgt_pk, fk_columns[src_table]))
+
+        # The per-pair checks are plain Python and would only contend for the GIL
+        # on threads; the one costly part, name similarity, is scored up front in
+        # a single sparse product
+        self.name_scores = self._score_names(pairs)
+        self.pair_timings = {}
+        candidates = []
+        for pair in pairs:
+            pair_candidates, elapsed = self._timed_pair(*pair)
+            self.pair_timings[(pair[0].name, pair[1].name)] = elapsed
+            candidates.extend(pair_candidates)
+
+        if self.pair_timings:
+            slowest = max(self.pair_timings, key=self.pair_timings.get)
+            logger.info(
+                f"Relationship discovery: {len(pairs)} table pairs in "
+                f"{sum(self.pair_timings.values()):.3f}s summed, slowest {slowest[0]} -> {slowest[1]} "
+                f"({self.pair_timings[slowest]:.3f}s)"
+            )
+
         return sorted(candidates, key=lambda x: (-x.confidence, x.reason))
 
+    def _score_names(self, pairs) -> Dict[Tuple[str, str], float]:
+        """Name similarity of every FK column to every "<target_table>_<pk>" it may reference"""
+        if self.name_index is None or not pairs:
+            return {}
+        sources = sorted({col for _, _, _, columns in pairs for col, _ in columns})
+        targets = sorted({f"{target.name}_{pk.name}" for _, target, pk, _ in pairs})
+        scores = self.name_index.similarity_matrix(sources, targets)
+        return {
+            (source, target): float(scores[i, j])
+            for i, source in enumerate(sources)
+            for j, target in enumerate(targets)
+        }
+
+    def _name_score(self, column: str, target_key: str) -> float:
+        score = self.name_scores.get((column, target_key))
+        return score if score is not None else self.name_index.similarity(column, target_key)
+
+    def _timed_pair(self,
+                    source: TableProfile,
+                    target: TableProfile,
+                    target_pk: ColumnProfile,
+                    source_columns: List[Tuple[str, ColumnProfile]]) -> Tuple[List[RelationshipCandidate], float]:
+        """Run a single table-pair work unit and return its candidates with elapsed seconds"""
+        started = time.perf_counter()
+        candidates = self._find_foreign_candidates(source, target, target_pk, source_columns)
+        return candidates, time.perf_counter() - started
+
     def _find_foreign_candidates(self, 
                               source: TableProfile, 
                               target: TableProfile,
-                              target_pk: ColumnProfile) -> List[RelationshipCandidate]:
+                              target_pk: ColumnProfile,
+                              source_columns: Optional[List[Tuple[str, ColumnProfile]]] = None) -> List[RelationshipCandidate]:
         """Find FK candidates with confidence scoring"""
         candidates = []
+        if source_columns is None:
+            source_columns = [
+                (col_name, col_meta)
+                for col_name, col_meta in source.columns.items()
+                if self._could_be_foreign_key(col_name, col_meta)
+            ]
         
-        for src_col, src_meta in source.columns.items():
-            if not self._could_be_foreign_key(src_col, src_meta):
-                continue
-                
+        for src_col, src_meta in source_columns:
             # Check all alias sources
             for alias_source, confidence_boost in [
                 (self.user_confirmed_aliases, 0.95),
@@ -191,10 +270,24 @@ class KeyPrioritizer:
                         reason='direct_match'
                     )
                 )
+            # Name similarity to "<target_table>_<pk>" (e.g. customer_id -> customers.id)
+            if self.name_index is not None and key_type(src_meta.detected_type) == key_type(target_pk.detected_type):
+                name_score = self._name_score(src_col, f"{target.name}_{target_pk.name}")
+                if name_score >= self.min_name_similarity:
+                    candidates.append(
+                        self._create_relationship(
+                            source=source,
+                            src_col=src_col,
+                            target=target,
+                            tgt_col=target_pk.name,
+                            confidence=round(0.85 * name_score, 3),
+                            reason='name_similarity'
+                        )
+                    )
             # NEW: Name and type exact match (auto inference)
             if (
                 src_col == target_pk.name and
-                src_meta.detected_type == target_pk.detected_type
+                key_type(src_meta.detected_type) == key_type(target_pk.detected_type)
             ):
                 candidates.append(
                     self._create_relationship(
@@ -222,7 +315,7 @@ class KeyPrioritizer:
             (
                 0.3 < col_meta.unique_ratio < 0.95 and
                 col_meta.null_percent < 0.2 and
-                col_meta.detected_type in self.type_priority
+                base_type(col_meta.detected_type) in self.type_priority
             )
         )
 
@@ -256,7 +349,7 @@ class KeyPrioritizer:
                 # Discover primary key patterns
                 if (col.unique_ratio == 1.0 
                     and col.null_percent == 0.0
-                    and col.detected_type in self.type_priority):
+                    and base_type(col.detected_type) in self.type_priority):
                     self._extract_pattern(col_name, 'primary')
                 
                 # Discover foreign key patterns
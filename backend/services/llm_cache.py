@@ -0,0 +1,132 @@
+# backend/services/llm_cache.py
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from backend.config import Config
+from backend.models.schema_models import LLMReviewCache
+from backend.services.ddl_parser import IDENT, WORD, tokenize
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_sql(sql: str) -> str:
+    """
+    Whitespace, comments and keyword/identifier case normalized away, so
+    reformatted copies of the same schema share a cache entry. Quoted
+    identifiers and string literals keep their case.
+    """
+    statements = []
+    for tokens in tokenize(sql):
+        parts = []
+        for token in tokens:
+            if token.kind == WORD:
+                parts.append(token.upper)
+            elif token.kind == IDENT:
+                parts.append('"' + token.text.replace('"', '""') + '"')
+            else:
+                parts.append(token.text)
+        statements.append(" ".join(parts))
+    return ";\n".join(statements)
+
+
+def review_cache_key(sql: str, dialect: str, model: str, prompt_version: str) -> str:
+    payload = "\0".join((canonical_sql(sql), dialect.upper(), model, prompt_version))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _ttl() -> timedelta:
+    return timedelta(days=Config.LLM_REVIEW_CACHE_TTL_DAYS)
+
+
+def cache_metadata(entry: Optional[LLMReviewCache], key: str, hit: bool) -> Dict:
+    """What the API reports about where a review came from"""
+    meta = {"hit": hit, "key": key}
+    if entry is not None:
+        meta.update(
+            model=entry.model,
+            prompt_version=entry.prompt_version,
+            created_at=entry.created_at.isoformat() if entry.created_at else None,
+            age_seconds=int((datetime.utcnow() - entry.created_at).total_seconds()) if entry.created_at else 0,
+            hit_count=entry.hit_count or 0,
+        )
+    return meta
+
+
+def get_cached_review(db: Session, key: str) -> Optional[LLMReviewCache]:
+    """The live entry for key, with its hit counters bumped; expired entries are dropped"""
+    entry = db.query(LLMReviewCache).filter(LLMReviewCache.cache_key == key).first()
+    if entry is None:
+        return None
+    now = datetime.utcnow()
+    if entry.created_at and now - entry.created_at > _ttl():
+        db.delete(entry)
+        db.commit()
+        return None
+    entry.hit_count = (entry.hit_count or 0) + 1
+    entry.last_hit_at = now
+    db.commit()
+    return entry
+
+
+def store_review(db: Session, key: str, dialect: str, model: str, prompt_version: str,
+                 response: str) -> Optional[LLMReviewCache]:
+    """Insert a review and evict down to the configured limits"""
+    entry = LLMReviewCache(
+        cache_key=key,
+        dialect=dialect.upper(),
+        model=model,
+        prompt_version=prompt_version,
+        response=response,
+        size_bytes=len(response.encode("utf-8")),
+        created_at=datetime.utcnow(),
+        hit_count=0,
+    )
+    db.add(entry)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request stored the same review first
+        db.rollback()
+        return db.query(LLMReviewCache).filter(LLMReviewCache.cache_key == key).first()
+    evict_reviews(db)
+    return entry
+
+
+def evict_reviews(db: Session) -> int:
+    """
+    Drop expired entries, then the least recently used ones until the cache
+    fits LLM_REVIEW_CACHE_MAX_ENTRIES and LLM_REVIEW_CACHE_MAX_BYTES.
+    """
+    removed = (
+        db.query(LLMReviewCache)
+        .filter(LLMReviewCache.created_at < datetime.utcnow() - _ttl())
+        .delete(synchronize_session=False)
+    )
+
+    recency = func.coalesce(LLMReviewCache.last_hit_at, LLMReviewCache.created_at)
+    rows = (
+        db.query(LLMReviewCache.id, LLMReviewCache.size_bytes)
+        .order_by(recency.desc(), LLMReviewCache.id.desc())
+        .all()
+    )
+    kept, total, stale = 0, 0, []
+    for entry_id, size in rows:
+        if kept < Config.LLM_REVIEW_CACHE_MAX_ENTRIES and total + size <= Config.LLM_REVIEW_CACHE_MAX_BYTES:
+            kept += 1
+            total += size
+        else:
+            stale.append(entry_id)
+    if stale:
+        removed += (
+            db.query(LLMReviewCache)
+            .filter(LLMReviewCache.id.in_(stale))
+            .delete(synchronize_session=False)
+        )
+    if removed:
+        db.commit()
+        logger.info("Evicted %d LLM review cache entries", removed)
+    return removed
@@ -0,0 +1,269 @@
+# backend/services/llm_client.py
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+import httpx
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, OpenAI
+from backend.config import Config
+from backend.utils.secret_store import get_openai_api_key
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimiter:
+    """
+    One in-flight budget shared by threads (sync reviews run in the
+    threadpool) and coroutines (streamed reviews on the event loop), so the
+    provider sees at most `limit` requests from this process. Threads wait
+    on a condition; coroutines wait on a future that a release wakes through
+    their loop, so neither side blocks or polls the event loop.
+    """
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+            self._wake_async_waiter()
+
+    def _wake_async_waiter(self) -> None:
+        """Wake the longest-waiting coroutine; call with _cond held"""
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, waiter)
+                return
+
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_use < self.limit)
+            self._in_use += 1
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def async_slot(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_use < self.limit:
+                    self._in_use += 1
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                # A thread may take the freed slot first; then this loops and waits again
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # Already woken: pass the wakeup on rather than lose it
+                        self._wake_async_waiter()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_limiter = ConcurrencyLimiter(Config.LLM_MAX_CONCURRENCY)
+
+
+class _SharedClient:
+    """A client plus the number of calls using it, so a rotated client is closed only once idle"""
+    def __init__(self, client, api_key: Optional[str]):
+        self.client = client
+        self.api_key = api_key
+        self.users = 0
+        self.retired = False
+
+
+_client_lock = threading.Lock()
+_sync_client: Optional[_SharedClient] = None
+_async_client: Optional[_SharedClient] = None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=Config.LLM_MAX_CONCURRENCY,
+        max_keepalive_connections=Config.LLM_MAX_CONCURRENCY,
+    )
+
+
+def _api_key() -> Optional[str]:
+    api_key = get_openai_api_key()
+    if not api_key and Config.LLM_BASE_URL:
+        api_key = "unused"  # Local OpenAI-compatible servers accept any key, but the SDK requires one
+    return api_key
+
+
+def _client_options(api_key: Optional[str]) -> Dict:
+    # Retries are ours, so the SDK's are switched off
+    return dict(api_key=api_key, base_url=Config.LLM_BASE_URL,
+                timeout=Config.LLM_TIMEOUT_SECONDS, max_retries=0)
+
+
+def _checkout(current: Optional[_SharedClient], api_key: Optional[str], build) -> Tuple[_SharedClient, Optional[_SharedClient]]:
+    """
+    The shared client for api_key, building a new one when the key changed.
+    Returns (client to use, previous client if it is retired and idle, to close).
+    Call with _client_lock held.
+    """
+    idle = None
+    if current is None or current.api_key != api_key:
+        if current is not None:
+            current.retired = True
+            if current.users == 0:
+                idle = current
+        current = _SharedClient(build(api_key), api_key)
+    current.users += 1
+    return current, idle
+
+
+def _checkin(shared: _SharedClient) -> bool:
+    """Release one use; True if the client is retired and now idle, i.e. should be closed"""
+    with _client_lock:
+        shared.users -= 1
+        return shared.retired and shared.users == 0
+
+
+@contextmanager
+def _sync_openai():
+    """The shared sync client, rebuilt when the API key in secrets.json changes"""
+    global _sync_client
+    api_key = _api_key()
+    with _client_lock:
+        _sync_client, idle = _checkout(
+            _sync_client, api_key,
+            lambda key: OpenAI(**_client_options(key), http_client=httpx.Client(limits=_limits()))
+        )
+        shared = _sync_client
+    if idle is not None:
+        idle.client.close()
+    try:
+        yield shared.client
+    finally:
+        if _checkin(shared):
+            shared.client.close()
+
+
+@asynccontextmanager
+async def _async_openai():
+    """The shared async client; a rotated one is closed on the event loop once its last stream ends"""
+    global _async_client
+    api_key = _api_key()
+    with _client_lock:
+        _async_client, idle = _checkout(
+            _async_client, api_key,
+            lambda key: AsyncOpenAI(**_client_options(key), http_client=httpx.AsyncClient(limits=_limits()))
+        )
+        shared = _async_client
+    if idle is not None:
+        await idle.client.close()
+    try:
+        yield shared.client
+    finally:
+        if _checkin(shared):
+            await shared.client.close()
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying, or None if the error is not retryable"""
+    if isinstance(error, APIStatusError):
+        if error.status_code != 429 and error.status_code < 500:
+            return None
+        retry_after = error.response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), Config.LLM_BACKOFF_MAX_SECONDS)
+            except ValueError:
+                pass
+    elif not isinstance(error, APIConnectionError):  # includes timeouts
+        return None
+    # Exponential backoff with jitter, so a burst of 429s does not retry in lockstep
+    delay = min(Config.LLM_BACKOFF_SECONDS * 2 ** attempt, Config.LLM_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _should_retry(error: Exception, attempt: int) -> Optional[float]:
+    delay = _retry_delay(error, attempt)
+    if delay is None or attempt >= Config.LLM_MAX_RETRIES:
+        return None
+    logger.warning("LLM request failed (%s); retry %d of %d in %.1fs",
+                   error, attempt + 1, Config.LLM_MAX_RETRIES, delay)
+    return delay
+
+
+def chat_completion(messages: List[Dict], model: str, temperature: float) -> str:
+    """One completion through the shared client, retried on 429/5xx; raises once retries run out"""
+    with _sync_openai() as client, _limiter.slot():
+        attempt = 0
+        while True:
+            try:
+                response = client.chat.completions.create(
+                    model=model, messages=messages, temperature=temperature
+                )
+                return response.choices[0].message.content
+            except Exception as e:
+                delay = _should_retry(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+
+async def stream_chat_completion(messages: List[Dict], model: str, temperature: float) -> AsyncIterator[str]:
+    """
+    Completion text as it is generated. Opening the stream is retried like
+    chat_completion; a stream that fails midway is not, since part of it has
+    already been sent on.
+    """
+    async with _async_openai() as client, _limiter.async_slot():
+        attempt = 0
+        while True:
+            try:
+                stream = await client.chat.completions.create(
+                    model=model, messages=messages, temperature=temperature, stream=True
+                )
+                break
+            except Exception as e:
+                delay = _should_retry(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
+
+async def close_llm_clients() -> None:
+    global _sync_client, _async_client
+    with _client_lock:
+        sync_client, async_client = _sync_client, _async_client
+        _sync_client = _async_client = None
+    if sync_client is not None:
+        sync_client.client.close()
+    if async_client is not None:
+        await async_client.client.close()
@@ -1,23 +1,32 @@
 # backend/services/llm_schema_reviewer.py
 
-from openai import OpenAI
 import os
 from dotenv import load_dotenv
 from backend.db import get_db
 from sqlalchemy.orm import Session
-from backend.utils.secret_store import get_license_info
-
-def review_schema_with_llm(sql_schema: str, sql_dialect:str, db: Session, user) -> str:
-
-    API = get_license_info()['openai_api_key']
-    client = OpenAI(api_key=API)
-
-    """
-    Review the SQL schema using GenAI.
-    Assumes credits have already been checked & deducted by the caller.
-    Returns cleaned schema, or fallback on error.
-    """
-
+import re
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from backend.models.schema_models import LLMReviewCache
+from backend.services.llm_client import chat_completion, stream_chat_completion
+from backend.services.llm_cache import cache_metadata, get_cached_review, review_cache_key, store_review
+
+REVIEW_MODEL = "gpt-4o"
+REVIEW_TEMPERATURE = 0.2
+# Part of the cache key; bump whenever the prompt below changes
+PROMPT_VERSION = "1"
+
+# Section markers in the review, and the section each one opens (None closes it)
+SECTION_MARKERS = {
+    "--BEGIN CLEANED SQL--": "sql",
+    "--END CLEANED SQL--": None,
+    "--BEGIN MERMAID--": "mermaid",
+    "--END MERMAID--": None,
+}
+CLEANED_SQL_SECTION = re.compile(r"--BEGIN CLEANED SQL--(.*?)--END CLEANED SQL--", re.DOTALL)
+MERMAID_SECTION = re.compile(r"--BEGIN MERMAID--(.*?)--END MERMAID--", re.DOTALL)
+
+
+def build_review_prompt(sql_schema: str, sql_dialect: str) -> str:
     schema_requirement_dict = {
         "POSTGRES": "**[PostgreSQL DDL]** — Use `GENERATED ALWAYS AS IDENTITY`, `TEXT`, `TIMESTAMPTZ`, `ENUM`, `JSONB`, partial and GIN/BRIN indexes, `pgcrypto` for field-level encryption, `ValidFrom/ValidTo` for history tracking, row-level security via `POLICY`",
         "MYSQL": "**[MySQL DDL]** — Use `AUTO_INCREMENT`, `InnoDB` engine, `utf8mb4_0900_ai_ci` collation, `DATETIME(6)`, descending and BTREE indexes (MySQL 8+), `ENUM`, and include `ValidFrom/ValidTo` timestamp ranges in normalized designs.",
@@ -101,17 +110,120 @@ def review_schema_with_llm(sql_schema: str, sql_dialect:str, db: Session, user)
             --INPUT SCHEMA TO PROCESS--
             {sql_schema}
 """ 
-    try: # AI Response - Return Cleaned Schema Using GPT-4o for better response
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt.strip()}],
-            temperature=0.2
-        )
-        
-        cleaned_sql = response.choices[0].message.content.strip() 
+    return prompt.strip()
+
+
+def _request_review(prompt: str) -> str:
+    """One completion through the shared, rate-limited client; raises once retries run out"""
+    messages = [{"role": "user", "content": prompt}]
+    return chat_completion(messages, REVIEW_MODEL, REVIEW_TEMPERATURE).strip()
+
+
+def stream_review(prompt: str) -> AsyncIterator[str]:
+    """Completion text as it is generated; raises on any API error"""
+    messages = [{"role": "user", "content": prompt}]
+    return stream_chat_completion(messages, REVIEW_MODEL, REVIEW_TEMPERATURE)
+
+
+def lookup_review(sql_schema: str, sql_dialect: str, db: Optional[Session]) -> Tuple[str, Optional[LLMReviewCache]]:
+    """Cache key for the review, and the cached entry if there is a live one"""
+    key = review_cache_key(sql_schema, sql_dialect, REVIEW_MODEL, PROMPT_VERSION)
+    return key, get_cached_review(db, key) if db is not None else None
+
+
+def save_review(db: Optional[Session], key: str, sql_dialect: str, response: str) -> Dict:
+    """Cache a completed review; returns its cache metadata"""
+    entry = None
+    if db is not None:
+        entry = store_review(db, key, sql_dialect, REVIEW_MODEL, PROMPT_VERSION, response)
+    return cache_metadata(entry, key, hit=False)
 
-        return cleaned_sql
 
+def review_schema_cached(sql_schema: str, sql_dialect: str, db: Optional[Session]) -> Tuple[str, Dict]:
+    """
+    LLM review of the schema and where it came from. Reviews are cached by
+    canonical SQL, dialect, model and prompt version; failed reviews fall
+    back to the original SQL and are not cached.
+    """
+    key, entry = lookup_review(sql_schema, sql_dialect, db)
+    if entry is not None:
+        return entry.response, cache_metadata(entry, key, hit=True)
+
+    try: # AI Response - Return Cleaned Schema Using GPT-4o for better response
+        cleaned_sql = _request_review(build_review_prompt(sql_schema, sql_dialect))
     except Exception as e:
         print("❌ LLM schema review failed:", str(e))
-        return sql_schema  # fallback to original
+        return sql_schema, {**cache_metadata(None, key, hit=False), "error": str(e)}  # fallback to original
+
+    return cleaned_sql, save_review(db, key, sql_dialect, cleaned_sql)
+
+
+def review_schema_with_llm(sql_schema: str, sql_dialect:str, db: Session, user) -> str:
+    """
+    Review the SQL schema using GenAI.
+    Assumes credits have already been checked & deducted by the caller.
+    Returns cleaned schema, or fallback on error.
+    """
+    response, _ = review_schema_cached(sql_schema, sql_dialect, db)
+    return response
+
+
+def parse_review_sections(llm_response: str, fallback_sql: str) -> Tuple[str, str]:
+    """(cleaned SQL, mermaid) from a review; fallback_sql when the SQL section is missing"""
+    cleaned_sql_match = CLEANED_SQL_SECTION.search(llm_response)
+    mermaid_text_match = MERMAID_SECTION.search(llm_response)
+    cleaned_sql_text = cleaned_sql_match.group(1).strip() if cleaned_sql_match else fallback_sql
+    mermaid_text_str = mermaid_text_match.group(1).strip() if mermaid_text_match else ""
+    return cleaned_sql_text, mermaid_text_str
+
+
+class ReviewSectionParser:
+    """
+    Incremental counterpart of parse_review_sections for streamed reviews.
+    feed() returns the (section, text) pieces that are complete so far; the
+    tail that could be the start of a marker is held back until the next
+    chunk shows whether it is one.
+    """
+    HOLD_BACK = max(len(marker) for marker in SECTION_MARKERS) - 1
+
+    def __init__(self):
+        self.section: Optional[str] = None
+        self._buffer = ""
+        self._at_section_start = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        self._buffer += chunk
+        pieces = []
+        while True:
+            found = [(self._buffer.find(m), m) for m in SECTION_MARKERS]
+            found = [(pos, m) for pos, m in found if pos >= 0]
+            if not found:
+                break
+            pos, marker = min(found)
+            self._emit(self._buffer[:pos], pieces)
+            self.section = SECTION_MARKERS[marker]
+            self._at_section_start = True
+            self._buffer = self._buffer[pos + len(marker):]
+
+        safe = len(self._buffer) - self.HOLD_BACK
+        if safe > 0:
+            self._emit(self._buffer[:safe], pieces)
+            self._buffer = self._buffer[safe:]
+        return pieces
+
+    def close(self) -> List[Tuple[str, str]]:
+        pieces = []
+        self._emit(self._buffer, pieces)
+        self._buffer = ""
+        return pieces
+
+    def _emit(self, text: str, pieces: List[Tuple[str, str]]) -> None:
+        if self.section is None:
+            return
+        if self._at_section_start:
+            # Match parse_review_sections, which strips each section
+            text = text.lstrip()
+            if not text:
+                return
+            self._at_section_start = False
+        pieces.append((self.section, text))
@@ -0,0 +1,278 @@
+# backend/services/materializer.py
+import csv
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from backend.models.schema_models import TableProfile
+from backend.utils.file_handler import detect_encoding
+from backend.utils.json_csv import json_to_clean_csv
+
+NULL_TOKENS = ['', 'nan', 'NA', 'N/A', 'null']
+
+
+def decomposition_layout(base_table: str, file_path: str, tables: Dict[str, TableProfile]) -> Dict:
+    """
+    JSON-serializable description of a flat-file decomposition, stored with the
+    session so the data can be materialized later without re-running inference.
+    """
+    return {
+        "base_table": base_table,
+        "file_path": file_path,
+        "entities": {
+            name: list(profile.columns)
+            for name, profile in tables.items()
+            if name != base_table
+        },
+        "base_columns": list(tables[base_table].columns) if base_table in tables else [],
+    }
+
+
+def _clean_names(columns: pd.Index) -> pd.Index:
+    """Same column-name cleaning as clean_dataframe, so layouts resolve against raw chunks"""
+    return (
+        columns.str.strip()
+        .str.lower()
+        .str.replace(r'[^\w]+', '_', regex=True)
+        .str.replace(r'^_+|_+$', '', regex=True)
+    )
+
+
+def _parquet_batches(file_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(file_path)
+    # Cast in Arrow so nullable integers stay "1", not "1.0", and nulls stay null
+    as_text = pa.schema([(field.name, pa.string()) for field in parquet.schema_arrow])
+    for batch in parquet.iter_batches(batch_size=chunksize):
+        yield pa.Table.from_batches([batch]).cast(as_text).to_pandas()
+
+
+def read_source_chunks(file_path: str, columns: List[str], chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Yield cleaned string chunks of a CSV, JSON or Parquet file holding only the
+    requested columns, with the same name and null cleaning as clean_dataframe.
+    """
+    ext = os.path.splitext(file_path)[-1].lower()
+    if ext == ".json":
+        frames = [json_to_clean_csv(file_path).astype(str)]
+    elif ext == ".parquet":
+        frames = _parquet_batches(file_path, chunksize)
+    else:
+        with open(file_path, "rb") as f:
+            encoding = detect_encoding(f)
+        with open(file_path, "r", encoding=encoding, newline="") as f:
+            delimiter = csv.Sniffer().sniff(f.read(64 * 1024), delimiters=",;\t|").delimiter
+        frames = pd.read_csv(
+            file_path,
+            encoding=encoding,
+            sep=delimiter,
+            skipinitialspace=True,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunksize
+        )
+
+    for chunk in frames:
+        chunk.columns = _clean_names(chunk.columns)
+        missing = [col for col in columns if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {os.path.basename(file_path)}")
+        chunk = chunk.loc[:, ~chunk.columns.duplicated()][columns]
+        for col in columns:
+            chunk[col] = chunk[col].str.strip()
+        chunk = chunk.mask(chunk.isin(NULL_TOKENS))
+        yield chunk.dropna(how='all')
+
+
+class _KeyRegistry:
+    """
+    Assigns dense surrogate keys (1, 2, ...) to distinct rows by 64-bit row hash,
+    in order of first appearance. Holds one hash per distinct entity, never the rows.
+    """
+    def __init__(self):
+        self._index = pd.Index([], dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def assign(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (keys aligned with hashes, mask of rows that introduce a new key)"""
+        positions = self._index.get_indexer(hashes)
+        unseen = positions < 0
+        if unseen.any():
+            first = ~pd.Index(hashes).duplicated() & unseen
+            self._index = self._index.append(pd.Index(hashes[first]))
+            positions = self._index.get_indexer(hashes)
+        else:
+            first = np.zeros(len(hashes), dtype=bool)
+        return positions + 1, first
+
+
+class _ChunkWriter:
+    """Appends DataFrame chunks to one Parquet or CSV file"""
+    def __init__(self, path: str, fmt: str, columns: List[str], key_columns: set):
+        self.path = path
+        self.fmt = fmt
+        self.columns = columns
+        self.key_columns = key_columns
+        self.rows = 0
+        self._parquet = None
+        self._schema = None
+
+    def _write_parquet(self, frame: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._parquet is None:
+            # Fixed schema: a chunk where a column is entirely null must not change its type
+            self._schema = pa.schema([
+                (col, pa.int64() if col in self.key_columns else pa.string())
+                for col in self.columns
+            ])
+            self._parquet = pq.ParquetWriter(self.path, self._schema)
+        self._parquet.write_table(pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False))
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.fmt == "parquet":
+            self._write_parquet(frame)
+        else:
+            frame.to_csv(self.path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        if not self.rows and (self.fmt == "csv" or self._parquet is None):
+            # Empty table: still leave a file with the right columns
+            self.write(pd.DataFrame(columns=self.columns))
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def _surrogate_column(entity: str, taken: set) -> str:
+    # Suffixed rather than prefixed: read_source_chunks strips leading underscores
+    name, n = f"{entity}_id", 1
+    while name in taken:
+        n += 1
+        name = f"{entity}_id_{n}"
+    return name
+
+
+def surrogate_key_columns(layout: Dict) -> Dict[str, str]:
+    """{entity: name of its surrogate key column}, as materialize_decomposition writes them"""
+    taken = {col for cols in layout["entities"].values() for col in cols} | set(layout["base_columns"])
+    key_columns = {}
+    for entity in layout["entities"]:
+        key_columns[entity] = _surrogate_column(entity, taken)
+        taken.add(key_columns[entity])
+    return key_columns
+
+
+def add_surrogate_keys(normalized_schema: Dict, keys: Dict, layout: Dict,
+                       composite_pk_fallbacks: Optional[Dict] = None) -> None:
+    """
+    Give the decomposed schema the columns the materializer writes: a BIGINT
+    surrogate primary key on each entity, and a nullable column in the base
+    table referencing it. Edits normalized_schema, keys and the fallbacks in place.
+    """
+    base_table = layout["base_table"]
+    base = normalized_schema.setdefault(base_table, {})
+    for entity, key_column in surrogate_key_columns(layout).items():
+        normalized_schema[entity] = {
+            key_column: {"type": "BIGINT", "nullable": False, "canonical_name": None},
+            **normalized_schema.get(entity, {}),
+        }
+        base[key_column] = {"type": "BIGINT", "nullable": True, "canonical_name": None}
+        keys["primary_keys"][entity] = [{"column": key_column, "selected": True}]
+        keys["foreign_keys"].append({
+            "source_table": base_table,
+            "source_column": key_column,
+            "target_table": entity,
+            "target_column": key_column,
+        })
+
+    # Keys inferred on the flat file may name columns that moved into an entity
+    base_columns = normalized_schema[base_table]
+    if not all(pk["column"] in base_columns for pk in keys["primary_keys"].get(base_table, [])):
+        del keys["primary_keys"][base_table]
+    fallback = (composite_pk_fallbacks or {}).get(base_table)
+    if fallback and not all(col in base_columns for col in fallback["columns"]):
+        del composite_pk_fallbacks[base_table]
+
+
+def materialize_decomposition(layout: Dict,
+                              output_dir: str,
+                              fmt: str = "parquet",
+                              chunksize: int = 200_000,
+                              file_path: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Write the decomposed tables of a flat file as deduplicated data files.
+
+    The source is streamed in chunks. Each entity keeps only the 64-bit hashes of
+    the rows it has already emitted, so memory is bounded by the chunk size plus
+    the number of distinct entities, not by the file size. Entities get dense
+    surrogate keys and the base table references them through "<entity>_id"
+    columns in place of the entity's columns.
+
+    Args:
+        layout: Output of decomposition_layout()
+        output_dir: Directory for one file per table
+        fmt: "parquet" or "csv"
+        chunksize: Source rows per chunk
+        file_path: Override for the source file stored in the layout
+
+    Returns:
+        {table: {"path", "rows", "columns"}} with the row count of each written table.
+    """
+    if fmt not in ("parquet", "csv"):
+        raise ValueError(f"Unsupported output format: {fmt}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    entities: Dict[str, List[str]] = layout["entities"]
+    base_table = layout["base_table"]
+    base_columns = list(layout["base_columns"])
+    source_columns = list(dict.fromkeys(
+        [col for cols in entities.values() for col in cols] + base_columns
+    ))
+
+    key_columns = surrogate_key_columns(layout)
+
+    registries = {entity: _KeyRegistry() for entity in entities}
+    layouts = {entity: [key_columns[entity]] + cols for entity, cols in entities.items()}
+    layouts[base_table] = base_columns + [key_columns[entity] for entity in entities]
+    writers = {
+        table: _ChunkWriter(os.path.join(output_dir, f"{table}.{fmt}"), fmt, columns, set(key_columns.values()))
+        for table, columns in layouts.items()
+    }
+
+    try:
+        for chunk in read_source_chunks(file_path or layout["file_path"], source_columns, chunksize):
+            base = chunk[base_columns].copy()
+            for entity, cols in entities.items():
+                values = chunk[cols]
+                present = values.notna().any(axis=1).to_numpy()
+                hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+                keys, first = registries[entity].assign(hashes[present])
+
+                rows = values[present][first].copy()
+                rows.insert(0, key_columns[entity], keys[first])
+                writers[entity].write(rows)
+
+                # Rows with no entity values reference nothing
+                fk = pd.array(np.zeros(len(chunk), dtype=np.int64), dtype="Int64")
+                fk[present] = keys
+                fk[~present] = pd.NA
+                base[key_columns[entity]] = fk
+            writers[base_table].write(base)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return {
+        table: {
+            "path": writer.path,
+            "rows": writer.rows,
+            "columns": layouts[table],
+        }
+        for table, writer in writers.items()
+    }
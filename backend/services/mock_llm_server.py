@@ -0,0 +1,118 @@
+# backend/services/mock_llm_server.py
+"""
+Local stand-in for the OpenAI chat completions API, for benchmarking the
+review path without provider latency, cost or rate limits:
+
+    python -m backend.services.mock_llm_server --port 8089
+    LLM_BASE_URL=http://localhost:8089/v1 uvicorn backend.main:app
+
+Replies echo the input schema inside the section markers the reviewer
+expects. Latency, streaming speed and injected 429/503 errors are set from
+the command line.
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+INPUT_MARKER = "--INPUT SCHEMA TO PROCESS--"
+TABLE_NAME = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?["`\[]?(\w+)', re.IGNORECASE)
+
+settings = {
+    "latency": 0.5,       # seconds before the first token
+    "chunk_size": 16,     # characters per streamed chunk
+    "chunk_delay": 0.01,  # seconds between streamed chunks
+    "error_rate": 0.0,    # fraction of requests answered with 429 or 503
+}
+app = FastAPI()
+
+
+def review_text(prompt: str) -> str:
+    schema = prompt.split(INPUT_MARKER, 1)[-1].strip()
+    tables = TABLE_NAME.findall(schema)
+    mermaid = "\n".join(["erDiagram"] + [f"    {name} {{\n        INT id PK\n    }}" for name in tables])
+    return (
+        f"--BEGIN CLEANED SQL--\n{schema}\n--END CLEANED SQL--\n\n"
+        f"--BEGIN MERMAID--\n{mermaid}\n--END MERMAID--"
+    )
+
+
+def _injected_error():
+    if random.random() >= settings["error_rate"]:
+        return None
+    if random.random() < 0.5:
+        return JSONResponse({"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+                            status_code=429, headers={"retry-after": "0.1"})
+    return JSONResponse({"error": {"message": "Service unavailable", "type": "server_error"}}, status_code=503)
+
+
+def _chunk(completion_id: str, model: str, delta: dict, finish_reason=None) -> str:
+    body = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(body)}\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    error = _injected_error()
+    if error is not None:
+        return error
+
+    model = body.get("model", "mock")
+    prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+    text = review_text(prompt)
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    await asyncio.sleep(settings["latency"])
+
+    if body.get("stream"):
+        async def events():
+            yield _chunk(completion_id, model, {"role": "assistant", "content": ""})
+            size = settings["chunk_size"]
+            for i in range(0, len(text), size):
+                yield _chunk(completion_id, model, {"content": text[i:i + size]})
+                await asyncio.sleep(settings["chunk_delay"])
+            yield _chunk(completion_id, model, {}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    tokens = len(text) // 4
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": tokens,
+                  "total_tokens": len(prompt) // 4 + tokens},
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    cli = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    cli.add_argument("--host", default="127.0.0.1")
+    cli.add_argument("--port", type=int, default=8089)
+    cli.add_argument("--latency", type=float, default=settings["latency"])
+    cli.add_argument("--chunk-size", type=int, default=settings["chunk_size"])
+    cli.add_argument("--chunk-delay", type=float, default=settings["chunk_delay"])
+    cli.add_argument("--error-rate", type=float, default=settings["error_rate"])
+    args = cli.parse_args()
+    settings.update(latency=args.latency, chunk_size=args.chunk_size,
+                    chunk_delay=args.chunk_delay, error_rate=args.error_rate)
+    uvicorn.run(app, host=args.host, port=args.port)
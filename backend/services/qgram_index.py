@@ -0,0 +1,93 @@
+# backend/services/qgram_index.py
+from typing import List, Sequence
+import numpy as np
+import pandas as pd
+
+
+class QGramIndex:
+    """
+    Inverted index from character q-grams to target value ids, stored in CSR form.
+
+    Used to shortlist a bounded number of target values per source value before
+    exact scoring, so fuzzy matching stays feasible on very large target columns.
+    """
+    def __init__(self,
+                 values: Sequence[str],
+                 q: int = 3,
+                 max_posting_ratio: float = 0.05,
+                 min_posting_cap: int = 1000):
+        self.q = q
+        self.values = list(values)
+        self.size = len(self.values)
+        # Grams shared by a large share of targets carry no signal and dominate cost
+        self.max_posting = max(min_posting_cap, int(self.size * max_posting_ratio))
+        self._build()
+
+    def _build(self):
+        series = pd.Series(self.values, dtype=object)
+        lengths = series.str.len().to_numpy()
+        n = self.size
+
+        gram_parts: List[pd.Series] = []
+        id_parts: List[np.ndarray] = []
+        # Values shorter than q are indexed as a single gram
+        short = np.flatnonzero(lengths < self.q)
+        if len(short):
+            gram_parts.append(series.iloc[short])
+            id_parts.append(short)
+        max_len = int(lengths.max()) if n else 0
+        for offset in range(max(max_len - self.q + 1, 0)):
+            ids = np.flatnonzero(lengths >= offset + self.q)
+            gram_parts.append(series.iloc[ids].str.slice(offset, offset + self.q))
+            id_parts.append(ids)
+
+        if not gram_parts:
+            self._gram_codes = {}
+            self._indptr = np.zeros(1, dtype=np.int64)
+            self._indices = np.zeros(0, dtype=np.int64)
+            return
+
+        codes, grams = pd.factorize(pd.concat(gram_parts, ignore_index=True))
+        ids = np.concatenate(id_parts).astype(np.int64)
+
+        # Group postings by gram; a value repeating a gram just adds a duplicate posting
+        order = np.argsort(codes, kind='stable')
+        self._indices = ids[order]
+        self._indptr = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(grams)))))
+        self._gram_codes = {gram: code for code, gram in enumerate(grams)}
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate resident size, used by the column cache"""
+        return (
+            self._indptr.nbytes
+            + self._indices.nbytes
+            + sum(len(v) + 49 for v in self.values)
+            + len(self._gram_codes) * 120
+        )
+
+    def _grams(self, value: str) -> List[str]:
+        if len(value) < self.q:
+            return [value]
+        return list({value[i:i + self.q] for i in range(len(value) - self.q + 1)})
+
+    def candidates(self, query: str, limit: int = 50) -> np.ndarray:
+        """Ids of the (at most limit) targets sharing the most q-grams with query, in ascending id order"""
+        postings = []
+        for gram in self._grams(query):
+            code = self._gram_codes.get(gram)
+            if code is None:
+                continue
+            start, end = self._indptr[code], self._indptr[code + 1]
+            if end - start > self.max_posting:
+                continue
+            postings.append(self._indices[start:end])
+
+        if not postings:
+            return np.zeros(0, dtype=np.int64)
+
+        ids, counts = np.unique(np.concatenate(postings), return_counts=True)
+        if len(ids) > limit:
+            top = np.argpartition(-counts, limit - 1)[:limit]
+            ids = np.sort(ids[top])
+        return ids
@@ -0,0 +1,198 @@
+# backend/services/schema_diff.py
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from backend.services.ddl_emitters import EMITTERS, resolve_dialect
+from backend.services.schema_ir import ColumnIR, ForeignKeyIR, IndexIR, SchemaIR, TableIR, render_type
+
+# Spellings of the same type; inferred, parsed and AI-reviewed schemas mix them
+TYPE_SYNONYMS = {
+    "INTEGER": "INT", "INT4": "INT", "INT2": "SMALLINT", "INT8": "BIGINT",
+    "BOOL": "BOOLEAN", "DECIMAL": "NUMERIC",
+    "CHARACTER VARYING": "VARCHAR", "CHARACTER": "CHAR",
+    "FLOAT": "DOUBLE PRECISION", "DOUBLE": "DOUBLE PRECISION", "FLOAT8": "DOUBLE PRECISION", "FLOAT4": "REAL",
+    "TIMESTAMP WITHOUT TIME ZONE": "TIMESTAMP", "TIMESTAMPTZ": "TIMESTAMP WITH TIME ZONE",
+}
+
+
+@dataclass
+class TableDiff:
+    name: str
+    added_columns: List[ColumnIR] = field(default_factory=list)
+    dropped_columns: List[str] = field(default_factory=list)
+    altered_columns: List[Tuple[ColumnIR, ColumnIR]] = field(default_factory=list)
+    old_primary_key: Tuple[str, ...] = ()
+    new_primary_key: Tuple[str, ...] = ()
+
+    @property
+    def primary_key_changed(self) -> bool:
+        return self.old_primary_key != self.new_primary_key
+
+
+@dataclass
+class SchemaDiff:
+    added_tables: List[TableIR] = field(default_factory=list)
+    dropped_tables: List[str] = field(default_factory=list)
+    altered_tables: List[TableDiff] = field(default_factory=list)
+    added_foreign_keys: List[ForeignKeyIR] = field(default_factory=list)
+    dropped_foreign_keys: List[ForeignKeyIR] = field(default_factory=list)
+    added_indexes: List[IndexIR] = field(default_factory=list)
+    dropped_indexes: List[IndexIR] = field(default_factory=list)
+    unchanged_tables: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added_tables or self.dropped_tables or self.altered_tables
+                    or self.added_foreign_keys or self.dropped_foreign_keys
+                    or self.added_indexes or self.dropped_indexes)
+
+    def summary(self) -> Dict:
+        return {
+            "added_tables": [t.name for t in self.added_tables],
+            "dropped_tables": self.dropped_tables,
+            "altered_tables": {
+                t.name: {
+                    "added_columns": [c.name for c in t.added_columns],
+                    "dropped_columns": t.dropped_columns,
+                    "altered_columns": {
+                        new.name: {"from": _describe(old), "to": _describe(new)}
+                        for old, new in t.altered_columns
+                    },
+                    "primary_key": (
+                        {"from": list(t.old_primary_key), "to": list(t.new_primary_key)}
+                        if t.primary_key_changed else None
+                    ),
+                }
+                for t in self.altered_tables
+            },
+            "added_foreign_keys": len(self.added_foreign_keys),
+            "dropped_foreign_keys": len(self.dropped_foreign_keys),
+            "added_indexes": [ix.name for ix in self.added_indexes],
+            "dropped_indexes": [ix.name for ix in self.dropped_indexes],
+            "unchanged_tables": self.unchanged_tables,
+        }
+
+
+def _describe(column: ColumnIR) -> str:
+    return f"{render_type(column)} {'NULL' if column.nullable else 'NOT NULL'}"
+
+
+def _canonical_type(column: ColumnIR) -> str:
+    return TYPE_SYNONYMS.get(column.type, column.type)
+
+
+def _same_definition(old: ColumnIR, new: ColumnIR) -> bool:
+    # The suggested canonical name is only a comment in the DDL
+    return (_canonical_type(old) == _canonical_type(new) and old.params == new.params
+            and old.nullable == new.nullable)
+
+
+def _diff_table(old: TableIR, new: TableIR) -> Optional[TableDiff]:
+    old_columns = {c.name: c for c in old.columns}
+    new_columns = {c.name: c for c in new.columns}
+    diff = TableDiff(
+        name=new.name,
+        added_columns=[c for c in new.columns if c.name not in old_columns],
+        dropped_columns=[c.name for c in old.columns if c.name not in new_columns],
+        altered_columns=[
+            (old_columns[c.name], c) for c in new.columns
+            if c.name in old_columns and not _same_definition(old_columns[c.name], c)
+        ],
+        old_primary_key=old.primary_key,
+        new_primary_key=new.primary_key,
+    )
+    if diff.added_columns or diff.dropped_columns or diff.altered_columns or diff.primary_key_changed:
+        return diff
+    return None
+
+
+def diff_schemas(old: SchemaIR, new: SchemaIR) -> SchemaDiff:
+    """
+    Changes that turn old into new. Tables whose digest is unchanged are
+    skipped without looking at their columns; renames show up as drop + add.
+    """
+    diff = SchemaDiff()
+    if old.digest == new.digest:
+        diff.unchanged_tables = len(new.tables)
+        return diff
+
+    old_digests, new_digests = old.table_digests, new.table_digests
+    old_tables = {t.name: t for t in old.tables}
+    changed = set()
+    for table in new.tables:
+        if table.name not in old_tables:
+            diff.added_tables.append(table)
+            changed.add(table.name)
+        elif old_digests[table.name] == new_digests[table.name]:
+            diff.unchanged_tables += 1
+        else:
+            changed.add(table.name)
+            table_diff = _diff_table(old_tables[table.name], table)
+            if table_diff:
+                diff.altered_tables.append(table_diff)
+    diff.dropped_tables = [t.name for t in old.tables if t.name not in new_digests]
+
+    # FKs and indexes only move on tables whose digest changed
+    dropped = set(diff.dropped_tables)
+    old_fks = {fk for fk in old.foreign_keys if fk.table in changed or fk.table in dropped}
+    new_fks = {fk for fk in new.foreign_keys if fk.table in changed}
+    diff.added_foreign_keys = [fk for fk in new.foreign_keys if fk in new_fks and fk not in old_fks]
+    # FKs of dropped tables go with the table
+    diff.dropped_foreign_keys = [
+        fk for fk in old.foreign_keys
+        if fk in old_fks and fk not in new_fks and fk.table not in dropped
+    ]
+
+    # A primary key cannot be dropped while FKs reference it, including FKs of
+    # unchanged tables: drop those first and re-create them once the key is back
+    rekeyed = {t.name for t in diff.altered_tables if t.primary_key_changed and t.old_primary_key}
+    kept_fks = set(new.foreign_keys)
+    for fk in old.foreign_keys:
+        if fk.ref_table not in rekeyed or fk.table in dropped or fk in diff.dropped_foreign_keys:
+            continue
+        diff.dropped_foreign_keys.append(fk)
+        if fk in kept_fks and fk not in diff.added_foreign_keys:
+            diff.added_foreign_keys.append(fk)
+
+    old_indexes = {ix for ix in old.indexes if ix.table in changed}
+    new_indexes = {ix for ix in new.indexes if ix.table in changed}
+    diff.added_indexes = [ix for ix in new.indexes if ix in new_indexes and ix not in old_indexes]
+    diff.dropped_indexes = [ix for ix in old.indexes if ix in old_indexes and ix not in new_indexes]
+    return diff
+
+
+def render_migration(diff: SchemaDiff, dialect: Optional[str] = None) -> str:
+    """
+    Migration script for one dialect. Constraints and indexes are dropped
+    before the tables and columns they depend on change, and added after.
+    """
+    emitter = EMITTERS[resolve_dialect(dialect)]
+    added_fks: Dict[str, List[ForeignKeyIR]] = {}
+    for fk in diff.added_foreign_keys:
+        added_fks.setdefault(fk.table, []).append(fk)
+    added_tables = {t.name for t in diff.added_tables}
+
+    statements: List[str] = []
+    statements.extend(emitter.drop_foreign_key(fk) for fk in diff.dropped_foreign_keys)
+    statements.extend(emitter.drop_index(ix) for ix in diff.dropped_indexes)
+    statements.extend(
+        emitter.drop_primary_key(t.name) for t in diff.altered_tables
+        if t.primary_key_changed and t.old_primary_key
+    )
+    statements.extend(emitter.drop_table(name) for name in diff.dropped_tables)
+    statements.extend(
+        emitter.create_table(t, added_fks.get(t.name, []) if emitter.inline_foreign_keys else [])
+        for t in diff.added_tables
+    )
+    for table in diff.altered_tables:
+        statements.extend(emitter.add_column(table.name, c) for c in table.added_columns)
+        for old, column in table.altered_columns:
+            statements.extend(emitter.alter_column(table.name, old, column))
+        statements.extend(emitter.drop_column(table.name, c) for c in table.dropped_columns)
+        if table.primary_key_changed and table.new_primary_key:
+            statements.append(emitter.add_primary_key(table.name, table.new_primary_key))
+    statements.extend(
+        emitter.add_foreign_key(fk) for fk in diff.added_foreign_keys
+        if not (emitter.inline_foreign_keys and fk.table in added_tables)
+    )
+    statements.extend(filter(None, (emitter.create_index(ix) for ix in diff.added_indexes)))
+    return "\n".join(statements)
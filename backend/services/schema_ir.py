@@ -0,0 +1,228 @@
+# backend/services/schema_ir.py
+import hashlib
+import re
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+TYPE_PATTERN = re.compile(r'^\s*([A-Za-z][A-Za-z0-9_ ]*?)\s*(?:\(\s*([^)]*)\))?\s*$')
+
+
+@dataclass(frozen=True)
+class ColumnIR:
+    name: str
+    type: str                     # base type as inferred, e.g. "VARCHAR", "INT"
+    params: Tuple[int, ...] = ()  # e.g. (255,) for VARCHAR(255), (10, 2) for NUMERIC(10, 2)
+    nullable: bool = True
+    canonical_name: Optional[str] = None
+
+    @classmethod
+    def from_type(cls, name: str, type_text: str, **kwargs) -> "ColumnIR":
+        match = TYPE_PATTERN.match(type_text or "TEXT")
+        if not match:
+            return cls(name=name, type=(type_text or "TEXT").upper(), **kwargs)
+        base, params = match.groups()
+        values = tuple(int(p) for p in re.findall(r'\d+', params or ""))
+        return cls(name=name, type=base.upper(), params=values, **kwargs)
+
+
+@dataclass(frozen=True)
+class ForeignKeyIR:
+    table: str
+    columns: Tuple[str, ...]
+    ref_table: str
+    ref_columns: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class IndexIR:
+    name: str
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+    method: Optional[str] = None  # e.g. "brin"; dialects without it fall back to a plain index
+    where: Optional[str] = None   # partial-index predicate, where supported
+    where_not_null: Optional[str] = None  # partial index on this column IS NOT NULL, quoted per dialect
+    comment: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TableIR:
+    name: str
+    columns: Tuple[ColumnIR, ...]
+    primary_key: Tuple[str, ...] = ()
+
+    def column(self, name: str) -> Optional[ColumnIR]:
+        return next((c for c in self.columns if c.name == name), None)
+
+
+@dataclass(frozen=True, eq=False)
+class SchemaIR:
+    """
+    Dialect-neutral description of a generated schema. Immutable, and compared
+    and hashed by content digest, so rendered DDL can be memoized per schema.
+    """
+    tables: Tuple[TableIR, ...]
+    foreign_keys: Tuple[ForeignKeyIR, ...] = ()
+    indexes: Tuple[IndexIR, ...] = field(default=())
+
+    @cached_property
+    def digest(self) -> str:
+        payload = "\n".join(self.table_digests.values()) + repr((self.foreign_keys, self.indexes))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SchemaIR) and self.digest == other.digest
+
+    def table(self, name: str) -> Optional[TableIR]:
+        return next((t for t in self.tables if t.name == name), None)
+
+    @cached_property
+    def table_digests(self) -> Dict[str, str]:
+        """
+        Per-table digest over its columns, key, outgoing FKs and indexes. The
+        dataclass reprs are plain field values, so they serve as a stable
+        canonical form and are much cheaper than asdict + json.
+        """
+        parts: Dict[str, List] = {t.name: [repr(t)] for t in self.tables}
+        for item in self.foreign_keys + self.indexes:
+            if item.table in parts:
+                parts[item.table].append(repr(item))
+        return {
+            name: hashlib.sha256("\n".join(part).encode("utf-8")).hexdigest()
+            for name, part in parts.items()
+        }
+
+    def _payload(self) -> Dict:
+        return {
+            "tables": [asdict(t) for t in self.tables],
+            "foreign_keys": [asdict(fk) for fk in self.foreign_keys],
+            "indexes": [asdict(ix) for ix in self.indexes],
+        }
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable form, stored with the session (includes the digest)"""
+        return {**self._payload(), "digest": self.digest}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SchemaIR":
+        return cls(
+            tables=tuple(
+                TableIR(
+                    name=t["name"],
+                    columns=tuple(
+                        ColumnIR(**{**c, "params": tuple(c.get("params", ()))})
+                        for c in t["columns"]
+                    ),
+                    primary_key=tuple(t.get("primary_key", ())),
+                )
+                for t in data.get("tables", [])
+            ),
+            foreign_keys=tuple(
+                ForeignKeyIR(
+                    table=fk["table"],
+                    columns=tuple(fk["columns"]),
+                    ref_table=fk["ref_table"],
+                    ref_columns=tuple(fk["ref_columns"]),
+                )
+                for fk in data.get("foreign_keys", [])
+            ),
+            indexes=tuple(
+                IndexIR(**{**ix, "columns": tuple(ix["columns"])})
+                for ix in data.get("indexes", [])
+            ),
+        )
+
+    def to_normalized(self) -> Tuple[Dict, Dict]:
+        """(normalized_schema, keys) in the shape generate_mermaid / generate_dbml expect"""
+        schema = {
+            t.name: {
+                c.name: {
+                    "type": render_type(c),
+                    "nullable": c.nullable,
+                    "canonical_name": c.canonical_name,
+                }
+                for c in t.columns
+            }
+            for t in self.tables
+        }
+        keys = {
+            "primary_keys": {
+                t.name: [{"column": col, "selected": True} for col in t.primary_key]
+                for t in self.tables if t.primary_key
+            },
+            "foreign_keys": [
+                {
+                    "source_table": fk.table,
+                    "source_column": src,
+                    "target_table": fk.ref_table,
+                    "target_column": tgt,
+                }
+                for fk in self.foreign_keys
+                for src, tgt in zip(fk.columns, fk.ref_columns)
+            ],
+        }
+        return schema, keys
+
+
+def render_type(column: ColumnIR) -> str:
+    """Inferred type text as it came in, e.g. "VARCHAR(20)" """
+    if column.params:
+        return f"{column.type}({', '.join(str(p) for p in column.params)})"
+    return column.type
+
+
+def build_schema_ir(normalized_schema: Dict,
+                    keys: Dict,
+                    composite_pk_fallbacks: Optional[Dict] = None,
+                    indexes: Optional[List[IndexIR]] = None) -> SchemaIR:
+    """
+    Build the IR from the runner's normalized schema and key suggestions (or a
+    parsed script), dropping FKs whose target is not in the schema. Every
+    selected PK entry is part of the key, so composite keys survive a re-parse.
+    """
+    tables = []
+    for table, columns in normalized_schema.items():
+        selected = tuple(pk["column"] for pk in keys.get("primary_keys", {}).get(table, []) if pk.get("selected"))
+        if selected:
+            primary_key = selected
+        elif composite_pk_fallbacks and table in composite_pk_fallbacks:
+            primary_key = tuple(composite_pk_fallbacks[table]["columns"])
+        else:
+            primary_key = ()
+
+        tables.append(TableIR(
+            name=table,
+            columns=tuple(
+                ColumnIR.from_type(
+                    col_name,
+                    meta.get("type", "TEXT"),
+                    nullable=meta.get("nullable") is not False,
+                    canonical_name=meta.get("canonical_name"),
+                )
+                for col_name, meta in columns.items()
+            ),
+            primary_key=primary_key,
+        ))
+
+    foreign_keys = tuple(
+        ForeignKeyIR(
+            table=fk["source_table"],
+            columns=(fk["source_column"],),
+            ref_table=fk["target_table"],
+            ref_columns=(fk["target_column"],),
+        )
+        for fk in keys.get("foreign_keys", [])
+        if fk["target_table"] in normalized_schema
+        and fk["target_column"] in normalized_schema[fk["target_table"]]
+    )
+    if indexes is None:
+        indexes = [
+            IndexIR(**{**ix, "columns": tuple(ix["columns"])})
+            for ix in keys.get("indexes", [])
+            if ix["table"] in normalized_schema
+        ]
+    return SchemaIR(tables=tuple(tables), foreign_keys=foreign_keys, indexes=tuple(indexes))
@@ -1,3 +1,4 @@
+import logging
 import uuid
 import os
 import pandas as pd
@@ -6,21 +7,40 @@ import csv
 import re
 from backend.services.key_suggestion import KeyPrioritizer
 from backend.services.fuzzy_matching import FuzzyEntityMatcher
-from backend.services.entity_grouper import group_columns_by_fuzzy_match, suggest_canonical_names
-from backend.services.sql_generator import SQLGenerator
+from backend.services.column_name_index import ColumnNameIndex
+from backend.config import Config
+from backend.services.entity_grouper import (
+    cluster_columns_by_similarity, group_columns_by_fuzzy_match, suggest_canonical_names
+)
+from backend.services.schema_ir import build_schema_ir
+from backend.services.ddl_emitters import render_ddl
+from backend.services.column_stats import profile_schema, profile_series
+from backend.services.index_advisor import advice_comments, apply_advice
+from backend.services.storage_advisor import storage_advice
 from backend.models.schema_models import TableProfile, ColumnProfile
-from backend.services.type_inference import infer_column_type
+from backend.services.type_inference import align_key_types, infer_column_type
 from backend.utils.data_loader import clean_dataframe
 from backend.utils.file_handler import detect_encoding, check_file_validity
-from backend.services.llm_schema_reviewer import review_schema_with_llm
-from backend.services.sql_generator import generate_mermaid
+from backend.services.llm_schema_reviewer import parse_review_sections, review_schema_with_llm
+from backend.services.sql_generator import generate_mermaid, generate_mermaid_partitioned
 from backend.services.decomposer import decompose_flat_file_3nf
+from backend.services.materializer import add_surrogate_keys, decomposition_layout
 from backend.utils.json_csv import json_to_clean_csv
 from backend.services.composite_key_detector import suggest_composite_key
 from backend.utils.table_overlap_detector import detect_overlapping_tables
 from backend.models.schema_models import SchemaHistory
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Minimum column similarity for two columns to be grouped as the same entity
+GROUPING_THRESHOLD = 0.75
+# Minimum column-name TF-IDF similarity for name-only evidence
+NAME_SIMILARITY_THRESHOLD = 0.8
+# Entity groups larger than this are split along their weakest edges
+MAX_ENTITY_GROUP_SIZE = 50
+# Schemas with more tables than this also get an ERD split into partitions of this size
+ERD_PARTITION_SIZE = 50
 
 
 def sanitize_table_name(filename: str) -> str:
@@ -33,6 +53,7 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
 
     schema = {}
     data_samples = {}
+    profiled = {}
     rejected_files = {}
 
     for path in file_paths:
@@ -95,9 +116,12 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
             null_percent = col_series.isnull().mean()
             is_nullable = (null_percent > 0.01)
             sample_values = col_data.sample(min(5, len(col_data)), random_state=42).astype(str).tolist()
+            # Full-column scan, so numeric types fit the whole range, not just the samples
+            col_stats = profile_series(col_series)
+            profiled.setdefault(table_key, {})[col] = col_stats
 
             columns[col] = {
-                "type": infer_column_type(sample_values),
+                "type": infer_column_type(sample_values, col_stats),
                 "nullable": is_nullable,
                 "unique_ratio": col_data.nunique() / len(col_data) if len(col_data) else 0.0,
                 "sample_values": sample_values
@@ -147,16 +171,25 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
     warnings = []
     overlaps = detect_overlapping_tables(validated_schema)
 
-    kp = KeyPrioritizer()
-    relationships = kp.suggest_relationships(validated_schema)
+    name_index = ColumnNameIndex.from_schema(validated_schema)
+
+    kp = KeyPrioritizer(min_name_similarity=NAME_SIMILARITY_THRESHOLD)
+    relationships = kp.suggest_relationships(validated_schema, name_index=name_index)
     pk_dict = {
         table: [{"column": pk.name, "selected": True}]
-        for table, pk in kp._find_primary_key_candidates(validated_schema).items()
+        for table, pk in kp.primary_key_candidates.items()
         if pk is not None
     }
 
     fk_list = []
+    seen_fks = set()
     for r in relationships:
+        # Several evidence sources can propose the same FK; keep the most confident one
+        fk_key = (r.source_table, r.source_column, r.target_table, r.target_column)
+        if fk_key in seen_fks:
+            continue
+        seen_fks.add(fk_key)
+
         if r.target_table not in validated_schema:
             warnings.append(
                 f"⚠️ {r.source_table}.{r.source_column} appears to reference {r.target_table}.{r.target_column}, but no such table was uploaded."
@@ -169,9 +202,24 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
             "target_column": r.target_column
         })
 
-    matcher = FuzzyEntityMatcher()
-    matches = matcher.find_matches_across_tables(validated_schema, data_samples)
-    groups = group_columns_by_fuzzy_match(matches, threshold=0.75)
+    matcher = FuzzyEntityMatcher({'match_rate_threshold': GROUPING_THRESHOLD})
+    similarities = matcher.find_matches_across_tables(validated_schema, data_samples)
+
+    # Similar names lift pairs that share some values over GROUPING_THRESHOLD; pairs
+    # without value evidence are left out, since names alone never form a group edge
+    for src_table, src_col, tgt_table, tgt_col, score in name_index.candidate_pairs(
+        min_similarity=NAME_SIMILARITY_THRESHOLD
+    ):
+        similarities.add_name_score(src_table, src_col, tgt_table, tgt_col, score)
+
+    if Config.ENTITY_GROUPING == "components":
+        groups = group_columns_by_fuzzy_match(similarities, threshold=GROUPING_THRESHOLD)
+    else:
+        groups = cluster_columns_by_similarity(
+            similarities,
+            threshold=GROUPING_THRESHOLD,
+            max_group_size=MAX_ENTITY_GROUP_SIZE
+        )
 
     if not groups:
         from collections import defaultdict
@@ -184,9 +232,15 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
 
     canonical_groups = suggest_canonical_names(groups)
 
+    source_schema = None
+    source_table = None
     if len(validated_schema) == 1:
         original_table = list(validated_schema.values())[0]
+        source_table = original_table.name
         validated_schema = decompose_flat_file_3nf(original_table.name, original_table, canonical_groups)
+        source_schema = {
+            "decomposition": decomposition_layout(original_table.name, original_table.file_path, validated_schema)
+        }
     else:
         for group in canonical_groups:
             for col in group["columns"]:
@@ -210,21 +264,38 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
         "primary_keys": pk_dict,
         "foreign_keys": fk_list
     }
+    if source_schema:
+        # Entities are linked to the base table through the materializer's surrogate keys
+        add_surrogate_keys(normalized_schema, keys, source_schema["decomposition"], composite_pk_fallbacks)
+    align_key_types(normalized_schema, keys)
 
-    sql = SQLGenerator().generate_ddl(
+    # Whole-column stats drive the deterministic index and storage advice
+    column_stats = profile_schema(
         normalized_schema,
-        keys,
-        session_id,
-        composite_pk_fallbacks=composite_pk_fallbacks
+        {table: pd.DataFrame(series) for table, series in data_samples.items()},
+        source_table,
+        profiled
     )
 
+    # Built once per session and stored, so other dialects render without re-running inference
+    schema_ir, type_advice = apply_advice(
+        build_schema_ir(normalized_schema, keys, composite_pk_fallbacks),
+        column_stats
+    )
+    sql = render_ddl(schema_ir) + advice_comments(type_advice)
+    storage = storage_advice(schema_ir, column_stats)
+    source_schema = {**(source_schema or {}), "ir": schema_ir.to_dict()}
+
     mermaid_text = generate_mermaid(normalized_schema, keys)
+    erd_partitions = None
+    if len(normalized_schema) > ERD_PARTITION_SIZE:
+        erd_partitions = generate_mermaid_partitioned(normalized_schema, keys, max_tables=ERD_PARTITION_SIZE)
 
     if use_llm:
         try:
-            sql = review_schema_with_llm(sql)
-        except Exception as e:
-            print("❌ LLM schema review failed:", str(e))
+            sql, _ = parse_review_sections(review_schema_with_llm(sql, "postgres", db=db, user=username), sql)
+        except Exception:
+            logger.exception("LLM schema review failed")
 
     if validated_schema or rejected_files:
         db.add(SchemaHistory(
@@ -233,6 +304,7 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
             sql_output=sql if validated_schema else None,
             mermaid_output=mermaid_text if validated_schema else None,
             composite_pk_info=composite_pk_fallbacks if validated_schema else None,
+            source_schema=source_schema if validated_schema else None,
             rejected_files=rejected_files,
             uploaded_files=[os.path.basename(p) for p in file_paths],
             created_at=datetime.utcnow()
@@ -243,6 +315,8 @@ def run_schema_inference(file_paths: List[str], username: str, use_llm: bool = F
         "session_id": session_id,
         "sql": sql,
         "mermaid": mermaid_text,
+        "erd_partitions": erd_partitions,
+        "storage": storage,
         "warnings": warnings,
         "overlaps": overlaps,
         "rejected_files": rejected_files,
@@ -1,11 +1,18 @@
-from collections import OrderedDict
-import sqlparse
+import io
+from collections import OrderedDict, deque
 import re
 from backend.models.schema_models import ColumnProfile, TableProfile
 from datetime import datetime
+from backend.services.schema_ir import SchemaIR, build_schema_ir
+from backend.services.ddl_emitters import render_ddl
+from backend.services.entity_grouper import DisjointSet
+from backend.services.ddl_parser import parse_ddl
+from backend.services.index_advisor import advice_comments, apply_advice
+from backend.services.storage_advisor import storage_advice
 
 class SQLGenerator:
-    def generate_ddl(self, normalized_schema, keys, session_id, composite_pk_fallbacks=None):
+    def generate_ddl(self, normalized_schema, keys, session_id, composite_pk_fallbacks=None, dialect=None,
+                     column_stats=None):
         """
         Generate SQL DDL statements (CREATE TABLE + ALTER TABLE for FKs).
         
@@ -15,130 +22,206 @@ class SQLGenerator:
                 "primary_keys": {table_name: [ {"column": ..., "selected": True} ]},
                 "foreign_keys": [ {"source_table": ..., "source_column": ..., "target_table": ..., "target_column": ...} ]
             }
+            dialect: None for the generic script, or one of postgres, mysql, sqlite, sqlserver, oracle
+            column_stats: {table: {column: ColumnStats}}; when given, recommended
+                indexes and storage advice are appended (see index_advisor)
 
         Returns:
             str: Full SQL script
         """
-        ddl = []
-
-        for table, columns in normalized_schema.items():
-            # Column definitions
-            col_defs = []
-            for col_name, meta in columns.items():
-                col_type = meta.get('type', 'TEXT')  # default to TEXT if type unknown
-                nullable = meta.get('nullable')      # can be True, False, or None
-
-                col_def = f"{col_name} {col_type}"
-
-                # Handle NULL/NOT NULL explicitly
-                if nullable is False:
-                    col_def += " NOT NULL"
-                elif nullable is True:
-                    col_def += " NULL"
-                else:
-                    col_def += " NULL"  # default to NULL if unspecified
-
-                # Optional: comment for canonical name if exists
-                canonical = meta.get("canonical_name")
-                if canonical and canonical != col_name:
-                    col_def += ","  # ✅ Always add comma first
-                    col_def += f" -- suggested: {canonical}"
-
-                col_defs.append(col_def)
-
-            # Add primary key: either normal or composite fallback
-            pk_info = next(
-                (pk for pk in keys.get('primary_keys', {}).get(table, []) if pk.get('selected')),
-                None
-            )
-
-            if pk_info:
-                col_defs.append(f"PRIMARY KEY ({pk_info['column']})")
-
-            elif composite_pk_fallbacks and table in composite_pk_fallbacks:
-                col_str = ", ".join(composite_pk_fallbacks[table]["columns"])
-                col_defs.append(f"PRIMARY KEY ({col_str})")
-
-            # Create table statement
-            ddl.append(
-                f"CREATE TABLE {table} (\n  " +
-                ",\n  ".join(col_defs) +
-                "\n);"
-            )
-
-        # Foreign keys
-        for fk in keys['foreign_keys']:
-            src_table = fk['source_table']
-            src_column = fk['source_column']
-            tgt_table = fk['target_table']
-            tgt_column = fk['target_column']
-
-            warnings = []
-
-            # 🛡️ Orphan check
-            if tgt_table not in normalized_schema:
-                continue
-
-            if tgt_column not in normalized_schema[tgt_table]:
-                continue
-
-            # ✅ Add valid FK
-            ddl.append(
-                f"ALTER TABLE {src_table} ADD FOREIGN KEY ({src_column}) "
-                f"REFERENCES {tgt_table} ({tgt_column});"
-            )
-        
-        return "\n".join(ddl)
+        schema_ir = build_schema_ir(normalized_schema, keys, composite_pk_fallbacks)
+        if column_stats is None:
+            return render_ddl(schema_ir, dialect)
+        schema_ir, type_advice = apply_advice(schema_ir, column_stats)
+        return render_ddl(schema_ir, dialect) + advice_comments(type_advice)
 
+    def generate_storage_advice(self, normalized_schema, keys, column_stats, composite_pk_fallbacks=None):
+        """
+        Estimated Postgres size per table and index, plus optional partitioned
+        CREATE TABLE statements for large tables (see storage_advisor).
+        """
+        schema_ir, _ = apply_advice(build_schema_ir(normalized_schema, keys, composite_pk_fallbacks), column_stats)
+        return storage_advice(schema_ir, column_stats)
 
-def generate_mermaid(schema, keys):
-    lines = ["erDiagram"]
-    for table, columns in schema.items():
-        lines.append(f"{table} {{")
-        for col_name, col_meta in columns.items():
+
+class _LineWriter:
+    """Streams newline-separated lines into a StringIO instead of building lists of strings"""
+    def __init__(self):
+        self._out = io.StringIO()
+        self._first = True
+
+    def line(self, text):
+        if not self._first:
+            self._out.write("\n")
+        self._out.write(text)
+        self._first = False
+
+    def getvalue(self):
+        return self._out.getvalue()
+
+
+def _key_index(keys):
+    """PK columns per table and (table, column) FK sources, so role lookups are O(1)"""
+    pk_columns = {
+        table: {pk["column"] for pk in pks}
+        for table, pks in keys.get("primary_keys", {}).items()
+    }
+    fk_sources = {(fk["source_table"], fk["source_column"]) for fk in keys.get("foreign_keys", [])}
+    return pk_columns, fk_sources
+
+
+def _write_mermaid_tables(out, schema, tables, pk_columns, fk_sources):
+    for table in tables:
+        table_pks = pk_columns.get(table, ())
+        out.line(f"{table} {{")
+        for col_name, col_meta in schema[table].items():
             dtype = col_meta["type"].split("(")[0].upper()
-            is_pk = any(pk["column"] == col_name for pk in keys["primary_keys"].get(table, []))
-            is_fk = any(fk["source_table"] == table and fk["source_column"] == col_name for fk in keys["foreign_keys"])
-            role = "PK" if is_pk else "FK" if is_fk else ""
-            lines.append(f"        {dtype} {col_name} {role}".strip())
-        lines.append("    }")
+            role = "PK" if col_name in table_pks else "FK" if (table, col_name) in fk_sources else ""
+            out.line(f"        {dtype} {col_name} {role}".strip())
+        out.line("    }")
+
+
+def _relationship(fk):
+    return f"    {fk['target_table']} ||--o{{ {fk['source_table']} : has"
 
+
+def generate_mermaid(schema, keys):
+    pk_columns, fk_sources = _key_index(keys)
+    out = _LineWriter()
+    out.line("erDiagram")
+    _write_mermaid_tables(out, schema, schema, pk_columns, fk_sources)
     for fk in keys["foreign_keys"]:
-        lines.append(
-            f"    {fk['target_table']} ||--o{{ {fk['source_table']} : has"
-        )
+        out.line(_relationship(fk))
+    return out.getvalue()
+
+
+def _partition_tables(schema, foreign_keys, max_tables):
+    """
+    Split tables into FK-connected groups of at most max_tables. Large
+    components are cut in BFS order so related tables stay together; small
+    components are packed into shared partitions.
+    """
+    tables = list(schema)
+    ids = {table: i for i, table in enumerate(tables)}
+    forest = DisjointSet(len(tables))
+    neighbours = {table: [] for table in tables}
+    for fk in foreign_keys:
+        src, tgt = fk["source_table"], fk["target_table"]
+        if src in ids and tgt in ids and src != tgt:
+            forest.union(ids[src], ids[tgt])
+            neighbours[src].append(tgt)
+            neighbours[tgt].append(src)
+
+    components = {}
+    for table in tables:
+        components.setdefault(forest.find(ids[table]), []).append(table)
+
+    partitions, packed = [], []
+    for members in sorted(components.values(), key=len, reverse=True):
+        if len(members) > max_tables:
+            # BFS from the best-connected table, then cut into slices
+            start = max(members, key=lambda t: len(neighbours[t]))
+            order, seen, queue = [], {start}, deque([start])
+            while queue:
+                table = queue.popleft()
+                order.append(table)
+                for other in neighbours[table]:
+                    if other not in seen:
+                        seen.add(other)
+                        queue.append(other)
+            partitions.extend(order[i:i + max_tables] for i in range(0, len(order), max_tables))
+        elif len(packed) + len(members) <= max_tables:
+            packed.extend(members)
+        else:
+            partitions.append(packed)
+            packed = list(members)
+    if packed:
+        partitions.append(packed)
+    return partitions
+
+
+def generate_mermaid_partitioned(schema, keys, max_tables=50):
+    """
+    ERD for very large schemas: an overview with table names and relationships
+    only, plus one full diagram per FK-connected partition of at most max_tables.
+    Relationships that leave a partition are still drawn, so the neighbouring
+    table appears there as an empty box.
+    """
+    pk_columns, fk_sources = _key_index(keys)
+    foreign_keys = keys["foreign_keys"]
+
+    overview = _LineWriter()
+    overview.line("erDiagram")
+    drawn_pairs, linked_tables = set(), set()
+    for fk in foreign_keys:
+        pair = (fk["target_table"], fk["source_table"])
+        if pair not in drawn_pairs:
+            drawn_pairs.add(pair)
+            linked_tables.update(pair)
+            overview.line(_relationship(fk))
+    for table in schema:
+        if table not in linked_tables:
+            overview.line(f"    {table}")
+
+    fks_by_table = {}
+    for i, fk in enumerate(foreign_keys):
+        fks_by_table.setdefault(fk["source_table"], []).append(i)
+        if fk["target_table"] != fk["source_table"]:
+            fks_by_table.setdefault(fk["target_table"], []).append(i)
+
+    diagrams = []
+    for tables in _partition_tables(schema, foreign_keys, max_tables):
+        members = set(tables)
+        out = _LineWriter()
+        out.line("erDiagram")
+        _write_mermaid_tables(out, schema, tables, pk_columns, fk_sources)
+
+        drawn, external = set(), set()
+        for table in tables:
+            for i in fks_by_table.get(table, ()):
+                if i in drawn:
+                    continue
+                drawn.add(i)
+                fk = foreign_keys[i]
+                out.line(_relationship(fk))
+                external.update(t for t in (fk["source_table"], fk["target_table"]) if t not in members)
+
+        diagrams.append({
+            "tables": tables,
+            "external_tables": sorted(external),
+            "mermaid": out.getvalue(),
+        })
+
+    return {"overview": overview.getvalue(), "diagrams": diagrams}
 
-    return "\n".join(lines)
 
 def generate_dbml(schema, keys):
-    lines = []
+    pk_columns, _ = _key_index(keys)
+    out = _LineWriter()
 
     for table, columns in schema.items():
-        lines.append(f"Table {table} {{")
-        pk_columns = {
-            pk["column"]
-            for pk in keys["primary_keys"].get(table, [])
-        }
+        out.line(f"Table {table} {{")
+        table_pks = pk_columns.get(table, ())
 
         for col_name, col_meta in columns.items():
             dtype = col_meta["type"].upper()
             tags = []
 
-            if col_name in pk_columns:
+            if col_name in table_pks:
                 tags.append("primary key")
             elif not col_meta["nullable"]:
                 tags.append("not null")
 
             tag_str = f" [{', '.join(tags)}]" if tags else ""
-            lines.append(f"  {col_name} {dtype}{tag_str}")
-        lines.append("}")
+            out.line(f"  {col_name} {dtype}{tag_str}")
+        out.line("}")
 
     for fk in keys["foreign_keys"]:
-        lines.append(
+        out.line(
             f"Ref: {fk['source_table']}.{fk['source_column']} > {fk['target_table']}.{fk['target_column']}"
         )
 
-    return "\n".join(lines)
+    return out.getvalue()
 
 
 class SQLParser:
@@ -146,57 +229,16 @@ class SQLParser:
         """
         Parse cleaned SQL string back into structured schema format
         usable for generate_mermaid / generate_dbml.
+        Composite primary keys list every column; keys also carry "indexes".
         """
-        statements = sqlparse.parse(sql)
-        schema = {}
-        keys = {
-            "primary_keys": {},
-            "foreign_keys": []
-        }
-
-        for stmt in statements:
-            stmt_str = str(stmt)
-            table_match = re.search(r'CREATE TABLE (\w+)', stmt_str, re.IGNORECASE)
-            if not table_match:
-                continue
-
-            table_name = table_match.group(1)
-            schema[table_name] = {}
-
-            # Extract columns and keys
-            column_lines = stmt_str.split("\n")
-            for line in column_lines:
-                line = line.strip().rstrip(",")
-
-                # Match PRIMARY KEY
-                pk_match = re.match(r'PRIMARY KEY \((\w+)\)', line, re.IGNORECASE)
-                if pk_match:
-                    col = pk_match.group(1)
-                    keys["primary_keys"][table_name] = [{"column": col, "selected": True}]
-                    continue
+        return parse_ddl(sql)
 
-                # Match FOREIGN KEY
-                fk_match = re.match(
-                    r'FOREIGN KEY \((\w+)\) REFERENCES (\w+) \((\w+)\)', line, re.IGNORECASE)
-                if fk_match:
-                    source_col, target_table, target_col = fk_match.groups()
-                    keys["foreign_keys"].append({
-                        "source_table": table_name,
-                        "source_column": source_col,
-                        "target_table": target_table,
-                        "target_column": target_col
-                    })
-                    continue
 
-                # Match column definition
-                col_match = re.match(r'(\w+)\s+([A-Z]+(?:\(\d+\))?)(.*)', line)
-                if col_match:
-                    col_name, col_type, rest = col_match.groups()
-                    is_nullable = "NOT NULL" not in rest.upper()
-                    schema[table_name][col_name] = {
-                        "type": col_type,
-                        "nullable": is_nullable,
-                        "canonical_name": None
-                    }
-
-        return schema, keys
\ No newline at end of file
+def stored_schema_ir(schema) -> SchemaIR:
+    """The IR of a saved SchemaHistory session"""
+    ir_data = (schema.source_schema or {}).get("ir")
+    if ir_data:
+        return SchemaIR.from_dict(ir_data)
+    # Sessions saved before the IR was stored (and AI versions): rebuild it from their DDL
+    parsed_schema, keys = SQLParser().parse_sql(schema.sql_output or "")
+    return build_schema_ir(parsed_schema, keys)
@@ -0,0 +1,276 @@
+# backend/services/storage_advisor.py
+import math
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from backend.services.column_stats import ColumnStats
+from backend.services.ddl_emitters import EMITTERS
+from backend.services.schema_ir import ColumnIR, IndexIR, SchemaIR, TableIR
+
+# Postgres heap layout
+PAGE_SIZE = 8192
+PAGE_HEADER = 24
+ITEM_POINTER = 4
+TUPLE_HEADER = 23
+MAXALIGN = 8
+# B-tree leaves are split at 90% full; inner pages add roughly 1%
+BTREE_FILL = 0.9
+BTREE_INNER_OVERHEAD = 1.01
+# BRIN keeps one summary tuple per 128 heap pages
+BRIN_PAGES_PER_RANGE = 128
+
+FIXED_WIDTHS = {
+    "BOOLEAN": 1, "SMALLINT": 2, "INT": 4, "INTEGER": 4, "BIGINT": 8, "REAL": 4,
+    "FLOAT": 8, "DOUBLE": 8, "DOUBLE PRECISION": 8, "DATE": 4, "TIMESTAMP": 8,
+    "DATETIME": 8, "UUID": 16,
+}
+
+# Tables estimated above this size get a partitioning recommendation
+PARTITION_MIN_BYTES = 1024 ** 3
+# List partitioning candidates: few distinct values, almost never NULL
+LIST_PARTITION_MAX_VALUES = 50
+LIST_PARTITION_MAX_NULL_FRACTION = 0.01
+# Range partitions emitted per table before the interval is widened
+MAX_RANGE_PARTITIONS = 60
+
+
+@dataclass(frozen=True)
+class TableEstimate:
+    table: str
+    rows: int
+    row_bytes: int
+    table_bytes: int
+    index_bytes: Dict[str, int]
+
+    @property
+    def total_bytes(self) -> int:
+        return self.table_bytes + sum(self.index_bytes.values())
+
+
+@dataclass(frozen=True)
+class PartitionAdvice:
+    table: str
+    strategy: str                 # "range" or "list"
+    column: str
+    interval: Optional[str] = None  # "day", "month" or "year" for range
+    bounds: Tuple[str, ...] = ()    # range boundaries, ISO dates
+    reason: str = ""
+
+
+def _align(size: float) -> int:
+    return int(math.ceil(size / MAXALIGN) * MAXALIGN)
+
+
+def _column_width(column: ColumnIR, stats: Optional[ColumnStats]) -> float:
+    """Average stored bytes for one non-null value"""
+    if column.type in FIXED_WIDTHS:
+        return FIXED_WIDTHS[column.type]
+    if column.type in ("NUMERIC", "DECIMAL"):
+        digits = column.params[0] if column.params else (stats.max_width if stats else 10)
+        return 3 + math.ceil(digits / 4) * 2
+    width = stats.avg_width if stats else (column.params[0] / 2 if column.params else 32)
+    # Short varlena header under 127 bytes, 4-byte header above
+    return width + (1 if width < 127 else 4)
+
+
+def _row_bytes(table: TableIR, stats: Dict[str, ColumnStats]) -> int:
+    header = _align(TUPLE_HEADER + math.ceil(len(table.columns) / 8))
+    data = 0.0
+    for column in table.columns:
+        col_stats = stats.get(column.name)
+        filled = 1.0 - col_stats.null_fraction if col_stats else 1.0
+        data += _column_width(column, col_stats) * filled
+    return header + _align(data)
+
+
+def _btree_bytes(rows: int, key_width: float) -> int:
+    entry = 8 + _align(key_width) + ITEM_POINTER
+    per_page = max(1, int((PAGE_SIZE - PAGE_HEADER) * BTREE_FILL // entry))
+    pages = math.ceil(rows / per_page) * BTREE_INNER_OVERHEAD + 1  # + metapage
+    return int(math.ceil(pages)) * PAGE_SIZE
+
+
+def _brin_bytes(table_pages: int) -> int:
+    # Metapage, revmap and one small summary tuple per range
+    ranges = math.ceil(table_pages / BRIN_PAGES_PER_RANGE)
+    return (2 + max(1, math.ceil(ranges * 32 / PAGE_SIZE))) * PAGE_SIZE
+
+
+def estimate_table(table: TableIR, indexes: List[IndexIR], stats: Dict[str, ColumnStats]) -> TableEstimate:
+    """Postgres on-disk size of a table and its indexes at the profiled row count"""
+    rows = max((s.row_count for s in stats.values()), default=0)
+    row_bytes = _row_bytes(table, stats)
+    rows_per_page = max(1, (PAGE_SIZE - PAGE_HEADER) // (row_bytes + ITEM_POINTER))
+    pages = math.ceil(rows / rows_per_page) if rows else 0
+
+    def key_width(columns):
+        return sum(
+            _column_width(table.column(c), stats.get(c)) if table.column(c) else 8
+            for c in columns
+        )
+
+    index_bytes = {}
+    if table.primary_key:
+        index_bytes[f"{table.name}_pkey"] = _btree_bytes(rows, key_width(table.primary_key))
+    for index in indexes:
+        if index.method == "brin":
+            index_bytes[index.name] = _brin_bytes(pages)
+        else:
+            indexed = rows
+            if (index.where or index.where_not_null) and len(index.columns) == 1 and index.columns[0] in stats:
+                indexed = int(rows * (1.0 - stats[index.columns[0]].null_fraction))
+            index_bytes[index.name] = _btree_bytes(indexed, key_width(index.columns))
+
+    return TableEstimate(
+        table=table.name,
+        rows=rows,
+        row_bytes=row_bytes,
+        table_bytes=pages * PAGE_SIZE,
+        index_bytes=index_bytes,
+    )
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _add_interval(day: date, interval: str) -> date:
+    if interval == "year":
+        return date(day.year + 1, 1, 1)
+    if interval == "month":
+        return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+    return date.fromordinal(day.toordinal() + 1)
+
+
+def _range_bounds(low: date, high: date) -> Tuple[str, Tuple[str, ...]]:
+    """Narrowest of day/month/year whose partition count stays under the cap"""
+    for interval in ("day", "month", "year"):
+        start = {"day": low, "month": _month_start(low), "year": date(low.year, 1, 1)}[interval]
+        bounds = [start]
+        while bounds[-1] <= high and len(bounds) <= MAX_RANGE_PARTITIONS + 1:
+            bounds.append(_add_interval(bounds[-1], interval))
+        if bounds[-1] > high:
+            return interval, tuple(b.isoformat() for b in bounds)
+    return "year", (date(low.year, 1, 1).isoformat(), date(high.year + 1, 1, 1).isoformat())
+
+
+def recommend_partitioning(table: TableIR, estimate: TableEstimate,
+                           stats: Dict[str, ColumnStats]) -> Optional[PartitionAdvice]:
+    """
+    RANGE on a date column (preferring one that increases in load order), else
+    LIST on a low-cardinality column, for tables over PARTITION_MIN_BYTES.
+    """
+    if estimate.total_bytes < PARTITION_MIN_BYTES:
+        return None
+
+    dates = [
+        (not s.monotonic, s.null_count, name) for name, s in stats.items()
+        if s.is_date and s.date_min and table.column(name) is not None
+    ]
+    if dates:
+        _, _, column = min(dates)
+        col_stats = stats[column]
+        interval, bounds = _range_bounds(date.fromisoformat(col_stats.date_min),
+                                         date.fromisoformat(col_stats.date_max))
+        return PartitionAdvice(
+            table=table.name,
+            strategy="range",
+            column=column,
+            interval=interval,
+            bounds=bounds,
+            reason=f"{col_stats.date_min}..{col_stats.date_max}, {len(bounds) - 1} {interval} partitions",
+        )
+
+    lists = [
+        (s.distinct_count, name) for name, s in stats.items()
+        if 2 <= s.distinct_count <= LIST_PARTITION_MAX_VALUES
+        and s.null_fraction <= LIST_PARTITION_MAX_NULL_FRACTION
+        and s.numeric_min is None
+        and table.column(name) is not None
+    ]
+    if lists:
+        distinct, column = min(lists)
+        return PartitionAdvice(
+            table=table.name,
+            strategy="list",
+            column=column,
+            reason=f"{distinct} distinct values",
+        )
+    return None
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+def _partitioned_table_ddl(table: TableIR, advice: PartitionAdvice) -> List[str]:
+    emitter = EMITTERS["postgres"]
+    # Postgres requires the partition key in every unique constraint
+    if table.primary_key and advice.column not in table.primary_key:
+        table = replace(table, primary_key=table.primary_key + (advice.column,))
+    create = emitter.create_table(table, [])
+    statements = [create[:-1] + f" PARTITION BY {advice.strategy.upper()} ({emitter.quote(advice.column)});"]
+    name = emitter.quote(table.name)
+    if advice.strategy == "range":
+        for low, high in zip(advice.bounds, advice.bounds[1:]):
+            suffix = low.replace("-", "_")[:{"year": 4, "month": 7, "day": 10}[advice.interval]]
+            statements.append(
+                f"CREATE TABLE {emitter.quote(f'{table.name}_{suffix}')} PARTITION OF {name} "
+                f"FOR VALUES FROM ('{low}') TO ('{high}');"
+            )
+    statements.append(f"CREATE TABLE {emitter.quote(f'{table.name}_default')} PARTITION OF {name} DEFAULT;")
+    if advice.strategy == "list":
+        statements.append(
+            f"-- Add one PARTITION OF {name} FOR VALUES IN (...) per {advice.column} value, "
+            f"then move rows out of the default partition"
+        )
+    return statements
+
+
+def storage_advice(schema: SchemaIR, column_stats: Dict[str, Dict[str, ColumnStats]]) -> Dict:
+    """
+    Size estimate for every profiled table and its indexes, and optional
+    Postgres DDL for the tables worth partitioning. The DDL replaces those
+    tables' CREATE TABLE statements; it is advisory and not part of the script.
+    """
+    indexes_by_table: Dict[str, List[IndexIR]] = {}
+    for index in schema.indexes:
+        indexes_by_table.setdefault(index.table, []).append(index)
+
+    estimates, partitions, statements = {}, [], []
+    for table in schema.tables:
+        stats = column_stats.get(table.name)
+        if not stats:
+            continue
+        estimate = estimate_table(table, indexes_by_table.get(table.name, []), stats)
+        estimates[table.name] = {
+            "rows": estimate.rows,
+            "row_bytes": estimate.row_bytes,
+            "table_bytes": estimate.table_bytes,
+            "index_bytes": estimate.index_bytes,
+            "total": _format_bytes(estimate.total_bytes),
+        }
+        advice = recommend_partitioning(table, estimate, stats)
+        if advice:
+            partitions.append({
+                "table": advice.table,
+                "strategy": advice.strategy,
+                "column": advice.column,
+                "interval": advice.interval,
+                "reason": advice.reason,
+            })
+            statements.append(
+                f"-- {table.name}: ~{_format_bytes(estimate.total_bytes)} over {estimate.rows} rows; "
+                f"{advice.strategy} partitioning on {advice.column} ({advice.reason})"
+            )
+            statements.extend(_partitioned_table_ddl(table, advice))
+
+    return {
+        "estimates": estimates,
+        "partitioning": partitions,
+        "partition_sql": "\n".join(statements) if statements else None,
+    }
@@ -1,15 +1,113 @@
 import re
 import math
-from typing import List
+from typing import Dict, List, Optional
 from dateutil import parser
+from backend.services.column_stats import ColumnStats
 
-def infer_column_type(sample_values: List[str]) -> str:
+# Narrowest first; bounds are inclusive
+INTEGER_RANGES = [
+    ("SMALLINT", -2 ** 15, 2 ** 15 - 1),
+    ("INT", -2 ** 31, 2 ** 31 - 1),
+    ("BIGINT", -2 ** 63, 2 ** 63 - 1),
+]
+# Decimals with at most this many fractional digits are typed NUMERIC(p, s), not FLOAT
+MAX_EXACT_SCALE = 6
+# Portable NUMERIC precision limit (SQL Server and Oracle stop at 38)
+MAX_EXACT_PRECISION = 38
+# Extra integer digits over the observed maximum, so NUMERIC columns have room to grow
+NUMERIC_HEADROOM_DIGITS = 2
+INTEGER_KEY_ORDER = ["SMALLINT", "INT", "BIGINT"]
+INTEGER_TYPES = {"SMALLINT", "INT", "INTEGER", "BIGINT"}
+
+
+def base_type(detected_type: str) -> str:
+    """"NUMERIC(12, 2)" -> "NUMERIC" """
+    return detected_type.split("(")[0].strip().upper()
+
+
+def key_type(detected_type: str) -> str:
+    """Base type with integer widths collapsed, for comparing FK and PK columns"""
+    base = base_type(detected_type)
+    return "INT" if base in INTEGER_TYPES else base
+
+
+def numeric_type(stats: ColumnStats) -> Optional[str]:
     """
-    Infer the best SQL data type from a list of sample values.
+    Narrowest correct type for an all-numeric column from its full-column
+    range, precision and scale; None when the column is not numeric.
+    """
+    if stats.numeric_min is None:
+        return None
+    if stats.is_integer:
+        for name, low, high in INTEGER_RANGES:
+            if low <= stats.numeric_min and stats.numeric_max <= high:
+                return name
+        return f"NUMERIC({max(stats.max_int_digits, 1)}, 0)"
+
+    precision = max(stats.max_int_digits, 1) + NUMERIC_HEADROOM_DIGITS + stats.max_scale
+    if stats.max_scale <= MAX_EXACT_SCALE and precision <= MAX_EXACT_PRECISION:
+        return f"NUMERIC({precision}, {stats.max_scale})"
+    return "FLOAT"
+
+
+def infer_column_type(sample_values: List[str], stats: Optional[ColumnStats] = None) -> str:
+    """
+    Infer the best SQL data type from a list of sample values. With full-column
+    stats, numeric columns get a range-aware type instead of INT / FLOAT.
     """
     if not sample_values:
         return "TEXT"
 
+    detected = _infer_from_samples(sample_values)
+    if stats is None:
+        return detected
+    # 0/1 samples from a column that also holds other numbers
+    if detected == "BOOLEAN" and stats.numeric_min is not None and stats.distinct_count > 2:
+        detected = "INT"
+    if detected not in ("INT", "FLOAT"):
+        return detected
+    exact = numeric_type(stats)
+    if exact is not None:
+        return exact
+    # The samples looked numeric but the full column is not
+    return _text_type(stats.max_width)
+
+
+def align_key_types(normalized_schema: Dict, keys: Dict) -> None:
+    """
+    Give both ends of every integer FK the same type, and keep key columns at
+    INT or wider, since keys keep growing after the observed load.
+    """
+    def widen(table, column, floor):
+        meta = normalized_schema.get(table, {}).get(column)
+        if meta is not None and meta["type"] in INTEGER_KEY_ORDER:
+            if INTEGER_KEY_ORDER.index(meta["type"]) < INTEGER_KEY_ORDER.index(floor):
+                meta["type"] = floor
+            return meta["type"]
+        return None
+
+    for table, pks in keys.get("primary_keys", {}).items():
+        for pk in pks:
+            widen(table, pk["column"], "INT")
+    for fk in keys.get("foreign_keys", []):
+        source = widen(fk["source_table"], fk["source_column"], "INT")
+        target = widen(fk["target_table"], fk["target_column"], "INT")
+        if source and target and source != target:
+            wider = max(source, target, key=INTEGER_KEY_ORDER.index)
+            widen(fk["source_table"], fk["source_column"], wider)
+            widen(fk["target_table"], fk["target_column"], wider)
+
+
+def _text_type(max_len: int) -> str:
+    # Default to VARCHAR(n) if short, TEXT otherwise
+    adjusted_len = max_len + 10
+    rounded_len = ((adjusted_len + 9) // 10) * 10  # Always round UP to next 10
+
+    return f"VARCHAR({rounded_len})" if rounded_len < 255 else "TEXT"
+
+
+def _infer_from_samples(sample_values: List[str]) -> str:
+    """Type from the sample values alone"""
     has_float = False
     has_int = True
     has_date = True
@@ -47,9 +145,4 @@ def infer_column_type(sample_values: List[str]) -> str:
     if has_date:
         return "DATE"
 
-    # Default to VARCHAR(n) if short, TEXT otherwise
-    max_len = max(len(v) for v in sample_values)
-    adjusted_len = max_len + 10
-    rounded_len = ((adjusted_len + 9) // 10) * 10  # Always round UP to next 10
-
-    return f"VARCHAR({rounded_len})" if rounded_len < 255 else "TEXT"
+    return _text_type(max(len(v) for v in sample_values))
@@ -0,0 +1,71 @@
+# backend/services/worker_pool.py
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+from backend.config import Config
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class BoundedExecutor:
+    """
+    ThreadPoolExecutor with a bounded submission queue.
+
+    submit() blocks once max_workers tasks are running and queue_size more are
+    waiting, so concurrent requests cannot pile unbounded work onto the pool.
+    """
+    def __init__(self, max_workers: int, queue_size: int, thread_name_prefix: str = 'worker'):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+
+    def submit(self, fn: Callable[..., R], *args, **kwargs) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def map_ordered(self, fn: Callable[[T], R], items: Iterable[T], window: int) -> Iterator[R]:
+        """Yield fn(item) in input order, keeping at most `window` of this caller's tasks in flight"""
+        pending = deque()
+        for item in items:
+            pending.append(self.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_matcher_pool: Optional[BoundedExecutor] = None
+_matcher_pool_lock = threading.Lock()
+
+
+def get_matcher_pool() -> BoundedExecutor:
+    """Application-lifetime pool shared by every FuzzyEntityMatcher"""
+    global _matcher_pool
+    with _matcher_pool_lock:
+        if _matcher_pool is None:
+            _matcher_pool = BoundedExecutor(
+                max_workers=Config.MATCHER_MAX_WORKERS,
+                queue_size=Config.MATCHER_QUEUE_SIZE,
+                thread_name_prefix='matcher'
+            )
+        return _matcher_pool
+
+
+def shutdown_matcher_pool(wait: bool = True) -> None:
+    """Stop the shared pool; called from the FastAPI lifespan on shutdown"""
+    global _matcher_pool
+    with _matcher_pool_lock:
+        pool, _matcher_pool = _matcher_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,9 @@
+# backend/tests/conftest.py
+import os
+import sys
+from pathlib import Path
+
+# Imports are absolute (backend.services...), as in the app image where PYTHONPATH is the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# backend.db refuses to import without a database; tests never connect to it
+os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -0,0 +1,22 @@
+# backend/tests/test_column_similarity.py
+from backend.services.column_similarity import ColumnSimilarityTable
+
+
+def test_name_similarity_lifts_pairs_with_shared_values():
+    table = ColumnSimilarityTable()
+    table.add("orders", "cust_name", "customers", "customer_name", 0.6, 0.9, 0.5, 200)
+
+    assert table.add_name_score("customers", "customer_name", "orders", "cust_name", 0.9)
+    assert not table.add_name_score("orders", "created_at", "customers", "updated_at", 1.0)
+    assert len(table) == 1
+    assert table.similarity[0] > 0.75 > table.match_rate[0]
+
+
+def test_records_keep_dotted_names_apart():
+    table = ColumnSimilarityTable()
+    table.add("sales.2024", "customer.id", "crm", "id", 0.9, 1.0, 1.0, 50)
+
+    record = next(table.records())
+
+    assert (record["source_table"], record["source_column"]) == ("sales.2024", "customer.id")
+    assert table.column_names == ["sales.2024.customer.id", "crm.id"]
@@ -0,0 +1,32 @@
+# backend/tests/test_ddl_emitters.py
+import pytest
+from backend.services.ddl_emitters import render_ddl
+from backend.services.ddl_parser import parse_ddl
+from backend.services.schema_ir import ColumnIR, IndexIR, SchemaIR, TableIR
+
+
+@pytest.mark.parametrize("dialect", ["generic", "postgres", "mysql", "sqlite", "sqlserver", "oracle"])
+def test_reserved_column_names_are_quoted(dialect):
+    schema = SchemaIR(tables=(TableIR(
+        name="orders",
+        columns=(ColumnIR("id", "INT", nullable=False), ColumnIR("order", "SMALLINT", nullable=False)),
+        primary_key=("id",),
+    ),))
+
+    ddl = render_ddl(schema, dialect)
+
+    assert " order " not in ddl
+    assert any(f"{left}order{right}" in ddl for left, right in ('""', '``', '[]'))
+
+
+def test_sparse_index_predicate_is_quoted():
+    schema = SchemaIR(
+        tables=(TableIR(name="orders", columns=(ColumnIR("id", "INT"), ColumnIR("Order", "INT"))),),
+        indexes=(IndexIR(name="orders_order_idx", table="orders", columns=("Order",), where_not_null="Order"),),
+    )
+
+    ddl = render_ddl(schema, "postgres")
+
+    assert 'WHERE "Order" IS NOT NULL' in ddl
+    _, keys = parse_ddl(ddl)
+    assert keys["indexes"][0]["where_not_null"] == "Order"
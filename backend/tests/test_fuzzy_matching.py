@@ -0,0 +1,15 @@
+# backend/tests/test_fuzzy_matching.py
+import pandas as pd
+from backend.services.fuzzy_matching import FuzzyEntityMatcher
+
+
+def test_early_stop_is_not_fooled_by_sorted_input():
+    # 100 matching rows then 300 non-matching ones, as in a file sorted by the column
+    target = pd.Series([f"customer{i:03d}" for i in range(100)])
+    source = pd.Series([f"customer{i:03d}" for i in range(100)] + [f"zq{i}" for i in range(300)])
+
+    full = FuzzyEntityMatcher({'early_stop': False})._match_columns('a', 'x', source, 'b', 'y', target)
+    early = FuzzyEntityMatcher({'early_stop': True})._match_columns('a', 'x', source, 'b', 'y', target)
+
+    assert full[0] == 0.25
+    assert early[0] < 0.75  # Same verdict against match_rate_threshold as scoring everything
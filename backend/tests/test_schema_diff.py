@@ -0,0 +1,27 @@
+# backend/tests/test_schema_diff.py
+from backend.services.schema_diff import diff_schemas, render_migration
+from backend.services.schema_ir import ColumnIR, ForeignKeyIR, SchemaIR, TableIR
+
+
+def _schema(customer_key, id_type="INT"):
+    customers = TableIR("customers", (ColumnIR("id", id_type, nullable=False), ColumnIR("email", "VARCHAR", (80,))),
+                        customer_key)
+    orders = TableIR("orders", (ColumnIR("id", "INT", nullable=False), ColumnIR("customer_id", "INT")), ("id",))
+    return SchemaIR(tables=(customers, orders),
+                    foreign_keys=(ForeignKeyIR("orders", ("customer_id",), "customers", ("id",)),))
+
+
+def test_referencing_foreign_keys_are_dropped_around_a_primary_key_change():
+    sql = render_migration(diff_schemas(_schema(("id",)), _schema(("id", "email"))), "postgres").splitlines()
+
+    drop_fk = sql.index("ALTER TABLE orders DROP CONSTRAINT orders_customer_id_fkey;")
+    drop_pk = sql.index("ALTER TABLE customers DROP CONSTRAINT customers_pkey;")
+    add_pk = sql.index("ALTER TABLE customers ADD PRIMARY KEY (id, email);")
+    add_fk = sql.index("ALTER TABLE orders ADD FOREIGN KEY (customer_id) REFERENCES customers (id);")
+    assert drop_fk < drop_pk < add_pk < add_fk
+
+
+def test_type_synonyms_are_not_alterations():
+    diff = diff_schemas(_schema(("id",), "INT"), _schema(("id",), "INTEGER"))
+
+    assert not diff.altered_tables
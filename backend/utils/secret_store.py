@@ -3,23 +3,39 @@ import logging
 
 import json
 import os
+import threading
 
 SECRETS_PATH = '/app/backend/secrets.json'
 
+# Parsed secrets.json and the mtime it was read at; re-read only when the file changes
+_secrets_cache = None
+_secrets_lock = threading.Lock()
+
 def load_secrets():
-    if not os.path.exists(SECRETS_PATH):
-        return {}
+    global _secrets_cache
     try:
-        with open(SECRETS_PATH, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        logging.warning(f"[License] Failed to load secrets.json: {e}")
+        mtime = os.stat(SECRETS_PATH).st_mtime_ns
+    except OSError:
         return {}
+    with _secrets_lock:
+        if _secrets_cache is not None and _secrets_cache[0] == mtime:
+            return dict(_secrets_cache[1])
+        try:
+            with open(SECRETS_PATH, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logging.warning(f"[License] Failed to load secrets.json: {e}")
+            return {}
+        _secrets_cache = (mtime, data)
+        return dict(data)
 
 def save_secrets(data):
+    global _secrets_cache
     os.makedirs(os.path.dirname(SECRETS_PATH), exist_ok=True)
-    with open(SECRETS_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    with _secrets_lock:
+        with open(SECRETS_PATH, "w") as f:
+            json.dump(data, f, indent=2)
+        _secrets_cache = None
 
 # OPENAI key (still supported)
 def get_openai_api_key():
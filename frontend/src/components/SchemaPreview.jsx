@@ -2,6 +2,7 @@ import React, { useState } from "react";
 import { Copy, Download, Code2, Sparkles, Bot, HashIcon } from "lucide-react";
 import { API_BASE_URL } from "../config";
 import { fetchWithAuth } from "../utils/fetchWithAuth";
+import { fetchEventStream } from "../utils/fetchEventStream";
 import { v4 as uuidv4 } from "uuid";
 import useSchemaStore from "../stores/useSchemaStore";
 import toast from 'react-hot-toast';
@@ -52,14 +53,32 @@ export default function SchemaPreview({
       setAiLoading(true);
       setError("");
 
-      const data = await fetchWithAuth(`${API_BASE_URL}/fix-with-ai`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ sql, dialect: dialect || "postgres" }),
-      });
+      // Stream the cleaned SQL into the AI view as it is generated
+      let data = null;
+      let streamError = null;
+      let streamedSQL = "";
+      await fetchEventStream(
+        `${API_BASE_URL}/fix-with-ai/stream`,
+        {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ sql, dialect: dialect || "postgres" }),
+        },
+        (event, payload) => {
+          if (event === "sql") {
+            streamedSQL += payload;
+            setAiSQL(streamedSQL);
+            setView("ai");
+          } else if (event === "error") {
+            streamError = payload;
+          } else if (event === "done") {
+            data = payload;
+          }
+        }
+      );
 
-      if (data.error) {
-        toast.error(data.error);
+      if (streamError || !data) {
+        toast.error(streamError || "GenAI cleanup failed");
         return;
       }
 
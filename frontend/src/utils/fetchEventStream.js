@@ -0,0 +1,41 @@
+import { authorizedFetch } from "./fetchWithAuth";
+
+// Reads a POSTed Server-Sent Events response (EventSource only supports GET),
+// calling onEvent(event, data) for each event as it arrives
+export async function fetchEventStream(url, options = {}, onEvent) {
+  // Same token refresh and login redirect as fetchWithAuth
+  const response = await authorizedFetch(url, {
+    ...options,
+    headers: { ...(options.headers || {}), Accept: "text/event-stream" },
+  });
+
+  if (!response.ok) {
+    const error = new Error(`HTTP ${response.status}`);
+    error.status = response.status;
+    throw error;
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) >= 0) {
+      const frame = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = "message";
+      const data = [];
+      for (const line of frame.split("\n")) {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+      }
+      if (data.length) onEvent(event, JSON.parse(data.join("\n")));
+    }
+  }
+}
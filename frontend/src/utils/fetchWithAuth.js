@@ -1,4 +1,12 @@
-export async function fetchWithAuth(url, options = {}) {
+const redirectToLogin = () => {
+  localStorage.removeItem("token");
+  window.location.href = "/login";
+};
+
+// Sends a request with the stored access token and returns the raw Response.
+// A 401 triggers one token refresh and retry; if that fails too, the user is
+// sent to the login page. Shared by fetchWithAuth and streaming requests.
+export async function authorizedFetch(url, options = {}) {
   const token = localStorage.getItem("token");
   const isFormData = options.body instanceof FormData;
 
@@ -9,66 +17,58 @@ export async function fetchWithAuth(url, options = {}) {
     ...(isFormData ? {} : { "Content-Type": "application/json" })
   };
 
-  let config = {
-    ...options,
-    headers,
-    credentials: "include"
-  };
+  // First attempt
+  const response = await fetch(url, { ...options, headers, credentials: "include" });
 
-  // Unified response handler
-  const handleResponse = async (response) => {
-    if (!response.ok) {
-      const error = new Error(`HTTP ${response.status}`);
-      error.status = response.status;
-      throw error;
-    }
-    return response.headers.get("content-type")?.includes("application/json")
-      ? response.json()
-      : response.text();
-  };
+  // Successful response (non-401)
+  if (response.status !== 401) {
+    return response;
+  }
 
-  try {
-    // First attempt
-    let response = await fetch(url, config);
-    
-    // Successful response (non-401)
-    if (response.status !== 401) {
-      return isFormData ? response : handleResponse(response);
-    }
+  // Token refresh flow
+  const refreshResponse = await fetch("/api/auth/refresh-token", {
+    method: "POST",
+    credentials: "include"
+  });
+  
+  if (!refreshResponse.ok) {
+    redirectToLogin();
+    throw new Error("Session expired");
+  }
 
-    // Token refresh flow
-    const refreshResponse = await fetch("/api/auth/refresh-token", {
-      method: "POST",
-      credentials: "include"
-    });
-    
-    if (!refreshResponse.ok) {
-      localStorage.removeItem("token");
-      window.location.href = "/login";
-      throw new Error("Session expired");
-    }
+  const { access_token } = await refreshResponse.json();
+  localStorage.setItem("token", access_token);
 
-    const { access_token } = await refreshResponse.json();
-    localStorage.setItem("token", access_token);
+  // Retry with new token
+  const retryResponse = await fetch(url, {
+    ...options,
+    headers: {
+      ...headers,
+      Authorization: `Bearer ${access_token}`
+    },
+    credentials: "include"
+  });
 
-    // Retry with new token
-    config = {
-      ...options,
-      headers: {
-        ...headers,
-        Authorization: `Bearer ${access_token}`
-      },
-      credentials: "include"
-    };
+  if (retryResponse.status === 401) {
+    redirectToLogin();
+  }
+  return retryResponse;
+}
 
-    const retryResponse = await fetch(url, config);
-    return isFormData ? retryResponse : handleResponse(retryResponse);
+export async function fetchWithAuth(url, options = {}) {
+  const isFormData = options.body instanceof FormData;
+  const response = await authorizedFetch(url, options);
+  if (isFormData) {
+    return response;
+  }
 
-  } catch (error) {
-    if (error.status === 401) {
-      localStorage.removeItem("token");
-      window.location.href = "/login";
-    }
+  // Unified response handler
+  if (!response.ok) {
+    const error = new Error(`HTTP ${response.status}`);
+    error.status = response.status;
     throw error;
   }
-}
\ No newline at end of file
+  return response.headers.get("content-type")?.includes("application/json")
+    ? response.json()
+    : response.text();
+}